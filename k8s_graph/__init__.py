@@ -40,7 +40,7 @@ from k8s_graph.export import (
     export_png,
     load_json,
 )
-from k8s_graph.formatter import export_to_dot, format_graph_output
+from k8s_graph.formatter import export_to_dot, format_graph_output, format_graph_output_stream
 from k8s_graph.models import (
     BuildOptions,
     DiscovererCategory,
@@ -56,6 +56,7 @@ from k8s_graph.operations import (
     extract_namespace,
     filter_by_kind,
     filter_by_relationship,
+    get_namespace_view,
     merge_graphs,
     split_by_namespace,
     union_graphs,
@@ -106,6 +107,7 @@ from k8s_graph.validator import (
 )
 from k8s_graph.visualization import (
     create_legend,
+    draw_all_views,
     draw_circular,
     draw_cluster,
     draw_dependencies,
@@ -150,6 +152,7 @@ __all__ = [
     "find_isolated_components",
     "identify_critical_resources",
     "format_graph_output",
+    "format_graph_output_stream",
     "export_to_dot",
     "find_dependencies",
     "find_dependents",
@@ -182,6 +185,7 @@ __all__ = [
     "merge_graphs",
     "compose_namespace_graphs",
     "extract_namespace",
+    "get_namespace_view",
     "diff_graphs",
     "union_graphs",
     "filter_by_kind",
@@ -194,6 +198,7 @@ __all__ = [
     "draw_hierarchical",
     "draw_radial",
     "draw_circular",
+    "draw_all_views",
     "get_shell_layout",
     "create_legend",
     "export_png",
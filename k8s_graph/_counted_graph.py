@@ -0,0 +1,102 @@
+"""
+DiGraph that carries kind/namespace tallies kept by GraphBuilder while it builds.
+
+get_graph_statistics() reads the tallies instead of scanning every node. They
+stay valid only until the graph changes: the node map and every node's
+attribute dict are dicts that drop the tallies on any write, so adding or
+removing nodes and editing node attributes in place all fall back to a scan.
+"""
+
+from collections import Counter
+from typing import Any
+
+import networkx as nx
+
+
+class GraphCounters:
+    """Kind and namespace tallies of a graph's nodes."""
+
+    def __init__(self) -> None:
+        self.kinds: Counter[str] = Counter()
+        self.namespaces: Counter[str] = Counter()
+
+    def add_node(self, attrs: dict[str, Any]) -> None:
+        """Count one node from its attribute dict."""
+        self.kinds[attrs.get("kind", "Unknown")] += 1
+        self.namespaces[attrs.get("namespace", "cluster")] += 1
+
+    @classmethod
+    def from_graph(cls, graph: nx.DiGraph) -> "GraphCounters":
+        """Tally every node of ``graph``."""
+        counters = cls()
+        for _, attrs in graph.nodes(data=True):
+            counters.add_node(attrs)
+        return counters
+
+
+class _TrackedDict(dict[Any, Any]):
+    """dict that clears its graph's build_counters whenever it is written to."""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: "CountedDiGraph") -> None:
+        super().__init__()
+        self._graph = graph
+
+    def _changed(self) -> None:
+        # Unset while pickle/deepcopy refill the dict before restoring its slots
+        graph = getattr(self, "_graph", None)
+        if graph is not None:
+            graph.build_counters = None
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._changed()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        self._changed()
+        super().__delitem__(key)
+
+    def __ior__(self, other: Any) -> "_TrackedDict":  # type: ignore[misc]
+        self._changed()
+        return super().__ior__(other)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._changed()
+        super().update(*args, **kwargs)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        self._changed()
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        self._changed()
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[Any, Any]:
+        self._changed()
+        return super().popitem()
+
+    def clear(self) -> None:
+        self._changed()
+        super().clear()
+
+
+class CountedDiGraph(nx.DiGraph):
+    """
+    DiGraph whose ``build_counters`` describe its nodes until it is next changed.
+
+    GraphBuilder returns these. ``build_counters`` is None for graphs that were
+    changed after the build, and for copies and subgraph views, which start
+    out without counters.
+    """
+
+    def __init__(self, incoming_graph_data: Any = None, **attr: Any) -> None:
+        self.build_counters: GraphCounters | None = None
+        super().__init__(incoming_graph_data, **attr)
+
+    def node_dict_factory(self) -> _TrackedDict:
+        return _TrackedDict(self)
+
+    def node_attr_dict_factory(self) -> _TrackedDict:
+        return _TrackedDict(self)
@@ -0,0 +1,18 @@
+"""
+Quoting for DOT, the Graphviz graph language.
+
+Shared by export_to_dot() and the Graphviz renderers in visualization.
+"""
+
+from typing import Any
+
+
+def dot_escape(value: Any) -> str:
+    """Escape a value for use inside a double-quoted DOT string."""
+    # Backslashes first, so the ones added before quotes aren't doubled
+    return str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def dot_quote(value: Any) -> str:
+    """Quote a DOT ID or attribute value."""
+    return f'"{dot_escape(value)}"'
@@ -0,0 +1,322 @@
+"""
+Numba-compiled Fruchterman-Reingold layout used by draw_cluster(layout="spring").
+
+Two kernels share the attraction and cooling steps: fr_layout computes exact
+all-pairs repulsion, and bh_layout approximates it with a Barnes-Hut quadtree
+for large graphs.
+
+numba is optional. When it is not installed ``_has_numba`` is False and callers
+keep using nx.spring_layout.
+"""
+
+from math import ceil, log, sqrt
+from typing import Any
+
+import networkx as nx
+import numpy as np
+
+try:
+    from numba import njit, prange
+
+    _has_numba = True
+except ImportError:
+    _has_numba = False
+    prange = range  # type: ignore[misc, unused-ignore]
+
+# Same minimum distance/displacement nx.spring_layout clips to
+_MIN_DISTANCE = 0.01
+
+# spring_layout() switches to the Barnes-Hut kernel above this many nodes
+_BARNES_HUT_MIN_NODES = 1000
+
+# Deepest quadtree level; bounds memory at ~4**_MAX_TREE_DEPTH * 4/3 cells
+_MAX_TREE_DEPTH = 10
+
+
+def _attraction(
+    i: int, adj_indptr: np.ndarray, adj_indices: np.ndarray, pos: np.ndarray, k: float
+) -> tuple[float, float]:
+    """Spring force pulling node ``i`` towards its neighbors."""
+    fx = 0.0
+    fy = 0.0
+    for p in range(adj_indptr[i], adj_indptr[i + 1]):
+        j = adj_indices[p]
+        dx = pos[i, 0] - pos[j, 0]
+        dy = pos[i, 1] - pos[j, 1]
+        d = max(sqrt(dx * dx + dy * dy), _MIN_DISTANCE)
+        fx -= dx * d / k
+        fy -= dy * d / k
+    return fx, fy
+
+
+def _move(pos: np.ndarray, disp: np.ndarray, temp: float) -> None:
+    """Move every node along its displacement by at most ``temp``."""
+    for i in prange(pos.shape[0]):
+        length = max(sqrt(disp[i, 0] ** 2 + disp[i, 1] ** 2), _MIN_DISTANCE)
+        pos[i, 0] += disp[i, 0] * temp / length
+        pos[i, 1] += disp[i, 1] * temp / length
+
+
+def fr_layout(
+    adj_indptr: np.ndarray,
+    adj_indices: np.ndarray,
+    pos: np.ndarray,
+    iterations: int,
+    k: float,
+    temp0: float,
+) -> None:
+    """
+    Run Fruchterman-Reingold iterations, updating ``pos`` in place.
+
+    Each iteration computes every node's repulsion from all other nodes plus its
+    attraction along the CSR adjacency, then moves nodes by at most the current
+    temperature, which cools linearly from ``temp0``.
+
+    Args:
+        adj_indptr: CSR row pointers of the symmetric adjacency
+        adj_indices: CSR column indices of the symmetric adjacency
+        pos: (n, 2) float64 array of starting positions, overwritten with the result
+        iterations: Number of cooling steps
+        k: Optimal distance between nodes
+        temp0: Initial temperature (maximum step length)
+    """
+    n = pos.shape[0]
+    disp = np.zeros_like(pos)
+    k2 = k * k
+    temp = temp0
+    dt = temp0 / (iterations + 1)
+    min_d2 = _MIN_DISTANCE * _MIN_DISTANCE
+
+    for _ in range(iterations):
+        for i in prange(n):
+            fx, fy = _attraction(i, adj_indptr, adj_indices, pos, k)
+            for j in range(n):
+                if j == i:
+                    continue
+                dx = pos[i, 0] - pos[j, 0]
+                dy = pos[i, 1] - pos[j, 1]
+                d2 = max(dx * dx + dy * dy, min_d2)
+                fx += dx * k2 / d2
+                fy += dy * k2 / d2
+            disp[i, 0] = fx
+            disp[i, 1] = fy
+
+        _move(pos, disp, temp)
+        temp -= dt
+
+
+def bh_layout(
+    adj_indptr: np.ndarray,
+    adj_indices: np.ndarray,
+    pos: np.ndarray,
+    iterations: int,
+    k: float,
+    temp0: float,
+    theta: float,
+    depth: int,
+) -> None:
+    """
+    Fruchterman-Reingold iterations with Barnes-Hut approximated repulsion.
+
+    Each iteration bins the nodes into a complete quadtree of ``depth`` levels
+    over their bounding box and records every cell's node count and center of
+    mass. A node then opens only cells that are close relative to their size
+    (``cell_width / distance >= theta``) and treats every other cell as a
+    single mass at its center, so repulsion costs O(n log n) instead of O(n²).
+    Nodes sharing a leaf cell repel each other exactly.
+
+    Args:
+        adj_indptr: CSR row pointers of the symmetric adjacency
+        adj_indices: CSR column indices of the symmetric adjacency
+        pos: (n, 2) float64 array of starting positions, overwritten with the result
+        iterations: Number of cooling steps
+        k: Optimal distance between nodes
+        temp0: Initial temperature (maximum step length)
+        theta: Opening criterion; larger is faster and coarser
+        depth: Number of quadtree levels below the root
+    """
+    n = pos.shape[0]
+    disp = np.zeros_like(pos)
+    k2 = k * k
+    temp = temp0
+    dt = temp0 / (iterations + 1)
+    min_d2 = _MIN_DISTANCE * _MIN_DISTANCE
+    theta2 = theta * theta
+
+    # Level l holds 4**l cells laid out row-major at offset[l]
+    offset = np.zeros(depth + 2, dtype=np.int64)
+    for level in range(depth + 1):
+        offset[level + 1] = offset[level] + 4**level
+    side = 1 << depth
+    n_leaves = side * side
+
+    mass = np.zeros(offset[depth + 1])
+    com = np.zeros((offset[depth + 1], 2))
+    leaf_x = np.zeros(n, dtype=np.int64)
+    leaf_y = np.zeros(n, dtype=np.int64)
+    leaf_start = np.zeros(n_leaves + 1, dtype=np.int64)
+    leaf_order = np.zeros(n, dtype=np.int64)
+
+    for _ in range(iterations):
+        x0 = pos[:, 0].min()
+        y0 = pos[:, 1].min()
+        size = max(pos[:, 0].max() - x0, pos[:, 1].max() - y0, _MIN_DISTANCE) * (1 + 1e-9)
+
+        # Leaf cells, their member lists (counting sort) and leaf mass/centers
+        mass[:] = 0.0
+        com[:] = 0.0
+        leaf_start[:] = 0
+        for i in range(n):
+            leaf_x[i] = min(int((pos[i, 0] - x0) / size * side), side - 1)
+            leaf_y[i] = min(int((pos[i, 1] - y0) / size * side), side - 1)
+            leaf = leaf_y[i] * side + leaf_x[i]
+            leaf_start[leaf + 1] += 1
+            mass[offset[depth] + leaf] += 1.0
+            com[offset[depth] + leaf, 0] += pos[i, 0]
+            com[offset[depth] + leaf, 1] += pos[i, 1]
+        for leaf in range(n_leaves):
+            leaf_start[leaf + 1] += leaf_start[leaf]
+        fill = leaf_start[:-1].copy()
+        for i in range(n):
+            leaf = leaf_y[i] * side + leaf_x[i]
+            leaf_order[fill[leaf]] = i
+            fill[leaf] += 1
+
+        # Aggregate children into parents, bottom-up, then turn sums into centers
+        for level in range(depth - 1, -1, -1):
+            level_side = 1 << level
+            for cy in range(level_side):
+                for cx in range(level_side):
+                    parent = offset[level] + cy * level_side + cx
+                    for child_y in range(2 * cy, 2 * cy + 2):
+                        for child_x in range(2 * cx, 2 * cx + 2):
+                            child = offset[level + 1] + child_y * 2 * level_side + child_x
+                            mass[parent] += mass[child]
+                            com[parent, 0] += com[child, 0]
+                            com[parent, 1] += com[child, 1]
+        for cell in range(offset[depth + 1]):
+            if mass[cell] > 0:
+                com[cell, 0] /= mass[cell]
+                com[cell, 1] /= mass[cell]
+
+        for i in prange(n):
+            fx, fy = _attraction(i, adj_indptr, adj_indices, pos, k)
+            stack = np.empty((3 * depth + 1, 3), dtype=np.int64)
+            stack[0, 0] = 0
+            stack[0, 1] = 0
+            stack[0, 2] = 0
+            top = 1
+            while top > 0:
+                top -= 1
+                level = stack[top, 0]
+                cx = stack[top, 1]
+                cy = stack[top, 2]
+                cell = offset[level] + cy * (1 << level) + cx
+                if mass[cell] == 0.0:
+                    continue
+
+                if level == depth:
+                    for p in range(leaf_start[cy * side + cx], leaf_start[cy * side + cx + 1]):
+                        j = leaf_order[p]
+                        if j == i:
+                            continue
+                        dx = pos[i, 0] - pos[j, 0]
+                        dy = pos[i, 1] - pos[j, 1]
+                        d2 = max(dx * dx + dy * dy, min_d2)
+                        fx += dx * k2 / d2
+                        fy += dy * k2 / d2
+                    continue
+
+                shift = depth - level
+                contains_i = (leaf_x[i] >> shift) == cx and (leaf_y[i] >> shift) == cy
+                dx = pos[i, 0] - com[cell, 0]
+                dy = pos[i, 1] - com[cell, 1]
+                d2 = max(dx * dx + dy * dy, min_d2)
+                width = size / (1 << level)
+                if not contains_i and width * width < theta2 * d2:
+                    fx += mass[cell] * dx * k2 / d2
+                    fy += mass[cell] * dy * k2 / d2
+                    continue
+
+                for child in range(4):
+                    stack[top, 0] = level + 1
+                    stack[top, 1] = 2 * cx + (child & 1)
+                    stack[top, 2] = 2 * cy + (child >> 1)
+                    top += 1
+            disp[i, 0] = fx
+            disp[i, 1] = fy
+
+        _move(pos, disp, temp)
+        temp -= dt
+
+
+if _has_numba:
+    # Helpers first: the kernels resolve them as globals when they compile
+    _attraction = njit(fastmath=True, cache=True)(_attraction)
+    _move = njit(parallel=True, fastmath=True, cache=True)(_move)
+    fr_layout = njit(parallel=True, fastmath=True, cache=True)(fr_layout)
+    bh_layout = njit(parallel=True, fastmath=True, cache=True)(bh_layout)
+
+
+def _to_csr(graph: nx.Graph, index: dict[Any, int]) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric, self-loop free CSR adjacency of ``graph`` over ``index`` order."""
+    pairs = np.array(
+        [(index[u], index[v]) for u, v in graph.edges() if u != v], dtype=np.int64
+    ).reshape(-1, 2)
+    pairs = np.unique(np.concatenate([pairs, pairs[:, ::-1]]), axis=0)
+    indptr = np.zeros(len(index) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(pairs[:, 0], minlength=len(index)), out=indptr[1:])
+    return indptr, np.ascontiguousarray(pairs[:, 1])
+
+
+def spring_layout(
+    graph: nx.Graph,
+    k: float | None = None,
+    iterations: int = 50,
+    seed: int | None = None,
+    scale: float = 1.0,
+    center: tuple[float, float] | None = None,
+    theta: float = 0.8,
+) -> dict[Any, np.ndarray]:
+    """
+    Drop-in for nx.spring_layout backed by the compiled kernels.
+
+    Graphs with more than 1000 nodes use the Barnes-Hut kernel; smaller ones
+    compute exact repulsion. Edge direction and weights are ignored, as in the
+    networkx default.
+
+    Args:
+        graph: Graph to lay out
+        k: Optimal distance between nodes (default ``1/sqrt(n)``)
+        iterations: Number of cooling steps
+        seed: Seed for the random starting positions
+        scale: Scale factor for the final positions
+        center: Center of the final layout
+        theta: Barnes-Hut opening criterion (large graphs only)
+
+    Returns:
+        Dictionary mapping nodes to 2D positions
+
+    Example:
+        >>> pos = spring_layout(graph, k=0.5, seed=42)
+    """
+    nodes = list(graph)
+    if not nodes:
+        return {}
+    index = {node: i for i, node in enumerate(nodes)}
+    indptr, indices = _to_csr(graph, index)
+
+    pos = np.random.default_rng(seed).random((len(nodes), 2))
+    temp0 = float(np.ptp(pos, axis=0).max()) * 0.1
+    k = k or sqrt(1.0 / len(nodes))
+    if len(nodes) > _BARNES_HUT_MIN_NODES:
+        # ~4 nodes per leaf cell on average
+        depth = min(_MAX_TREE_DEPTH, max(1, ceil(log(len(nodes) / 4, 4))))
+        bh_layout(indptr, indices, pos, iterations, k, temp0, theta, depth)
+    else:
+        fr_layout(indptr, indices, pos, iterations, k, temp0)
+
+    pos = nx.rescale_layout(pos, scale=scale)
+    if center is not None:
+        pos += np.asarray(center)
+    return dict(zip(nodes, pos, strict=True))
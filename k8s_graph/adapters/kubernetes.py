@@ -1,4 +1,6 @@
+import json
 import logging
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 from kubernetes import client, config
@@ -7,6 +9,13 @@ from kubernetes.client.rest import ApiException
 from k8s_graph.crd_registry import CRDRegistry
 from k8s_graph.models import ResourceIdentifier
 
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes | str], Any] = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -287,7 +296,11 @@ class KubernetesAdapter:
                     return None
 
                 method = getattr(api, method_name)
-                result = method(name=resource_id.name, namespace=resource_id.namespace)
+                result = method(
+                    name=resource_id.name,
+                    namespace=resource_id.namespace,
+                    _preload_content=False,
+                )
             else:
                 method_name = api_info.get("read")
                 if not method_name:
@@ -295,9 +308,9 @@ class KubernetesAdapter:
                     return None
 
                 method = getattr(api, method_name)
-                result = method(name=resource_id.name)
+                result = method(name=resource_id.name, _preload_content=False)
 
-            resource = self._to_dict(result)
+            resource = self._decode_response(result)
             resource["kind"] = resource_id.kind
             if not resource.get("apiVersion") and api_info.get("api_version"):
                 resource["apiVersion"] = api_info["api_version"]
@@ -319,6 +332,8 @@ class KubernetesAdapter:
         kind: str,
         namespace: str | None = None,
         label_selector: str | None = None,
+        limit: int | None = None,
+        continue_token: str | None = None,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """
         List resources of a specific kind.
@@ -327,6 +342,9 @@ class KubernetesAdapter:
             kind: Resource kind
             namespace: Optional namespace filter
             label_selector: Optional label selector
+            limit: Optional page size. When set, the returned metadata carries a
+                   'continue' token if more results are available
+            continue_token: Token from a previous page's metadata to resume from
 
         Returns:
             Tuple of (resources list, metadata dict)
@@ -336,7 +354,9 @@ class KubernetesAdapter:
 
         crd_info = self.crd_registry.get_crd_info(kind)
         if crd_info:
-            return await self._list_custom_resources(kind, crd_info, namespace, label_selector)
+            return await self._list_custom_resources(
+                kind, crd_info, namespace, label_selector, limit, continue_token
+            )
 
         api_info = self._api_mapping.get(kind)
         if not api_info:
@@ -353,7 +373,13 @@ class KubernetesAdapter:
                     return [], {}
 
                 method = getattr(api, method_name)
-                result = method(namespace=namespace, label_selector=label_selector)
+                result = method(
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    limit=limit,
+                    _continue=continue_token,
+                    _preload_content=False,
+                )
             else:
                 method_name = api_info.get("list_all") or api_info.get("list")
                 if not method_name:
@@ -361,18 +387,25 @@ class KubernetesAdapter:
                     return [], {}
 
                 method = getattr(api, method_name)
-                result = method(label_selector=label_selector)
+                result = method(
+                    label_selector=label_selector,
+                    limit=limit,
+                    _continue=continue_token,
+                    _preload_content=False,
+                )
 
-            resources = [self._to_dict(item) for item in result.items]
+            body = self._decode_response(result)
+            resources: list[dict[str, Any]] = body.get("items") or []
 
             for resource in resources:
                 resource["kind"] = kind
                 if not resource.get("apiVersion") and api_info.get("api_version"):
                     resource["apiVersion"] = api_info["api_version"]
 
+            list_metadata = body.get("metadata") or {}
             metadata = {
-                "resource_version": result.metadata.resource_version,
-                "continue": getattr(result.metadata, "_continue", None),
+                "resource_version": list_metadata.get("resourceVersion"),
+                "continue": list_metadata.get("continue"),
             }
 
             logger.debug(
@@ -389,38 +422,60 @@ class KubernetesAdapter:
                 logger.error(f"API error listing {kind}: {e}")
                 raise
 
-    def _snake_to_camel(self, snake_str: str) -> str:
-        """Convert snake_case to camelCase."""
-        components = snake_str.split("_")
-        return components[0] + "".join(x.title() for x in components[1:])
-
-    def _convert_keys_to_camel(self, obj: Any) -> Any:
-        """Recursively convert all dict keys from snake_case to camelCase, excluding None values."""
-        if isinstance(obj, dict):
-            return {
-                self._snake_to_camel(k): self._convert_keys_to_camel(v)
-                for k, v in obj.items()
-                if v is not None
-            }
-        elif isinstance(obj, list):
-            return [self._convert_keys_to_camel(item) for item in obj]
-        else:
-            return obj
+    async def iter_resources(
+        self,
+        kind: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        page_size: int = 500,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Iterate resources of a specific kind one page at a time.
+
+        Follows the API server's continue tokens so that only a single page of
+        decoded objects is held in memory, instead of the whole list.
+
+        Args:
+            kind: Resource kind
+            namespace: Optional namespace filter
+            label_selector: Optional label selector
+            page_size: Number of items requested per LIST call
 
-    def _to_dict(self, obj: Any) -> dict[str, Any]:
+        Yields:
+            Resource dictionaries
         """
-        Convert Kubernetes API object to dictionary with camelCase keys.
+        continue_token = None
+        while True:
+            resources, metadata = await self.list_resources(
+                kind,
+                namespace,
+                label_selector,
+                limit=page_size,
+                continue_token=continue_token,
+            )
+            for resource in resources:
+                yield resource
+
+            continue_token = metadata.get("continue")
+            if not continue_token:
+                return
+
+    def _decode_response(self, response: Any) -> dict[str, Any]:
+        """
+        Decode a raw (``_preload_content=False``) API response body.
+
+        Reading the JSON directly skips the kubernetes client's model
+        deserialization and the to_dict()/camelCase round trip, and keeps label,
+        annotation and data keys exactly as the API server returned them. Uses
+        orjson when it is installed, falling back to the standard library.
 
         Args:
-            obj: Kubernetes API object
+            response: urllib3 response returned by a kubernetes API call
 
         Returns:
-            Dictionary representation with camelCase keys
+            Decoded JSON object
         """
-        if hasattr(obj, "to_dict"):
-            snake_dict = obj.to_dict()
-            return self._convert_keys_to_camel(snake_dict)  # type: ignore[no-any-return]
-        return obj  # type: ignore[no-any-return]
+        return _json_loads(response.data)  # type: ignore[no-any-return]
 
     def get_api_call_stats(self) -> dict[str, int]:
         """
@@ -468,6 +523,8 @@ class KubernetesAdapter:
         crd_info: dict[str, str],
         namespace: str | None = None,
         label_selector: str | None = None,
+        limit: int | None = None,
+        continue_token: str | None = None,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """List CRD resources using CustomObjectsApi."""
         try:
@@ -478,6 +535,8 @@ class KubernetesAdapter:
                     namespace=namespace,
                     plural=crd_info["plural"],
                     label_selector=label_selector,
+                    limit=limit,
+                    _continue=continue_token,
                 )
             else:
                 result = self.custom_objects.list_cluster_custom_object(
@@ -485,6 +544,8 @@ class KubernetesAdapter:
                     version=crd_info["version"],
                     plural=crd_info["plural"],
                     label_selector=label_selector,
+                    limit=limit,
+                    _continue=continue_token,
                 )
 
             items = result.get("items", [])
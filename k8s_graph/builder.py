@@ -1,16 +1,34 @@
+import functools
 import logging
+import operator
+from collections import defaultdict
+from contextlib import aclosing
 from typing import Any
 
 import networkx as nx
 
+from k8s_graph._counted_graph import CountedDiGraph, GraphCounters
+from k8s_graph.discoverers.base import iter_client_resources
 from k8s_graph.discoverers.registry import DiscovererRegistry
 from k8s_graph.discoverers.unified import UnifiedDiscoverer
-from k8s_graph.models import BuildOptions, DiscoveryOptions, RelationshipType, ResourceIdentifier
-from k8s_graph.node_identity import NodeIdentity
+from k8s_graph.models import (
+    BuildOptions,
+    DiscoveryOptions,
+    RelationshipType,
+    ResourceIdentifier,
+    ResourceRelationship,
+)
+from k8s_graph.node_identity import NodeIdentity, make_node_id
 from k8s_graph.protocols import K8sClientProtocol
 
 logger = logging.getLogger(__name__)
 
+# Listed resources whose relationships build_namespace_graph() discovers concurrently
+_NAMESPACE_DISCOVERY_BATCH = 32
+
+# Children of one node whose relationships _expand_from_node() discovers concurrently
+_CHILD_DISCOVERY_WINDOW = 8
+
 
 class GraphBuilder:
     """
@@ -24,7 +42,7 @@ class GraphBuilder:
     - Tracking permissions and statistics
 
     Key features:
-    - Stateless design (no internal caching)
+    - LIST results cached within a build and dropped when the next one starts
     - Bidirectional expansion from starting resources
     - Configurable depth and options
     - Graceful permission handling
@@ -61,6 +79,10 @@ class GraphBuilder:
         self._permission_errors: list[str] = []
         self._pod_templates: dict[str, dict[str, Any]] = {}
         self._resource_cache: dict[tuple[str, str | None], list[dict[str, Any]]] = {}
+        # namespace -> (label key, value) -> pod names, built from the cached pod list
+        self._pod_label_index: dict[str | None, dict[tuple[str, str], set[str]]] = {}
+        # Kind/namespace tallies of the graph being built, handed to it when the build ends
+        self._counters = GraphCounters()
 
     async def build_from_resource(
         self,
@@ -89,12 +111,10 @@ class GraphBuilder:
             ...     options=BuildOptions(include_rbac=True, max_nodes=100)
             ... )
         """
-        graph = nx.DiGraph()
+        graph = CountedDiGraph()
         visited: set[str] = set()
 
-        self._permission_errors = []
-        self._pod_templates = {}
-        self.unified_discoverer.reset_stats()
+        self.reset_state()
 
         resource = await self.client.get_resource(resource_id)
         if not resource:
@@ -102,6 +122,7 @@ class GraphBuilder:
             return graph
 
         await self._expand_from_node(graph, resource, depth, visited, options)
+        self._attach_counters(graph)
 
         logger.info(
             f"Built graph with {graph.number_of_nodes()} nodes "
@@ -137,12 +158,10 @@ class GraphBuilder:
             ...     options=BuildOptions(max_nodes=1000)
             ... )
         """
-        graph = nx.DiGraph()
+        graph = CountedDiGraph()
         visited: set[str] = set()
 
-        self._permission_errors = []
-        self._pod_templates = {}
-        self.unified_discoverer.reset_stats()
+        self.reset_state()
 
         resource_kinds = [
             "Pod",
@@ -184,13 +203,22 @@ class GraphBuilder:
                 logger.warning(f"Reached max_nodes limit of {options.max_nodes}")
                 break
 
-            resources, _ = await self.client.list_resources(kind=kind, namespace=namespace)
+            # Expand resources in small batches as they arrive rather than after the whole list
+            async with aclosing(iter_client_resources(self.client, kind, namespace)) as resources:
+                batch: list[dict[str, Any]] = []
+                async for resource in resources:
+                    batch.append(resource)
+                    if len(batch) < _NAMESPACE_DISCOVERY_BATCH:
+                        continue
 
-            for resource in resources:
-                if graph.number_of_nodes() >= options.max_nodes:
-                    break
+                    await self._expand_batch(graph, batch, depth, visited, options)
+                    batch = []
+                    if graph.number_of_nodes() >= options.max_nodes:
+                        break
+
+                await self._expand_batch(graph, batch, depth, visited, options)
 
-                await self._expand_from_node(graph, resource, depth, visited, options)
+        self._attach_counters(graph)
 
         logger.info(
             f"Built namespace graph for '{namespace}' with {graph.number_of_nodes()} nodes "
@@ -199,6 +227,48 @@ class GraphBuilder:
 
         return graph
 
+    async def _expand_batch(
+        self,
+        graph: nx.DiGraph,
+        resources: list[dict[str, Any]],
+        depth: int,
+        visited: set[str],
+        options: BuildOptions,
+    ) -> None:
+        """
+        Discover relationships for a batch of listed resources concurrently, then expand them.
+
+        Discovery goes through UnifiedDiscoverer.discover_many(), which bounds the
+        number of in-flight resources. Expansion stays sequential since it mutates
+        the graph and the visited set.
+
+        Args:
+            graph: Graph to expand
+            resources: Listed resources to expand
+            depth: Expansion depth per resource
+            visited: Set of visited node IDs
+            options: Build options
+        """
+        if not resources or graph.number_of_nodes() >= options.max_nodes:
+            return
+
+        relationships: list[list[ResourceRelationship] | None] = [None] * len(resources)
+        if depth > 0:
+            discovery_options = DiscoveryOptions(
+                include_rbac=options.include_rbac,
+                include_network=options.include_network,
+                include_crds=options.include_crds,
+            )
+            relationships = list(
+                await self.unified_discoverer.discover_many(resources, discovery_options)
+            )
+
+        for resource, resource_rels in zip(resources, relationships, strict=True):
+            if graph.number_of_nodes() >= options.max_nodes:
+                break
+
+            await self._expand_from_node(graph, resource, depth, visited, options, resource_rels)
+
     async def _expand_from_node(
         self,
         graph: nx.DiGraph,
@@ -206,6 +276,7 @@ class GraphBuilder:
         depth: int,
         visited: set[str],
         options: BuildOptions,
+        relationships: list[ResourceRelationship] | None = None,
     ) -> None:
         """
         Recursively expand graph from a resource node.
@@ -216,12 +287,13 @@ class GraphBuilder:
             depth: Remaining expansion depth
             visited: Set of visited node IDs
             options: Build options
+            relationships: Relationships already discovered for this resource, if any
         """
         # Generate node ID
         if not options.sample_pods and resource.get("kind") == "Pod":
             metadata = resource.get("metadata", {})
             namespace = metadata.get("namespace") or "cluster"
-            node_id = f"Pod:{namespace}:{metadata.get('name')}"
+            node_id = make_node_id("Pod", namespace, metadata.get("name"))
         else:
             node_id = self.node_identity.get_node_id(resource)
 
@@ -235,6 +307,7 @@ class GraphBuilder:
         if not graph.has_node(node_id):
             attrs = self.node_identity.extract_node_attributes(resource)
             graph.add_node(node_id, **attrs)
+            self._counters.add_node(attrs)
 
             logger.debug(
                 f"Added node: {attrs.get('kind')}/{attrs.get('name')} "
@@ -251,9 +324,10 @@ class GraphBuilder:
                 include_crds=options.include_crds,
             )
 
-            relationships = await self.unified_discoverer.discover_all_relationships(
-                resource, discovery_options
-            )
+            if relationships is None:
+                relationships = await self.unified_discoverer.discover_all_relationships(
+                    resource, discovery_options
+                )
 
             # Collect resources to fetch and create edges
             # Note: We only add edges here, not nodes - nodes will be added when we fetch the actual resources
@@ -272,25 +346,20 @@ class GraphBuilder:
                     # This is a label selector - resolve to actual pods
                     label_selector_str = rel.target.name[2:-1]  # Extract "app=redis"
                     try:
-                        pods, _ = await self.client.list_resources(
-                            kind="Pod",
-                            namespace=rel.target.namespace,
-                            label_selector=label_selector_str,
+                        pod_names = await self._pods_matching(
+                            rel.target.namespace, label_selector_str
                         )
 
                         # Create edges to each matching pod
-                        for pod in pods:
-                            pod_metadata = pod.get("metadata", {})
-                            pod_name = pod_metadata.get("name")
-                            if pod_name:
-                                pod_id = ResourceIdentifier(
-                                    kind="Pod", name=pod_name, namespace=rel.target.namespace
-                                )
-                                pending_edges.append(
-                                    (rel.source, pod_id, rel.relationship_type, rel.details)
-                                )
-                                if graph.number_of_nodes() < options.max_nodes:
-                                    resources_to_fetch.append(pod_id)
+                        for pod_name in pod_names:
+                            pod_id = ResourceIdentifier(
+                                kind="Pod", name=pod_name, namespace=rel.target.namespace
+                            )
+                            pending_edges.append(
+                                (rel.source, pod_id, rel.relationship_type, rel.details)
+                            )
+                            if graph.number_of_nodes() < options.max_nodes:
+                                resources_to_fetch.append(pod_id)
                     except Exception as e:
                         logger.debug(f"Failed to resolve label selector {label_selector_str}: {e}")
                 else:
@@ -310,20 +379,27 @@ class GraphBuilder:
 
             # Add fetched resources as nodes (with proper stable IDs)
             resource_id_map: dict[tuple[str, str | None, str], str] = {}
+            # Collect new nodes and edges for this expansion and add them in bulk
+            new_nodes: dict[str, dict[str, Any]] = {}
+            new_edges: dict[tuple[str, str], dict[str, Any]] = {}
             for res_id, resource_data in fetched_resources.items():
                 if resource_data:
                     if not options.sample_pods and resource_data.get("kind") == "Pod":
                         metadata = resource_data.get("metadata", {})
                         namespace = metadata.get("namespace") or "cluster"
-                        stable_node_id = f"Pod:{namespace}:{metadata.get('name')}"
+                        stable_node_id = make_node_id("Pod", namespace, metadata.get("name"))
                     else:
                         stable_node_id = self.node_identity.get_node_id(resource_data)
 
                     resource_id_map[res_id] = stable_node_id
 
-                    if not graph.has_node(stable_node_id):
+                    if not graph.has_node(stable_node_id) and stable_node_id not in new_nodes:
                         attrs = self.node_identity.extract_node_attributes(resource_data)
-                        graph.add_node(stable_node_id, **attrs)
+                        new_nodes[stable_node_id] = attrs
+
+            graph.add_nodes_from(new_nodes.items())
+            for attrs in new_nodes.values():
+                self._counters.add_node(attrs)
 
             # Add edges using stable node IDs - only for nodes that exist in the graph
             for source_id, target_id, rel_type, details in pending_edges:
@@ -365,30 +441,91 @@ class GraphBuilder:
                 # Only add edge if both nodes exist (have been fetched and added)
                 if source_node_id and target_node_id:
                     if graph.has_node(source_node_id) and graph.has_node(target_node_id):
-                        if not graph.has_edge(source_node_id, target_node_id):
-                            graph.add_edge(
-                                source_node_id,
-                                target_node_id,
-                                relationship_type=rel_type.value,
-                                details=details,
-                            )
+                        edge_key = (source_node_id, target_node_id)
+                        if edge_key not in new_edges and not graph.has_edge(*edge_key):
+                            new_edges[edge_key] = {
+                                "relationship_type": rel_type.value,
+                                "details": details,
+                            }
                             logger.debug(
                                 f"Added edge: {source_node_id} --[{rel_type.value}]--> {target_node_id}"
                             )
 
+            graph.add_edges_from(
+                (source, target, attrs) for (source, target), attrs in new_edges.items()
+            )
+
             # Expand from fetched resources
-            for res_key, resource_data in fetched_resources.items():
-                if resource_data:
-                    stable_node_id = resource_id_map.get(res_key)  # type: ignore[assignment]
+            children: list[tuple[str, dict[str, Any]]] = [
+                (resource_id_map[res_key], resource_data)
+                for res_key, resource_data in fetched_resources.items()
+                if resource_data and resource_id_map.get(res_key) not in visited
+            ]
+
+            # Discover the children's relationships concurrently, a small window at
+            # a time just before expanding them, so a spent node budget or pods
+            # sampled away stop further discovery calls. Expansion stays sequential
+            # since it mutates the graph.
+            for start in range(0, len(children), _CHILD_DISCOVERY_WINDOW):
+                if graph.number_of_nodes() >= options.max_nodes:
+                    break
+                window = children[start : start + _CHILD_DISCOVERY_WINDOW]
+
+                child_relationships: list[list[ResourceRelationship] | None] = [None] * len(window)
+                wanted = self._children_to_discover(window, visited, options) if depth > 1 else []
+                if wanted:
+                    discovered = await self.unified_discoverer.discover_many(
+                        [window[i][1] for i in wanted], discovery_options
+                    )
+                    for i, rels in zip(wanted, discovered, strict=True):
+                        child_relationships[i] = rels
+
+                for (stable_node_id, resource_data), child_rels in zip(
+                    window, child_relationships, strict=True
+                ):
                     if (
-                        stable_node_id
-                        and stable_node_id not in visited
+                        stable_node_id not in visited
                         and graph.number_of_nodes() < options.max_nodes
                     ):
                         await self._expand_from_node(
-                            graph, resource_data, depth - 1, visited, options
+                            graph, resource_data, depth - 1, visited, options, child_rels
                         )
 
+    def _children_to_discover(
+        self,
+        children: list[tuple[str, dict[str, Any]]],
+        visited: set[str],
+        options: BuildOptions,
+    ) -> list[int]:
+        """
+        Positions of the children that expansion will actually discover relationships for.
+
+        Skips children already visited and, with pod sampling on, pods whose
+        template is already represented in the graph or earlier in ``children``.
+        Expansion of the skipped ones either returns early or discovers on demand.
+
+        Args:
+            children: (node ID, resource) pairs about to be expanded
+            visited: Set of visited node IDs
+            options: Build options
+
+        Returns:
+            Indexes into ``children``
+        """
+        wanted = []
+        templates: set[str] = set()
+        for i, (node_id, resource) in enumerate(children):
+            if node_id in visited:
+                continue
+            if options.sample_pods and resource.get("kind") == "Pod":
+                template_id = self.node_identity.get_pod_template_id(resource)
+                if template_id and (template_id in self._pod_templates or template_id in templates):
+                    continue
+                if template_id:
+                    templates.add(template_id)
+            wanted.append(i)
+        return wanted
+
     def _should_sample_pod(self, resource: dict[str, Any], node_id: str) -> bool:
         """
         Check if pod should be sampled (skipped due to template deduplication).
@@ -438,7 +575,7 @@ class GraphBuilder:
             Node ID string
         """
         namespace = resource_id.namespace or "cluster"
-        return f"{resource_id.kind}:{namespace}:{resource_id.name}"
+        return make_node_id(resource_id.kind, namespace, resource_id.name)
 
     def get_permission_errors(self) -> list[str]:
         """
@@ -458,10 +595,101 @@ class GraphBuilder:
         """
         return self.unified_discoverer.get_discovery_stats()
 
+    def reset_state(self) -> None:
+        """
+        Clear per-build state so the builder can be reused from scratch.
+
+        Drops permission errors, pod templates, the listed-resource cache,
+        the discoverers' cached LIST/GET results and discovery statistics.
+        The client and discoverer registry are kept.
+        Both build methods call this first, so cached LIST results never
+        outlive the build that fetched them.
+        """
+        self._permission_errors = []
+        self._pod_templates = {}
+        self._resource_cache = {}
+        self._pod_label_index = {}
+        self._counters = GraphCounters()
+        self.registry.clear_caches()
+        self.unified_discoverer.reset_stats()
+
+    def _attach_counters(self, graph: CountedDiGraph) -> None:
+        """Hand the build's kind/namespace tallies to the finished graph."""
+        # Every node goes through the counting paths; the check keeps a miss from going stale
+        if self._counters.kinds.total() == graph.number_of_nodes():
+            graph.build_counters = self._counters
+
     def _make_resource_key(self, resource_id: ResourceIdentifier) -> tuple[str, str | None, str]:
         """Make a cache key from resource identifier."""
         return (resource_id.kind, resource_id.namespace, resource_id.name)
 
+    async def _list_cached(self, kind: str, namespace: str | None) -> list[dict[str, Any]]:
+        """
+        List a kind in a namespace once per build, serving repeats from the cache.
+
+        A failed LIST (e.g. forbidden by RBAC) is cached as empty for the rest
+        of the build, so it is neither retried nor logged again until
+        reset_state() runs at the start of the next build.
+        """
+        cache_key = (kind, namespace)
+
+        # Check if we already fetched this kind/namespace
+        if cache_key not in self._resource_cache:
+            try:
+                resources, _ = await self.client.list_resources(kind, namespace)
+                self._resource_cache[cache_key] = resources
+                logger.debug(f"Cached {len(resources)} {kind} resources in namespace {namespace}")
+            except Exception as e:
+                logger.warning(f"Failed to list {kind} in namespace {namespace}: {e}")
+                self._resource_cache[cache_key] = []
+
+        return self._resource_cache[cache_key]
+
+    async def _pods_matching(self, namespace: str | None, label_selector: str) -> list[str]:
+        """
+        Names of the pods in a namespace matched by a label selector.
+
+        Equality selectors (the only kind discoverers emit) are answered from a
+        per-namespace (key, value) -> pod names index built from one cached pod
+        list; anything else is passed to the API server.
+
+        Args:
+            namespace: Namespace of the pods
+            label_selector: Selector string, e.g. "app=nginx,tier=frontend"
+
+        Returns:
+            Matching pod names
+        """
+        terms = [term.split("=", 1) for term in label_selector.split(",") if term]
+        equality_only = (
+            all(len(term) == 2 for term in terms)
+            and "==" not in label_selector
+            and not any(c in label_selector for c in "!() ")
+        )
+        if not equality_only:
+            pods, _ = await self.client.list_resources(
+                kind="Pod", namespace=namespace, label_selector=label_selector
+            )
+            return [name for pod in pods if (name := pod.get("metadata", {}).get("name"))]
+
+        pods = await self._list_cached("Pod", namespace)
+        if not terms:
+            return [name for pod in pods if (name := pod.get("metadata", {}).get("name"))]
+
+        index = self._pod_label_index.get(namespace)
+        if index is None:
+            index = defaultdict(set)
+            for pod in pods:
+                metadata = pod.get("metadata", {})
+                name = metadata.get("name")
+                if name:
+                    for label in (metadata.get("labels") or {}).items():
+                        index[label].add(name)
+            self._pod_label_index[namespace] = index
+
+        postings = [index.get((key, value), set()) for key, value in terms]
+        return sorted(functools.reduce(operator.and_, postings))
+
     async def _batch_fetch_resources(
         self, resource_ids: list[ResourceIdentifier]
     ) -> dict[tuple[str, str | None, str], dict[str, Any]]:
@@ -491,22 +719,7 @@ class GraphBuilder:
 
         # Fetch each group using list_resources (with caching to avoid duplicate calls)
         for (kind, namespace), names in groups.items():
-            cache_key = (kind, namespace)
-
-            # Check if we already fetched this kind/namespace
-            if cache_key not in self._resource_cache:
-                try:
-                    resources, _ = await self.client.list_resources(kind, namespace)
-                    self._resource_cache[cache_key] = resources
-                    logger.debug(
-                        f"Cached {len(resources)} {kind} resources in namespace {namespace}"
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to list {kind} in namespace {namespace}: {e}")
-                    self._resource_cache[cache_key] = []
-
-            # Get from cache
-            resources = self._resource_cache[cache_key]
+            resources = await self._list_cached(kind, namespace)
 
             # Filter to only the names we need
             for resource in resources:
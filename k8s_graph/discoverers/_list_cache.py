@@ -0,0 +1,252 @@
+import asyncio
+import time
+from typing import Any
+
+from k8s_graph.models import ResourceIdentifier
+from k8s_graph.protocols import K8sClientProtocol
+
+_CacheKey = tuple[str, str | None, str | None]
+
+
+def _pop_expired(entries: dict[Any, tuple[float, Any]], cutoff: float) -> list[Any]:
+    """
+    Remove entries stored before ``cutoff`` and return their keys.
+
+    Entries are only inserted after a miss has removed the old one, so each
+    dict is in timestamp order and the scan stops at the first fresh entry.
+    """
+    expired = []
+    while entries:
+        key, (stored_at, _) = next(iter(entries.items()))
+        if stored_at >= cutoff:
+            break
+        del entries[key]
+        expired.append(key)
+    return expired
+
+
+class OwnerIndex:
+    """
+    Children of one LIST response grouped by the owners named in their ownerReferences.
+
+    Building the index walks every child once, after which each owner's children
+    are a single dict lookup instead of a scan over the whole LIST.
+
+    Example:
+        >>> index = OwnerIndex(pods)
+        >>> index.children("Job", "backup-28312")
+        [{'kind': 'Pod', 'metadata': {'name': 'backup-28312-x7k2p', ...}}]
+    """
+
+    def __init__(self, resources: list[dict[str, Any]]) -> None:
+        """
+        Build the index.
+
+        Args:
+            resources: Child resources as returned by list_resources()
+        """
+        self.by_owner: dict[tuple[str, str], list[dict[str, Any]]] = {}
+        for resource in resources:
+            owner_refs = resource.get("metadata", {}).get("ownerReferences") or ()
+            # A set so a child listing the same owner twice is indexed once
+            for owner_key in {(ref.get("kind"), ref.get("name")) for ref in owner_refs}:
+                if owner_key[0] and owner_key[1]:
+                    self.by_owner.setdefault(owner_key, []).append(resource)
+
+    def children(self, kind: str, name: str) -> list[dict[str, Any]]:
+        """
+        Return the resources owned by ``kind``/``name``.
+
+        Args:
+            kind: Owner kind
+            name: Owner name
+
+        Returns:
+            Owned resources in LIST order (empty if none)
+        """
+        return self.by_owner.get((kind, name), [])
+
+
+class ListCache:
+    """
+    Short-lived memo of list_resources() results shared by discovery calls.
+
+    Discovering many workloads in one namespace issues the same LIST over and
+    over (e.g. every Job asking for the namespace's Pods). Results are kept per
+    (kind, namespace, label_selector) for ``ttl`` seconds, and concurrent callers
+    asking for the same key wait on a single in-flight request instead of each
+    hitting the API server.
+
+    Single-resource lookups through get() are memoized the same way, including
+    "not found" results, so many resources pointing at one object (e.g. Velero
+    Restores retrying the same Backup) cost a single GET.
+
+    Expired results are dropped whenever a new one is stored, and GraphBuilder
+    clears the cache at the start of every build, so results never carry over
+    from one build to the next.
+
+    Example:
+        >>> cache = ListCache(client, ttl=30.0)
+        >>> pods = await cache.list("Pod", namespace="default")
+        >>> pods_again = await cache.list("Pod", namespace="default")  # no API call
+        >>> backup = await cache.get(ResourceIdentifier(kind="Backup", name="b1"))
+    """
+
+    def __init__(self, client: K8sClientProtocol, ttl: float = 30.0) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            client: K8s client the LIST calls are delegated to
+            ttl: Seconds a cached result stays valid
+        """
+        self.client = client
+        self.ttl = ttl
+        self._entries: dict[_CacheKey, tuple[float, list[dict[str, Any]]]] = {}
+        self._inflight: dict[_CacheKey, asyncio.Lock] = {}
+        self._owner_indexes: dict[_CacheKey, tuple[list[dict[str, Any]], OwnerIndex]] = {}
+        self._resources: dict[ResourceIdentifier, tuple[float, dict[str, Any] | None]] = {}
+        self._resource_inflight: dict[ResourceIdentifier, asyncio.Lock] = {}
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+        self._owner_indexes.clear()
+        self._resources.clear()
+
+    def _evict_expired(self, now: float) -> None:
+        """Drop expired LIST and GET results, and the owner indexes built on them."""
+        cutoff = now - self.ttl
+        for key in _pop_expired(self._entries, cutoff):
+            self._owner_indexes.pop(key, None)
+        _pop_expired(self._resources, cutoff)
+
+    def _get_fresh_resource(
+        self, resource_id: ResourceIdentifier
+    ) -> tuple[float, dict[str, Any] | None] | None:
+        entry = self._resources.get(resource_id)
+        if entry is not None and time.monotonic() - entry[0] > self.ttl:
+            del self._resources[resource_id]
+            return None
+        return entry
+
+    async def get(self, resource_id: ResourceIdentifier) -> dict[str, Any] | None:
+        """
+        Get a single resource, reusing a recent result for the same identifier.
+
+        Args:
+            resource_id: Identifier of the resource to fetch
+
+        Returns:
+            Resource dictionary, or None if it does not exist
+
+        Raises:
+            Exception: Whatever the underlying client raises; failures are not cached
+        """
+        entry = self._get_fresh_resource(resource_id)
+        if entry is not None:
+            return entry[1]
+
+        lock = self._resource_inflight.setdefault(resource_id, asyncio.Lock())
+        async with lock:
+            entry = self._get_fresh_resource(resource_id)
+            if entry is not None:
+                return entry[1]
+
+            try:
+                resource = await self.client.get_resource(resource_id)
+            finally:
+                if self._resource_inflight.get(resource_id) is lock:
+                    del self._resource_inflight[resource_id]
+
+            now = time.monotonic()
+            self._evict_expired(now)
+            self._resources[resource_id] = (now, resource)
+            return resource
+
+    async def owner_index(
+        self,
+        kind: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+    ) -> OwnerIndex:
+        """
+        Return an OwnerIndex over the (cached) LIST for the given query.
+
+        The index is built once per cached LIST result and rebuilt only when
+        that result is refetched.
+
+        Args:
+            kind: Kind of the owned resources to list
+            namespace: Optional namespace filter
+            label_selector: Optional label selector string
+
+        Returns:
+            OwnerIndex of the listed resources
+        """
+        key = (kind, namespace, label_selector)
+        resources = await self.list(kind, namespace=namespace, label_selector=label_selector)
+
+        indexed = self._owner_indexes.get(key)
+        if indexed is not None and indexed[0] is resources:
+            return indexed[1]
+
+        index = OwnerIndex(resources)
+        self._owner_indexes[key] = (resources, index)
+        return index
+
+    def _get_fresh(self, key: _CacheKey) -> list[dict[str, Any]] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, resources = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        return resources
+
+    async def list(
+        self,
+        kind: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        List resources, reusing a recent result for the same query.
+
+        Args:
+            kind: Resource kind to list
+            namespace: Optional namespace filter
+            label_selector: Optional label selector string
+
+        Returns:
+            List of resource dictionaries
+
+        Raises:
+            Exception: Whatever the underlying client raises; failures are not cached
+        """
+        key = (kind, namespace, label_selector)
+        cached = self._get_fresh(key)
+        if cached is not None:
+            return cached
+
+        lock = self._inflight.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._get_fresh(key)
+            if cached is not None:
+                return cached
+
+            try:
+                resources, _ = await self.client.list_resources(
+                    kind=kind, namespace=namespace, label_selector=label_selector
+                )
+            finally:
+                if self._inflight.get(key) is lock:
+                    del self._inflight[key]
+
+            now = time.monotonic()
+            self._evict_expired(now)
+            self._entries[key] = (now, resources)
+            return resources
@@ -1,13 +1,65 @@
+import inspect
 import logging
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, AsyncIterator
+from functools import lru_cache
 from typing import Any
 
-from k8s_graph.models import DiscovererCategory, ResourceIdentifier, ResourceRelationship
+from k8s_graph.discoverers._list_cache import ListCache
+from k8s_graph.models import (
+    DiscovererCategory,
+    RelationshipType,
+    ResourceIdentifier,
+    ResourceRelationship,
+)
 from k8s_graph.protocols import K8sClientProtocol
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def _labels_to_selector(items: tuple[tuple[str, str], ...]) -> str:
+    """Join label pairs into a K8s selector string, memoized across discoverers."""
+    return ",".join(f"{k}={v}" for k, v in items)
+
+
+async def iter_client_resources(
+    client: K8sClientProtocol,
+    kind: str,
+    namespace: str | None = None,
+    label_selector: str | None = None,
+) -> AsyncGenerator[dict[str, Any], None]:
+    """
+    Stream resources from a client one at a time.
+
+    Uses the client's paginated iter_resources() when it provides one
+    (e.g. KubernetesAdapter), so only one page is held at a time, and
+    falls back to a single list_resources() call otherwise.
+
+    Args:
+        client: K8s client to read from
+        kind: Resource kind to list
+        namespace: Optional namespace filter
+        label_selector: Optional label selector string
+
+    Yields:
+        Resource dictionaries
+    """
+    iter_resources = getattr(type(client), "iter_resources", None)
+    if inspect.isasyncgenfunction(iter_resources):
+        async for resource in client.iter_resources(  # type: ignore[attr-defined]
+            kind=kind, namespace=namespace, label_selector=label_selector
+        ):
+            yield resource
+        return
+
+    resources, _ = await client.list_resources(
+        kind=kind, namespace=namespace, label_selector=label_selector
+    )
+    for resource in resources:
+        yield resource
+
+
 class BaseDiscoverer(ABC):
     """
     Abstract base class for resource relationship discoverers.
@@ -39,6 +91,14 @@ class BaseDiscoverer(ABC):
         ...         return 50  # Built-in priority
     """
 
+    # Set to True when supports() only reads the resource's kind and apiVersion,
+    # so the registry can memoize its answer per (kind, apiVersion)
+    supports_by_type: bool = False
+
+    # Kinds supports() can ever accept; None means any kind. The registry indexes
+    # discoverers by these so other kinds never reach supports()
+    supported_kinds: frozenset[str] | None = None
+
     def __init__(self, client: K8sClientProtocol | None = None) -> None:
         """
         Initialize the discoverer.
@@ -48,6 +108,18 @@ class BaseDiscoverer(ABC):
                    Can be None for discoverers that only examine the resource itself.
         """
         self.client = client
+        self._list_cache: ListCache | None = None
+
+    def _lists(self) -> ListCache:
+        """Return the LIST/GET cache for the current client, replacing it if the client changed."""
+        if self._list_cache is None or self._list_cache.client is not self.client:
+            self._list_cache = ListCache(self.client)  # type: ignore[arg-type]
+        return self._list_cache
+
+    def clear_cache(self) -> None:
+        """Drop the LIST/GET results cached by earlier discover() calls."""
+        if self._list_cache is not None:
+            self._list_cache.clear()
 
     @abstractmethod
     def supports(self, resource: dict[str, Any]) -> bool:
@@ -79,6 +151,22 @@ class BaseDiscoverer(ABC):
         """
         pass
 
+    def discover_sync(self, resource: dict[str, Any]) -> list[ResourceRelationship] | None:
+        """
+        Discover relationships without awaiting, when no API call is needed.
+
+        UnifiedDiscoverer calls this before discover(). Returning a list skips
+        the coroutine entirely; returning None (the default) falls back to
+        discover().
+
+        Args:
+            resource: Kubernetes resource dictionary
+
+        Returns:
+            List of discovered relationships, or None to use discover()
+        """
+        return None
+
     @property
     def priority(self) -> int:
         """
@@ -137,6 +225,58 @@ class BaseDiscoverer(ABC):
             api_version=resource.get("apiVersion"),
         )
 
+    def _relationship(
+        self,
+        source: ResourceIdentifier,
+        target_kind: str,
+        target_name: str,
+        target_namespace: str | None,
+        relationship_type: RelationshipType,
+        details: str | None = None,
+        api_version: str | None = None,
+    ) -> ResourceRelationship:
+        """
+        Build a relationship to a target identified by kind and name.
+
+        Uses model_construct() to skip pydantic's validation machinery, which
+        dominates the cost of building relationships in bulk. The target fields
+        still go through ResourceIdentifier's own field validators, so kinds
+        and names taken from user data (e.g. HPA scaleTargetRef) are checked,
+        and kind/namespace/api_version are interned as usual.
+
+        Args:
+            source: Source resource identifier
+            target_kind: Target resource kind
+            target_name: Target resource name
+            target_namespace: Target namespace (None for cluster-scoped)
+            relationship_type: Type of relationship
+            details: Optional human-readable details
+            api_version: Optional target API version
+
+        Returns:
+            ResourceRelationship from source to the target
+
+        Example:
+            >>> rel = self._relationship(
+            ...     source, "ConfigMap", "app-config", "default", RelationshipType.VOLUME
+            ... )
+
+        Raises:
+            ValueError: If target_kind is empty or lowercase, or target_name is empty
+        """
+        target = ResourceIdentifier.model_construct(
+            kind=ResourceIdentifier.validate_kind(target_kind),
+            name=ResourceIdentifier.validate_name(target_name),
+            namespace=ResourceIdentifier.intern_shared_fields(target_namespace),
+            api_version=ResourceIdentifier.intern_shared_fields(api_version),
+        )
+        return ResourceRelationship.model_construct(
+            source=source,
+            target=target,
+            relationship_type=relationship_type,
+            details=details,
+        )
+
     def _parse_label_selector(self, selector: dict[str, str]) -> str:
         """
         Convert label selector dict to K8s label selector string.
@@ -151,7 +291,7 @@ class BaseDiscoverer(ABC):
             >>> self._parse_label_selector({"app": "nginx", "tier": "frontend"})
             'app=nginx,tier=frontend'
         """
-        return ",".join(f"{k}={v}" for k, v in selector.items())
+        return _labels_to_selector(tuple(selector.items()))
 
     def _match_labels(self, selector: dict[str, str], labels: dict[str, str]) -> bool:
         """
@@ -175,6 +315,19 @@ class BaseDiscoverer(ABC):
                 return False
         return True
 
+    async def _iter_resources(
+        self,
+        kind: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream resources from this discoverer's client via iter_client_resources()."""
+        if not self.client:
+            return
+
+        async for resource in iter_client_resources(self.client, kind, namespace, label_selector):
+            yield resource
+
     async def _safe_discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
         """
         Safely discover relationships, catching and logging exceptions.
@@ -6,10 +6,15 @@ from k8s_graph.models import RelationshipType, ResourceIdentifier, ResourceRelat
 
 logger = logging.getLogger(__name__)
 
+_CRD_KINDS = frozenset({"AirflowCluster"})
+
 
 class AirflowHandler(BaseCRDHandler):
+    supports_by_type = True
+    supported_kinds = _CRD_KINDS
+
     def get_crd_kinds(self) -> list[str]:
-        return ["AirflowCluster"]
+        return sorted(_CRD_KINDS)
 
     def get_crd_info(self, kind: str) -> dict[str, str] | None:
         crd_map = {
@@ -25,7 +30,7 @@ class AirflowHandler(BaseCRDHandler):
         kind = resource.get("kind")
         api_version = resource.get("apiVersion", "")
 
-        return kind in self.get_crd_kinds() and "airflow" in api_version.lower()
+        return kind in _CRD_KINDS and "airflow" in api_version.lower()
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
         relationships = []
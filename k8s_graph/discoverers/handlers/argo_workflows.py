@@ -6,10 +6,15 @@ from k8s_graph.models import RelationshipType, ResourceIdentifier, ResourceRelat
 
 logger = logging.getLogger(__name__)
 
+_CRD_KINDS = frozenset({"Workflow", "CronWorkflow", "WorkflowTemplate"})
+
 
 class ArgoWorkflowsHandler(BaseCRDHandler):
+    supports_by_type = True
+    supported_kinds = _CRD_KINDS
+
     def get_crd_kinds(self) -> list[str]:
-        return ["Workflow", "CronWorkflow", "WorkflowTemplate"]
+        return sorted(_CRD_KINDS)
 
     def get_crd_info(self, kind: str) -> dict[str, str] | None:
         crd_map = {
@@ -31,7 +36,7 @@ class ArgoWorkflowsHandler(BaseCRDHandler):
         kind = resource.get("kind")
         api_version = resource.get("apiVersion", "")
 
-        return kind in self.get_crd_kinds() and api_version.startswith("argoproj.io/")
+        return kind in _CRD_KINDS and api_version.startswith("argoproj.io/")
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
         relationships = []
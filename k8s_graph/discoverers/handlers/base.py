@@ -1,4 +1,5 @@
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from k8s_graph.discoverers.base import BaseDiscoverer
@@ -37,17 +38,24 @@ class BaseCRDHandler(BaseDiscoverer):
         """
         return None
 
-    def _parse_label_selector(self, label_selector: dict[str, str]) -> str:
+    def _unique_resource_names(self, resources: list[dict[str, Any]]) -> list[str]:
         """
-        Convert label selector dict to Kubernetes label selector string.
+        Collect the distinct metadata.name values of resources.
+
+        Nameless entries are skipped and first-seen order is preserved, so
+        callers can emit one relationship per target without duplicates.
 
         Args:
-            label_selector: Dictionary of label key-value pairs
+            resources: Resource dictionaries, typically from a list call
 
         Returns:
-            Comma-separated string like "app=nginx,env=prod"
+            List of unique resource names
         """
-        return ",".join(f"{k}={v}" for k, v in label_selector.items())
+        return list(
+            dict.fromkeys(
+                name for resource in resources if (name := resource.get("metadata", {}).get("name"))
+            )
+        )
 
     async def _find_resources_by_label(
         self,
@@ -70,6 +78,43 @@ class BaseCRDHandler(BaseDiscoverer):
             logger.warning(f"Error finding {kind} resources by label {label_selector}: {e}")
             return []
 
+    async def _aiter_resources_by_label(
+        self,
+        kind: str,
+        namespace: str | None,
+        label_selector: dict[str, str],
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream resources matching a label selector.
+
+        Wraps _iter_resources(), so a paginating client is read one page at a
+        time. Nameless and repeated resources are skipped.
+
+        Args:
+            kind: Resource kind to list
+            namespace: Namespace to search in
+            label_selector: Dictionary of label key-value pairs
+
+        Yields:
+            Matching resource dictionaries
+        """
+        if not self.client:
+            return
+
+        seen: set[tuple[str | None, str]] = set()
+        try:
+            async for resource in self._iter_resources(
+                kind, namespace=namespace, label_selector=self._parse_label_selector(label_selector)
+            ):
+                metadata = resource.get("metadata", {})
+                name = metadata.get("name")
+                key = (metadata.get("namespace"), name)
+                if name and key not in seen:
+                    seen.add(key)
+                    yield resource
+        except Exception as e:
+            logger.warning(f"Error finding {kind} resources by label {label_selector}: {e}")
+
     async def _find_resources_by_annotation(
         self,
         kind: str,
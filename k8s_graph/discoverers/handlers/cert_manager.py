@@ -6,10 +6,15 @@ from k8s_graph.models import RelationshipType, ResourceIdentifier, ResourceRelat
 
 logger = logging.getLogger(__name__)
 
+_CRD_KINDS = frozenset({"Certificate", "Issuer", "ClusterIssuer", "CertificateRequest"})
+
 
 class CertManagerHandler(BaseCRDHandler):
+    supports_by_type = True
+    supported_kinds = _CRD_KINDS
+
     def get_crd_kinds(self) -> list[str]:
-        return ["Certificate", "Issuer", "ClusterIssuer", "CertificateRequest"]
+        return sorted(_CRD_KINDS)
 
     def get_crd_info(self, kind: str) -> dict[str, str] | None:
         crd_map = {
@@ -32,7 +37,7 @@ class CertManagerHandler(BaseCRDHandler):
         kind = resource.get("kind")
         api_version = resource.get("apiVersion", "")
 
-        return kind in self.get_crd_kinds() and "cert-manager.io" in api_version
+        return kind in _CRD_KINDS and "cert-manager.io" in api_version
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
         relationships = []
@@ -6,10 +6,15 @@ from k8s_graph.models import RelationshipType, ResourceIdentifier, ResourceRelat
 
 logger = logging.getLogger(__name__)
 
+_CRD_KINDS = frozenset({"HelmRelease", "Kustomization", "GitRepository", "HelmRepository"})
+
 
 class FluxCDHandler(BaseCRDHandler):
+    supports_by_type = True
+    supported_kinds = _CRD_KINDS
+
     def get_crd_kinds(self) -> list[str]:
-        return ["HelmRelease", "Kustomization"]
+        return sorted(_CRD_KINDS)
 
     def get_crd_info(self, kind: str) -> dict[str, str] | None:
         crd_map = {
@@ -30,10 +35,7 @@ class FluxCDHandler(BaseCRDHandler):
         kind = resource.get("kind")
         api_version = resource.get("apiVersion", "")
 
-        return (
-            kind in ["HelmRelease", "Kustomization", "GitRepository", "HelmRepository"]
-            and "fluxcd.io" in api_version
-        )
+        return kind in _CRD_KINDS and "fluxcd.io" in api_version
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
         relationships = []
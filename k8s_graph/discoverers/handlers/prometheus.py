@@ -6,10 +6,21 @@ from k8s_graph.models import RelationshipType, ResourceIdentifier, ResourceRelat
 
 logger = logging.getLogger(__name__)
 
+_CRD_KINDS = frozenset({"ServiceMonitor", "PodMonitor", "PrometheusRule"})
+
+# Monitor kind -> (kind selected by spec.selector.matchLabels, relationship details)
+_MONITOR_RULES: dict[str, tuple[str, str]] = {
+    "ServiceMonitor": ("Service", "ServiceMonitor monitors Service"),
+    "PodMonitor": ("Pod", "PodMonitor monitors Pod"),
+}
+
 
 class PrometheusHandler(BaseCRDHandler):
+    supports_by_type = True
+    supported_kinds = _CRD_KINDS
+
     def get_crd_kinds(self) -> list[str]:
-        return ["ServiceMonitor", "PodMonitor", "PrometheusRule"]
+        return sorted(_CRD_KINDS)
 
     def get_crd_info(self, kind: str) -> dict[str, str] | None:
         crd_map = {
@@ -35,99 +46,36 @@ class PrometheusHandler(BaseCRDHandler):
         kind = resource.get("kind")
         api_version = resource.get("apiVersion", "")
 
-        return kind in self.get_crd_kinds() and "monitoring.coreos.com" in api_version
+        return kind in _CRD_KINDS and api_version.startswith("monitoring.coreos.com/")
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
-        relationships = []
-
-        try:
-            kind = resource.get("kind")
-            metadata = resource.get("metadata", {})
-            spec = resource.get("spec", {})
-            source_id = self._extract_resource_identifier(resource)
-
-            namespace = metadata.get("namespace")
-
-            if kind == "ServiceMonitor" and self.client and namespace:
-                selector = spec.get("selector", {})
-                match_labels = selector.get("matchLabels", {})
-
-                if match_labels:
-                    services = await self._find_resources_by_label(
-                        kind="Service",
-                        namespace=namespace,
-                        label_selector=match_labels,
-                    )
-
-                    for service in services:
-                        service_metadata = service.get("metadata", {})
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source_id,
-                                target=ResourceIdentifier(
-                                    kind="Service",
-                                    name=service_metadata.get("name"),
-                                    namespace=namespace,
-                                ),
-                                relationship_type=RelationshipType.PROMETHEUS_MONITOR,
-                                details="ServiceMonitor monitors Service",
-                            )
-                        )
-
-            elif kind == "PodMonitor" and self.client and namespace:
-                selector = spec.get("selector", {})
-                match_labels = selector.get("matchLabels", {})
-
-                if match_labels:
-                    pods = await self._find_resources_by_label(
-                        kind="Pod",
-                        namespace=namespace,
-                        label_selector=match_labels,
-                    )
-
-                    for pod in pods:
-                        pod_metadata = pod.get("metadata", {})
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source_id,
-                                target=ResourceIdentifier(
-                                    kind="Pod",
-                                    name=pod_metadata.get("name"),
-                                    namespace=namespace,
-                                ),
-                                relationship_type=RelationshipType.PROMETHEUS_MONITOR,
-                                details="PodMonitor monitors Pod",
-                            )
-                        )
-
-            elif kind == "Prometheus" and self.client:
-                service_monitor_selector = spec.get("serviceMonitorSelector", {})
-                match_labels = service_monitor_selector.get("matchLabels", {})
-
-                if match_labels:
-                    service_monitors = await self._find_resources_by_label(
-                        kind="ServiceMonitor",
-                        namespace=namespace,
-                        label_selector=match_labels,
-                    )
+        rule = _MONITOR_RULES.get(resource.get("kind", ""))
+        if rule is None:
+            return []
 
-                    for sm in service_monitors:
-                        sm_metadata = sm.get("metadata", {})
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source_id,
-                                target=ResourceIdentifier(
-                                    kind="ServiceMonitor",
-                                    name=sm_metadata.get("name"),
-                                    namespace=sm_metadata.get("namespace"),
-                                ),
-                                relationship_type=RelationshipType.PROMETHEUS_MONITOR,
-                                details="Prometheus scrapes ServiceMonitor",
-                            )
-                        )
+        target_kind, details = rule
+        metadata = resource.get("metadata", {})
+        namespace = metadata.get("namespace")
+        match_labels = resource.get("spec", {}).get("selector", {}).get("matchLabels", {})
 
-        except Exception as e:
-            logger.error(f"Error in PrometheusHandler.discover(): {e}", exc_info=True)
+        if not match_labels or not self.client or not namespace:
             return []
 
-        return relationships
+        source_id = self._extract_resource_identifier(resource)
+        return [
+            ResourceRelationship(
+                source=source_id,
+                target=ResourceIdentifier(
+                    kind=target_kind,
+                    name=target["metadata"]["name"],
+                    namespace=namespace,
+                ),
+                relationship_type=RelationshipType.PROMETHEUS_MONITOR,
+                details=details,
+            )
+            async for target in self._aiter_resources_by_label(
+                kind=target_kind,
+                namespace=namespace,
+                label_selector=match_labels,
+            )
+        ]
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any
 
@@ -8,6 +9,9 @@ logger = logging.getLogger(__name__)
 
 
 class SparkHandler(BaseCRDHandler):
+    supports_by_type = True
+    supported_kinds = frozenset({"SparkApplication", "ScheduledSparkApplication"})
+
     def get_crd_kinds(self) -> list[str]:
         return ["SparkApplication", "ScheduledSparkApplication"]
 
@@ -30,108 +34,93 @@ class SparkHandler(BaseCRDHandler):
         kind = resource.get("kind")
         api_version = resource.get("apiVersion", "")
 
-        return kind == "SparkApplication" and "sparkoperator.k8s.io" in api_version
+        return kind == "SparkApplication" and api_version.startswith("sparkoperator.k8s.io/")
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
         relationships = []
 
-        try:
-            metadata = resource.get("metadata", {})
-            spec = resource.get("spec", {})
-            source_id = self._extract_resource_identifier(resource)
+        metadata = resource.get("metadata", {})
+        spec = resource.get("spec", {})
+        source_id = self._extract_resource_identifier(resource)
 
-            namespace = metadata.get("namespace")
-            name = metadata.get("name")
+        namespace = metadata.get("namespace")
+        name = metadata.get("name")
 
-            if not self.client or not namespace:
-                return []
+        if not self.client or not namespace:
+            return []
 
-            driver_label_selector = {
-                "spark-role": "driver",
-                "sparkoperator.k8s.io/app-name": name,
-            }
-            driver_pods = await self._find_resources_by_label(
-                kind="Pod",
-                namespace=namespace,
-                label_selector=driver_label_selector,
-            )
+        # Driver and executor pods are listed concurrently
+        for pods in await asyncio.gather(
+            self._role_pods(source_id, namespace, name, "driver", RelationshipType.SPARK_DRIVER),
+            self._role_pods(
+                source_id, namespace, name, "executor", RelationshipType.SPARK_EXECUTOR
+            ),
+        ):
+            relationships.extend(pods)
+
+        mounted: set[tuple[str, str]] = set()
+        volumes = spec.get("volumes", [])
+        for volume in volumes:
+            if "configMap" in volume:
+                cm_name = volume["configMap"].get("name")
+                if cm_name and ("ConfigMap", cm_name) not in mounted:
+                    mounted.add(("ConfigMap", cm_name))
+                    relationships.append(
+                        ResourceRelationship(
+                            source=source_id,
+                            target=ResourceIdentifier(
+                                kind="ConfigMap",
+                                name=cm_name,
+                                namespace=namespace,
+                            ),
+                            relationship_type=RelationshipType.VOLUME,
+                            details="Spark volume mount",
+                        )
+                    )
 
-            for pod in driver_pods:
-                pod_metadata = pod.get("metadata", {})
-                relationships.append(
-                    ResourceRelationship(
-                        source=source_id,
-                        target=ResourceIdentifier(
-                            kind="Pod",
-                            name=pod_metadata.get("name"),
-                            namespace=namespace,
-                        ),
-                        relationship_type=RelationshipType.SPARK_DRIVER,
-                        details="Spark driver pod",
+            if "secret" in volume:
+                secret_name = volume["secret"].get("secretName")
+                if secret_name and ("Secret", secret_name) not in mounted:
+                    mounted.add(("Secret", secret_name))
+                    relationships.append(
+                        ResourceRelationship(
+                            source=source_id,
+                            target=ResourceIdentifier(
+                                kind="Secret",
+                                name=secret_name,
+                                namespace=namespace,
+                            ),
+                            relationship_type=RelationshipType.VOLUME,
+                            details="Spark volume mount",
+                        )
                     )
-                )
 
-            executor_label_selector = {
-                "spark-role": "executor",
-                "sparkoperator.k8s.io/app-name": name,
-            }
-            executor_pods = await self._find_resources_by_label(
+        return relationships
+
+    async def _role_pods(
+        self,
+        source_id: ResourceIdentifier,
+        namespace: str,
+        name: str,
+        role: str,
+        relationship_type: RelationshipType,
+    ) -> list[ResourceRelationship]:
+        """List the application's pods with the given spark-role label."""
+        label_selector = {"spark-role": role, "sparkoperator.k8s.io/app-name": name}
+        return [
+            ResourceRelationship(
+                source=source_id,
+                target=ResourceIdentifier(
+                    kind="Pod",
+                    name=pod["metadata"]["name"],
+                    namespace=namespace,
+                ),
+                relationship_type=relationship_type,
+                details=f"Spark {role} pod",
+            )
+            async for pod in self._aiter_resources_by_label(
                 kind="Pod",
                 namespace=namespace,
-                label_selector=executor_label_selector,
+                label_selector=label_selector,
             )
-
-            for pod in executor_pods:
-                pod_metadata = pod.get("metadata", {})
-                relationships.append(
-                    ResourceRelationship(
-                        source=source_id,
-                        target=ResourceIdentifier(
-                            kind="Pod",
-                            name=pod_metadata.get("name"),
-                            namespace=namespace,
-                        ),
-                        relationship_type=RelationshipType.SPARK_EXECUTOR,
-                        details="Spark executor pod",
-                    )
-                )
-
-            volumes = spec.get("volumes", [])
-            for volume in volumes:
-                if "configMap" in volume:
-                    cm_name = volume["configMap"].get("name")
-                    if cm_name:
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source_id,
-                                target=ResourceIdentifier(
-                                    kind="ConfigMap",
-                                    name=cm_name,
-                                    namespace=namespace,
-                                ),
-                                relationship_type=RelationshipType.VOLUME,
-                                details="Spark volume mount",
-                            )
-                        )
-
-                if "secret" in volume:
-                    secret_name = volume["secret"].get("secretName")
-                    if secret_name:
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source_id,
-                                target=ResourceIdentifier(
-                                    kind="Secret",
-                                    name=secret_name,
-                                    namespace=namespace,
-                                ),
-                                relationship_type=RelationshipType.VOLUME,
-                                details="Spark volume mount",
-                            )
-                        )
-
-        except Exception as e:
-            logger.error(f"Error in SparkHandler.discover(): {e}", exc_info=True)
-            return []
-
-        return relationships
+        ]
@@ -1,13 +1,31 @@
 import logging
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from k8s_graph.discoverers.handlers.base import BaseCRDHandler
 from k8s_graph.models import RelationshipType, ResourceIdentifier, ResourceRelationship
+from k8s_graph.protocols import K8sClientProtocol
 
 logger = logging.getLogger(__name__)
 
 
+_TEKTON_KINDS = frozenset({"Pipeline", "PipelineRun", "Task", "TaskRun"})
+
+
 class TektonHandler(BaseCRDHandler):
+    supports_by_type = True
+    supported_kinds = _TEKTON_KINDS
+
+    def __init__(self, client: K8sClientProtocol | None = None) -> None:
+        super().__init__(client)
+        self._discover_by_kind: dict[
+            str,
+            Callable[[dict[str, Any], ResourceIdentifier], Awaitable[list[ResourceRelationship]]],
+        ] = {
+            "PipelineRun": self._discover_pipelinerun,
+            "TaskRun": self._discover_taskrun,
+        }
+
     def get_crd_kinds(self) -> list[str]:
         return ["Pipeline", "PipelineRun", "Task", "TaskRun"]
 
@@ -24,147 +42,159 @@ class TektonHandler(BaseCRDHandler):
         kind = resource.get("kind")
         api_version = resource.get("apiVersion", "")
 
-        return kind in self.get_crd_kinds() and "tekton.dev" in api_version
+        return kind in _TEKTON_KINDS and api_version.startswith("tekton.dev/")
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
+        discover_kind = self._discover_by_kind.get(resource.get("kind", ""))
+        if discover_kind is None:
+            return []
+
+        source_id = self._extract_resource_identifier(resource)
+        return await discover_kind(resource, source_id)
+
+    async def _discover_pipelinerun(
+        self, resource: dict[str, Any], source_id: ResourceIdentifier
+    ) -> list[ResourceRelationship]:
         relationships = []
+        metadata = resource.get("metadata", {})
+        spec = resource.get("spec", {})
 
-        try:
-            kind = resource.get("kind")
-            metadata = resource.get("metadata", {})
-            spec = resource.get("spec", {})
-            source_id = self._extract_resource_identifier(resource)
+        namespace = metadata.get("namespace")
+        name = metadata.get("name")
 
-            namespace = metadata.get("namespace")
-            name = metadata.get("name")
+        pipeline_ref = spec.get("pipelineRef", {})
+        pipeline_name = pipeline_ref.get("name")
 
-            if kind == "PipelineRun":
-                pipeline_ref = spec.get("pipelineRef", {})
-                pipeline_name = pipeline_ref.get("name")
+        if pipeline_name and self.client:
+            try:
+                pipeline = await self.client.get_resource(
+                    ResourceIdentifier(
+                        kind="Pipeline",
+                        name=pipeline_name,
+                        namespace=namespace,
+                    )
+                )
 
-                if pipeline_name and self.client:
-                    try:
-                        pipeline = await self.client.get_resource(
-                            ResourceIdentifier(
+                if pipeline:
+                    relationships.append(
+                        ResourceRelationship(
+                            source=source_id,
+                            target=ResourceIdentifier(
                                 kind="Pipeline",
                                 name=pipeline_name,
                                 namespace=namespace,
-                            )
+                            ),
+                            relationship_type=RelationshipType.MANAGED,
+                            details="PipelineRun executes Pipeline",
                         )
-
-                        if pipeline:
-                            relationships.append(
-                                ResourceRelationship(
-                                    source=source_id,
-                                    target=ResourceIdentifier(
-                                        kind="Pipeline",
-                                        name=pipeline_name,
-                                        namespace=namespace,
-                                    ),
-                                    relationship_type=RelationshipType.MANAGED,
-                                    details="PipelineRun executes Pipeline",
-                                )
-                            )
-                    except Exception as e:
-                        logger.debug(f"Error finding Pipeline {pipeline_name}: {e}")
-
-                if self.client and namespace:
-                    label_selector = {"tekton.dev/pipelineRun": name}
-                    task_runs = await self._find_resources_by_label(
+                    )
+            except Exception as e:
+                logger.debug(f"Error finding Pipeline {pipeline_name}: {e}")
+
+        if self.client and namespace:
+            label_selector = {"tekton.dev/pipelineRun": name}
+            relationships.extend(
+                [
+                    ResourceRelationship(
+                        source=source_id,
+                        target=ResourceIdentifier(
+                            kind="TaskRun",
+                            name=task_run["metadata"]["name"],
+                            namespace=namespace,
+                        ),
+                        relationship_type=RelationshipType.TEKTON_RUN,
+                        details="PipelineRun created TaskRun",
+                    )
+                    async for task_run in self._aiter_resources_by_label(
                         kind="TaskRun",
                         namespace=namespace,
                         label_selector=label_selector,
                     )
+                ]
+            )
 
-                    for task_run in task_runs:
-                        task_run_metadata = task_run.get("metadata", {})
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source_id,
-                                target=ResourceIdentifier(
-                                    kind="TaskRun",
-                                    name=task_run_metadata.get("name"),
-                                    namespace=namespace,
-                                ),
-                                relationship_type=RelationshipType.TEKTON_RUN,
-                                details="PipelineRun created TaskRun",
-                            )
-                        )
+        return relationships
+
+    async def _discover_taskrun(
+        self, resource: dict[str, Any], source_id: ResourceIdentifier
+    ) -> list[ResourceRelationship]:
+        relationships = []
+        metadata = resource.get("metadata", {})
+        spec = resource.get("spec", {})
+
+        namespace = metadata.get("namespace")
+        name = metadata.get("name")
 
-            elif kind == "TaskRun":
-                task_ref = spec.get("taskRef", {})
-                task_name = task_ref.get("name")
+        task_ref = spec.get("taskRef", {})
+        task_name = task_ref.get("name")
+
+        if task_name and self.client:
+            try:
+                task = await self.client.get_resource(
+                    ResourceIdentifier(
+                        kind="Task",
+                        name=task_name,
+                        namespace=namespace,
+                    )
+                )
 
-                if task_name and self.client:
-                    try:
-                        task = await self.client.get_resource(
-                            ResourceIdentifier(
+                if task:
+                    relationships.append(
+                        ResourceRelationship(
+                            source=source_id,
+                            target=ResourceIdentifier(
                                 kind="Task",
                                 name=task_name,
                                 namespace=namespace,
-                            )
+                            ),
+                            relationship_type=RelationshipType.MANAGED,
+                            details="TaskRun executes Task",
                         )
-
-                        if task:
-                            relationships.append(
-                                ResourceRelationship(
-                                    source=source_id,
-                                    target=ResourceIdentifier(
-                                        kind="Task",
-                                        name=task_name,
-                                        namespace=namespace,
-                                    ),
-                                    relationship_type=RelationshipType.MANAGED,
-                                    details="TaskRun executes Task",
-                                )
-                            )
-                    except Exception as e:
-                        logger.debug(f"Error finding Task {task_name}: {e}")
-
-                if self.client and namespace:
-                    label_selector = {"tekton.dev/taskRun": name}
-                    pods = await self._find_resources_by_label(
+                    )
+            except Exception as e:
+                logger.debug(f"Error finding Task {task_name}: {e}")
+
+        if self.client and namespace:
+            label_selector = {"tekton.dev/taskRun": name}
+            relationships.extend(
+                [
+                    ResourceRelationship(
+                        source=source_id,
+                        target=ResourceIdentifier(
+                            kind="Pod",
+                            name=pod["metadata"]["name"],
+                            namespace=namespace,
+                        ),
+                        relationship_type=RelationshipType.TEKTON_RUN,
+                        details="TaskRun created Pod",
+                    )
+                    async for pod in self._aiter_resources_by_label(
                         kind="Pod",
                         namespace=namespace,
                         label_selector=label_selector,
                     )
-
-                    for pod in pods:
-                        pod_metadata = pod.get("metadata", {})
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source_id,
-                                target=ResourceIdentifier(
-                                    kind="Pod",
-                                    name=pod_metadata.get("name"),
-                                    namespace=namespace,
-                                ),
-                                relationship_type=RelationshipType.TEKTON_RUN,
-                                details="TaskRun created Pod",
-                            )
-                        )
-
-                workspaces = spec.get("workspaces", [])
-                for workspace in workspaces:
-                    pvc = workspace.get("persistentVolumeClaim", {})
-                    pvc_name = pvc.get("claimName")
-
-                    if pvc_name:
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source_id,
-                                target=ResourceIdentifier(
-                                    kind="PersistentVolumeClaim",
-                                    name=pvc_name,
-                                    namespace=namespace,
-                                ),
-                                relationship_type=RelationshipType.PVC,
-                                details="TaskRun uses workspace PVC",
-                            )
-                        )
-
-        except Exception as e:
-            logger.error(f"Error in TektonHandler.discover(): {e}", exc_info=True)
-            return []
+                ]
+            )
+
+        claimed: set[str] = set()
+        workspaces = spec.get("workspaces", [])
+        for workspace in workspaces:
+            pvc = workspace.get("persistentVolumeClaim", {})
+            pvc_name = pvc.get("claimName")
+
+            if pvc_name and pvc_name not in claimed:
+                claimed.add(pvc_name)
+                relationships.append(
+                    ResourceRelationship(
+                        source=source_id,
+                        target=ResourceIdentifier(
+                            kind="PersistentVolumeClaim",
+                            name=pvc_name,
+                            namespace=namespace,
+                        ),
+                        relationship_type=RelationshipType.PVC,
+                        details="TaskRun uses workspace PVC",
+                    )
+                )
 
         return relationships
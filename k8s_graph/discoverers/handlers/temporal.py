@@ -25,6 +25,8 @@ class TemporalHandler(BaseCRDHandler):
     - Worker Pods → Temporal Frontend Service
     """
 
+    supported_kinds = frozenset({"Deployment", "CronJob", "Pod", "Service"})
+
     def supports(self, resource: dict[str, Any]) -> bool:
         labels = resource.get("metadata", {}).get("labels", {})
         kind = resource.get("kind")
@@ -126,12 +128,10 @@ class TemporalHandler(BaseCRDHandler):
                 )
 
                 # Filter jobs created by this CronJob
-                for job in jobs:
-                    job_metadata = job.get("metadata", {})
-                    job_name = job_metadata.get("name", "")
-
+                job_prefix = f"{cronjob_name}-"
+                for job_name in self._unique_resource_names(jobs):
                     # Jobs created by CronJobs have names like: {cronjob-name}-{timestamp}
-                    if job_name.startswith(f"{cronjob_name}-"):
+                    if job_name.startswith(job_prefix):
                         job_id = ResourceIdentifier(
                             kind="Job",
                             name=job_name,
@@ -260,24 +260,18 @@ class TemporalHandler(BaseCRDHandler):
         Examples:
             "temporal-frontend.temporal-main.svc" -> ("temporal-frontend", "temporal-main")
             "temporal-frontend.temporal-main.svc:7233" -> ("temporal-frontend", "temporal-main")
-            "temporal-frontend" -> ("temporal-frontend", None)
+            "temporal-frontend" -> ("temporal-frontend", default_namespace)
 
         Returns:
             Tuple of (service_name, namespace)
         """
-        if ":" in temporal_host:
-            temporal_host = temporal_host.split(":")[0]
-
-        parts = temporal_host.split(".")
+        host = temporal_host.partition(":")[0]
+        service_name, sep, rest = host.partition(".")
 
-        if len(parts) >= 2:
-            service_name = parts[0]
-            namespace = parts[1]
-            return service_name, namespace
-        elif len(parts) == 1:
-            return parts[0], default_namespace
+        if sep:
+            return service_name, rest.partition(".")[0]
 
-        return temporal_host, default_namespace
+        return service_name, default_namespace
 
     @property
     def priority(self) -> int:
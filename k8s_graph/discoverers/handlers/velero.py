@@ -7,23 +7,29 @@ from k8s_graph.models import RelationshipType, ResourceIdentifier, ResourceRelat
 logger = logging.getLogger(__name__)
 
 
+_CRD_INFO: dict[str, dict[str, str]] = {
+    "Backup": {"group": "velero.io", "version": "v1", "plural": "backups"},
+    "Restore": {"group": "velero.io", "version": "v1", "plural": "restores"},
+    "Schedule": {"group": "velero.io", "version": "v1", "plural": "schedules"},
+}
+_CRD_KINDS = frozenset(_CRD_INFO)
+
+
 class VeleroHandler(BaseCRDHandler):
+    supports_by_type = True
+    supported_kinds = _CRD_KINDS
+
     def get_crd_kinds(self) -> list[str]:
-        return ["Backup", "Restore", "Schedule"]
+        return list(_CRD_INFO)
 
     def get_crd_info(self, kind: str) -> dict[str, str] | None:
-        crd_map = {
-            "Backup": {"group": "velero.io", "version": "v1", "plural": "backups"},
-            "Restore": {"group": "velero.io", "version": "v1", "plural": "restores"},
-            "Schedule": {"group": "velero.io", "version": "v1", "plural": "schedules"},
-        }
-        return crd_map.get(kind)
+        return _CRD_INFO.get(kind)
 
     def supports(self, resource: dict[str, Any]) -> bool:
         kind = resource.get("kind")
         api_version = resource.get("apiVersion", "")
 
-        return kind in self.get_crd_kinds() and "velero.io" in api_version
+        return api_version.startswith("velero.io/") and kind in _CRD_KINDS
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
         relationships = []
@@ -83,7 +89,7 @@ class VeleroHandler(BaseCRDHandler):
                 backup_name = spec.get("backupName")
                 if backup_name and self.client:
                     try:
-                        backup = await self.client.get_resource(
+                        backup = await self._lists().get(
                             ResourceIdentifier(
                                 kind="Backup",
                                 name=backup_name,
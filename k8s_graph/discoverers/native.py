@@ -1,6 +1,10 @@
+import asyncio
+import itertools
 import logging
+from collections.abc import Callable
 from typing import Any
 
+from k8s_graph.discoverers._list_cache import ListCache
 from k8s_graph.discoverers.base import BaseDiscoverer
 from k8s_graph.models import (
     DiscovererCategory,
@@ -12,6 +16,17 @@ from k8s_graph.protocols import K8sClientProtocol
 
 logger = logging.getLogger(__name__)
 
+# Workload kind -> kind of the resources it directly owns
+_OWNED_KIND = {
+    "Deployment": "ReplicaSet",
+    "StatefulSet": "Pod",
+    "DaemonSet": "Pod",
+    "ReplicaSet": "Pod",
+}
+
+# Kinds whose relationship discovery needs API calls (handlers are coroutines)
+_ASYNC_KINDS = frozenset(_OWNED_KIND) | {"Job", "CronJob"}
+
 
 class NativeResourceDiscoverer(BaseDiscoverer):
     """
@@ -31,8 +46,39 @@ class NativeResourceDiscoverer(BaseDiscoverer):
     - Pod disruption (PDB -> Deployment/StatefulSet)
     """
 
-    def __init__(self, client: K8sClientProtocol | None = None) -> None:
+    supports_by_type = True
+
+    def __init__(
+        self,
+        client: K8sClientProtocol | None = None,
+        list_cache: ListCache | None = None,
+    ) -> None:
+        """
+        Initialize the discoverer.
+
+        Args:
+            client: Optional K8s client for listing owned resources
+            list_cache: Optional shared LIST cache. If None, one is created for
+                        the current client on first use.
+        """
         super().__init__(client)
+        self._list_cache = list_cache
+        self._discover_by_kind: dict[str, Callable[[dict[str, Any], ResourceIdentifier], Any]] = {
+            "Service": self._discover_service_relationships,
+            "Endpoints": self._discover_endpoints_relationships,
+            "Pod": self._discover_pod_relationships,
+            "Ingress": self._discover_ingress_relationships,
+            "PersistentVolumeClaim": self._discover_pvc_relationships,
+            "PersistentVolume": self._discover_pv_relationships,
+            "Deployment": self._discover_workload_relationships,
+            "StatefulSet": self._discover_workload_relationships,
+            "DaemonSet": self._discover_workload_relationships,
+            "ReplicaSet": self._discover_workload_relationships,
+            "Job": self._discover_job_relationships,
+            "CronJob": self._discover_cronjob_relationships,
+            "HorizontalPodAutoscaler": self._discover_hpa_relationships,
+            "PodDisruptionBudget": self._discover_pdb_relationships,
+        }
 
     def supports(self, resource: dict[str, Any]) -> bool:
         return True
@@ -41,41 +87,43 @@ class NativeResourceDiscoverer(BaseDiscoverer):
     def categories(self) -> DiscovererCategory:
         return DiscovererCategory.NATIVE
 
-    async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
-        relationships: list[ResourceRelationship] = []
+    def discover_sync(self, resource: dict[str, Any]) -> list[ResourceRelationship] | None:
+        # Workload, Job and CronJob relationships list owned resources via the API
+        if resource.get("kind") in _ASYNC_KINDS:
+            return None
+
+        try:
+            source = self._extract_resource_identifier(resource)
+        except ValueError as e:
+            logger.debug(f"Cannot extract resource identifier: {e}")
+            return []
+
+        relationships = self._discover_owner_references(resource, source)
 
-        kind = resource.get("kind")
-        if not kind:
+        discover_kind = self._discover_by_kind.get(source.kind)
+        if discover_kind is not None:
+            relationships.extend(discover_kind(resource, source))
+
+        return relationships
+
+    async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
+        relationships = self.discover_sync(resource)
+        if relationships is not None:
             return relationships
 
-        relationships.extend(self._discover_owner_references(resource))
-
-        if kind == "Service":
-            relationships.extend(self._discover_service_relationships(resource))
-        elif kind == "Endpoints":
-            relationships.extend(self._discover_endpoints_relationships(resource))
-        elif kind == "Pod":
-            relationships.extend(self._discover_pod_relationships(resource))
-        elif kind == "Ingress":
-            relationships.extend(self._discover_ingress_relationships(resource))
-        elif kind == "PersistentVolumeClaim":
-            relationships.extend(self._discover_pvc_relationships(resource))
-        elif kind == "PersistentVolume":
-            relationships.extend(self._discover_pv_relationships(resource))
-        elif kind in ["Deployment", "StatefulSet", "DaemonSet", "ReplicaSet"]:
-            relationships.extend(await self._discover_workload_relationships(resource))
-        elif kind == "Job":
-            relationships.extend(await self._discover_job_relationships(resource))
-        elif kind == "CronJob":
-            relationships.extend(await self._discover_cronjob_relationships(resource))
-        elif kind == "HorizontalPodAutoscaler":
-            relationships.extend(self._discover_hpa_relationships(resource))
-        elif kind == "PodDisruptionBudget":
-            relationships.extend(self._discover_pdb_relationships(resource))
+        try:
+            source = self._extract_resource_identifier(resource)
+        except ValueError as e:
+            logger.debug(f"Cannot extract resource identifier: {e}")
+            return []
 
+        relationships = self._discover_owner_references(resource, source)
+        relationships.extend(await self._discover_by_kind[source.kind](resource, source))
         return relationships
 
-    def _discover_owner_references(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
+    def _discover_owner_references(
+        self, resource: dict[str, Any], child: ResourceIdentifier
+    ) -> list[ResourceRelationship]:
         """
         Discover owner reference relationships.
 
@@ -84,54 +132,55 @@ class NativeResourceDiscoverer(BaseDiscoverer):
         """
         relationships: list[ResourceRelationship] = []
         metadata = resource.get("metadata", {})
-        owner_refs = metadata.get("ownerReferences", [])
+        owner_refs = metadata.get("ownerReferences") or ()
 
         if not owner_refs:
             return relationships
 
-        try:
-            child = self._extract_resource_identifier(resource)
-        except ValueError as e:
-            logger.warning(f"Cannot extract resource identifier: {e}")
-            return relationships
+        namespace = metadata.get("namespace")
 
-        for owner_ref in owner_refs:
-            owner_kind = owner_ref.get("kind")
-            owner_name = owner_ref.get("name")
-            owner_api_version = owner_ref.get("apiVersion")
+        if len(owner_refs) == 1:
+            # Nearly every owned resource has exactly one owner; skip the loop
+            relationship = self._owner_relationship(owner_refs[0], child, namespace)
+            return [relationship] if relationship else relationships
 
-            if not owner_kind or not owner_name:
-                continue
+        for owner_ref in owner_refs:
+            relationship = self._owner_relationship(owner_ref, child, namespace)
+            if relationship:
+                relationships.append(relationship)
 
-            parent = ResourceIdentifier(
-                kind=owner_kind,
-                name=owner_name,
-                namespace=metadata.get("namespace"),
-                api_version=owner_api_version,
-            )
+        return relationships
 
-            # Create edge from parent to child (correct hierarchy direction)
-            relationships.append(
-                ResourceRelationship(
-                    source=parent,
-                    target=child,
-                    relationship_type=RelationshipType.OWNED,
-                    details=f"{owner_kind} owns {child.kind}",
-                )
-            )
+    def _owner_relationship(
+        self, owner_ref: dict[str, Any], child: ResourceIdentifier, namespace: str | None
+    ) -> ResourceRelationship | None:
+        """Build the owner -> child edge for one ownerReference, or None if it is incomplete."""
+        owner_kind = owner_ref.get("kind")
+        owner_name = owner_ref.get("name")
+
+        if not owner_kind or not owner_name:
+            return None
+
+        parent = ResourceIdentifier(
+            kind=owner_kind,
+            name=owner_name,
+            namespace=namespace,
+            api_version=owner_ref.get("apiVersion"),
+        )
 
-        return relationships
+        # Create edge from parent to child (correct hierarchy direction)
+        return ResourceRelationship(
+            source=parent,
+            target=child,
+            relationship_type=RelationshipType.OWNED,
+            details=f"{owner_kind} owns {child.kind}",
+        )
 
     def _discover_service_relationships(
-        self, resource: dict[str, Any]
+        self, resource: dict[str, Any], source: ResourceIdentifier
     ) -> list[ResourceRelationship]:
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         spec = resource.get("spec", {})
         selector = spec.get("selector", {})
 
@@ -139,49 +188,38 @@ class NativeResourceDiscoverer(BaseDiscoverer):
             return relationships
 
         # Service -> Pods via label selector
-        target = ResourceIdentifier(
-            kind="Pod",
-            name=f"*[{self._parse_label_selector(selector)}]",
-            namespace=source.namespace,
-        )
-
+        selector_str = self._parse_label_selector(selector)
         relationships.append(
-            ResourceRelationship(
-                source=source,
-                target=target,
-                relationship_type=RelationshipType.LABEL_SELECTOR,
-                details=f"Selects pods with labels: {self._parse_label_selector(selector)}",
+            self._relationship(
+                source,
+                "Pod",
+                f"*[{selector_str}]",
+                source.namespace,
+                RelationshipType.LABEL_SELECTOR,
+                f"Selects pods with labels: {selector_str}",
             )
         )
 
         # Service -> Endpoints (automatically created with same name)
-        endpoints_target = ResourceIdentifier(
-            kind="Endpoints",
-            name=source.name,
-            namespace=source.namespace,
-        )
         relationships.append(
-            ResourceRelationship(
-                source=source,
-                target=endpoints_target,
-                relationship_type=RelationshipType.SERVICE_ENDPOINT,
-                details="Service manages Endpoints",
+            self._relationship(
+                source,
+                "Endpoints",
+                source.name,
+                source.namespace,
+                RelationshipType.SERVICE_ENDPOINT,
+                "Service manages Endpoints",
             )
         )
 
         return relationships
 
     def _discover_endpoints_relationships(
-        self, resource: dict[str, Any]
+        self, resource: dict[str, Any], source: ResourceIdentifier
     ) -> list[ResourceRelationship]:
         """Discover relationships from Endpoints to Pods."""
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         # Endpoints contain subsets with addresses that reference Pods
         subsets = resource.get("subsets", [])
         for subset in subsets:
@@ -192,318 +230,223 @@ class NativeResourceDiscoverer(BaseDiscoverer):
                     pod_name = target_ref.get("name")
                     pod_namespace = target_ref.get("namespace")
                     if pod_name:
-                        target = ResourceIdentifier(
-                            kind="Pod",
-                            name=pod_name,
-                            namespace=pod_namespace or source.namespace,
-                        )
                         relationships.append(
-                            ResourceRelationship(
-                                source=source,
-                                target=target,
-                                relationship_type=RelationshipType.SERVICE_ENDPOINT,
-                                details=f"Endpoints routes to Pod IP {address.get('ip')}",
+                            self._relationship(
+                                source,
+                                "Pod",
+                                pod_name,
+                                pod_namespace or source.namespace,
+                                RelationshipType.SERVICE_ENDPOINT,
+                                f"Endpoints routes to Pod IP {address.get('ip')}",
                             )
                         )
 
         return relationships
 
-    def _discover_pod_relationships(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
+    def _discover_pod_relationships(
+        self, resource: dict[str, Any], source: ResourceIdentifier
+    ) -> list[ResourceRelationship]:
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
+        spec = resource.get("spec") or {}
+        namespace = source.namespace
+        seen: set[tuple[RelationshipType, str, str]] = set()
 
-        spec = resource.get("spec", {})
+        def add(kind: str, name: str, relationship_type: RelationshipType, details: str) -> None:
+            # Containers and volumes often repeat a ConfigMap/Secret; keep one edge
+            # per (type, target) so the builder does not process duplicates.
+            key = (relationship_type, kind, name)
+            if key not in seen:
+                seen.add(key)
+                relationships.append(
+                    self._relationship(source, kind, name, namespace, relationship_type, details)
+                )
 
         service_account_name = spec.get("serviceAccountName") or spec.get("serviceAccount")
         if service_account_name:
-            target = ResourceIdentifier(
-                kind="ServiceAccount",
-                name=service_account_name,
-                namespace=source.namespace,
-            )
-            relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.SERVICE_ACCOUNT,
-                    details="Pod uses ServiceAccount",
-                )
+            add(
+                "ServiceAccount",
+                service_account_name,
+                RelationshipType.SERVICE_ACCOUNT,
+                "Pod uses ServiceAccount",
             )
 
-        relationships.extend(self._discover_pod_volumes(resource, source))
-        relationships.extend(self._discover_pod_env_from(resource, source))
-
-        return relationships
-
-    def _discover_pod_volumes(
-        self, resource: dict[str, Any], source: ResourceIdentifier
-    ) -> list[ResourceRelationship]:
-        relationships: list[ResourceRelationship] = []
-        spec = resource.get("spec", {})
-        volumes = spec.get("volumes") or []
-
-        for volume in volumes:
+        for volume in spec.get("volumes") or ():
             volume_name = volume.get("name", "")
 
             config_map = volume.get("configMap")
             if config_map and isinstance(config_map, dict):
                 cm_name = config_map.get("name")
                 if cm_name:
-                    target = ResourceIdentifier(
-                        kind="ConfigMap",
-                        name=cm_name,
-                        namespace=source.namespace,
-                    )
-                    relationships.append(
-                        ResourceRelationship(
-                            source=source,
-                            target=target,
-                            relationship_type=RelationshipType.VOLUME,
-                            details=f"Mounts ConfigMap as volume '{volume_name}'",
-                        )
+                    add(
+                        "ConfigMap",
+                        cm_name,
+                        RelationshipType.VOLUME,
+                        f"Mounts ConfigMap as volume '{volume_name}'",
                     )
 
             secret = volume.get("secret")
             if secret and isinstance(secret, dict):
                 secret_name = secret.get("secretName")
                 if secret_name:
-                    target = ResourceIdentifier(
-                        kind="Secret",
-                        name=secret_name,
-                        namespace=source.namespace,
-                    )
-                    relationships.append(
-                        ResourceRelationship(
-                            source=source,
-                            target=target,
-                            relationship_type=RelationshipType.VOLUME,
-                            details=f"Mounts Secret as volume '{volume_name}'",
-                        )
+                    add(
+                        "Secret",
+                        secret_name,
+                        RelationshipType.VOLUME,
+                        f"Mounts Secret as volume '{volume_name}'",
                     )
 
             pvc = volume.get("persistentVolumeClaim")
             if pvc and isinstance(pvc, dict):
                 pvc_name = pvc.get("claimName")
                 if pvc_name:
-                    target = ResourceIdentifier(
-                        kind="PersistentVolumeClaim",
-                        name=pvc_name,
-                        namespace=source.namespace,
-                    )
-                    relationships.append(
-                        ResourceRelationship(
-                            source=source,
-                            target=target,
-                            relationship_type=RelationshipType.PVC,
-                            details=f"Uses PVC '{pvc_name}'",
-                        )
+                    add(
+                        "PersistentVolumeClaim",
+                        pvc_name,
+                        RelationshipType.PVC,
+                        f"Uses PVC '{pvc_name}'",
                     )
 
-        return relationships
-
-    def _discover_pod_env_from(
-        self, resource: dict[str, Any], source: ResourceIdentifier
-    ) -> list[ResourceRelationship]:
-        relationships: list[ResourceRelationship] = []
-        spec = resource.get("spec", {})
-        containers = (spec.get("containers") or []) + (spec.get("initContainers") or [])
-
-        for container in containers:
+        for container in itertools.chain(
+            spec.get("containers") or (), spec.get("initContainers") or ()
+        ):
             container_name = container.get("name", "")
 
-            env_from = container.get("envFrom") or []
-            for env_from_source in env_from:
+            for env_from_source in container.get("envFrom") or ():
                 cm_ref = env_from_source.get("configMapRef")
                 if cm_ref and isinstance(cm_ref, dict):
                     cm_name = cm_ref.get("name")
                     if cm_name:
-                        target = ResourceIdentifier(
-                            kind="ConfigMap",
-                            name=cm_name,
-                            namespace=source.namespace,
-                        )
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source,
-                                target=target,
-                                relationship_type=RelationshipType.ENV_FROM,
-                                details=f"Container '{container_name}' uses ConfigMap for env",
-                            )
+                        add(
+                            "ConfigMap",
+                            cm_name,
+                            RelationshipType.ENV_FROM,
+                            f"Container '{container_name}' uses ConfigMap for env",
                         )
 
                 secret_ref = env_from_source.get("secretRef")
                 if secret_ref and isinstance(secret_ref, dict):
                     secret_name = secret_ref.get("name")
                     if secret_name:
-                        target = ResourceIdentifier(
-                            kind="Secret",
-                            name=secret_name,
-                            namespace=source.namespace,
-                        )
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source,
-                                target=target,
-                                relationship_type=RelationshipType.ENV_FROM,
-                                details=f"Container '{container_name}' uses Secret for env",
-                            )
+                        add(
+                            "Secret",
+                            secret_name,
+                            RelationshipType.ENV_FROM,
+                            f"Container '{container_name}' uses Secret for env",
                         )
 
-            env = container.get("env") or []
-            for env_var in env:
-                value_from = env_var.get("valueFrom", {})
+            for env_var in container.get("env") or ():
+                value_from = env_var.get("valueFrom") or {}
 
                 cm_key_ref = value_from.get("configMapKeyRef")
                 if cm_key_ref and isinstance(cm_key_ref, dict):
                     cm_name = cm_key_ref.get("name")
                     if cm_name:
-                        target = ResourceIdentifier(
-                            kind="ConfigMap",
-                            name=cm_name,
-                            namespace=source.namespace,
-                        )
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source,
-                                target=target,
-                                relationship_type=RelationshipType.ENV_VAR,
-                                details=f"Container '{container_name}' uses ConfigMap key for env var",
-                            )
+                        add(
+                            "ConfigMap",
+                            cm_name,
+                            RelationshipType.ENV_VAR,
+                            f"Container '{container_name}' uses ConfigMap key for env var",
                         )
 
                 secret_key_ref = value_from.get("secretKeyRef")
                 if secret_key_ref and isinstance(secret_key_ref, dict):
                     secret_name = secret_key_ref.get("name")
                     if secret_name:
-                        target = ResourceIdentifier(
-                            kind="Secret",
-                            name=secret_name,
-                            namespace=source.namespace,
-                        )
-                        relationships.append(
-                            ResourceRelationship(
-                                source=source,
-                                target=target,
-                                relationship_type=RelationshipType.ENV_VAR,
-                                details=f"Container '{container_name}' uses Secret key for env var",
-                            )
+                        add(
+                            "Secret",
+                            secret_name,
+                            RelationshipType.ENV_VAR,
+                            f"Container '{container_name}' uses Secret key for env var",
                         )
 
         return relationships
 
     def _discover_ingress_relationships(
-        self, resource: dict[str, Any]
+        self, resource: dict[str, Any], source: ResourceIdentifier
     ) -> list[ResourceRelationship]:
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
+        spec = resource.get("spec") or {}
+        namespace = source.namespace
 
-        spec = resource.get("spec", {})
-
-        default_backend = spec.get("defaultBackend", {})
+        default_backend = spec.get("defaultBackend") or {}
         if default_backend:
-            service_name = default_backend.get("service", {}).get("name")
+            service_name = (default_backend.get("service") or {}).get("name")
             if service_name:
-                target = ResourceIdentifier(
-                    kind="Service",
-                    name=service_name,
-                    namespace=source.namespace,
-                )
                 relationships.append(
-                    ResourceRelationship(
-                        source=source,
-                        target=target,
-                        relationship_type=RelationshipType.INGRESS_BACKEND,
-                        details="Default backend service",
+                    self._relationship(
+                        source,
+                        "Service",
+                        service_name,
+                        namespace,
+                        RelationshipType.INGRESS_BACKEND,
+                        "Default backend service",
                     )
                 )
 
-        rules = spec.get("rules", [])
-        for rule in rules:
-            http = rule.get("http", {})
-            paths = http.get("paths", [])
-
-            for path in paths:
-                backend = path.get("backend", {})
-                service_name = backend.get("service", {}).get("name")
-                if service_name:
-                    target = ResourceIdentifier(
-                        kind="Service",
-                        name=service_name,
-                        namespace=source.namespace,
-                    )
-                    path_value = path.get("path", "/")
-                    relationships.append(
-                        ResourceRelationship(
-                            source=source,
-                            target=target,
-                            relationship_type=RelationshipType.INGRESS_BACKEND,
-                            details=f"Backend service for path '{path_value}'",
-                        )
-                    )
+        # (path, backend service) for every rule path that routes to a Service
+        path_backends = (
+            (path.get("path", "/"), service_name)
+            for rule in spec.get("rules") or ()
+            for path in (rule.get("http") or {}).get("paths") or ()
+            if (service_name := ((path.get("backend") or {}).get("service") or {}).get("name"))
+        )
+        relationships.extend(
+            self._relationship(
+                source,
+                "Service",
+                service_name,
+                namespace,
+                RelationshipType.INGRESS_BACKEND,
+                f"Backend service for path '{path_value}'",
+            )
+            for path_value, service_name in path_backends
+        )
 
         return relationships
 
-    def _discover_pvc_relationships(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
+    def _discover_pvc_relationships(
+        self, resource: dict[str, Any], source: ResourceIdentifier
+    ) -> list[ResourceRelationship]:
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         spec = resource.get("spec", {})
         storage_class_name = spec.get("storageClassName")
 
         if storage_class_name:
-            target = ResourceIdentifier(
-                kind="StorageClass",
-                name=storage_class_name,
-                namespace=None,
-            )
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.STORAGE_CLASS,
-                    details="Uses StorageClass",
+                self._relationship(
+                    source,
+                    "StorageClass",
+                    storage_class_name,
+                    None,
+                    RelationshipType.STORAGE_CLASS,
+                    "Uses StorageClass",
                 )
             )
 
         status = resource.get("status", {})
         volume_name = status.get("volumeName")
         if volume_name:
-            target = ResourceIdentifier(
-                kind="PersistentVolume",
-                name=volume_name,
-                namespace=None,
-            )
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.PV,
-                    details="Bound to PersistentVolume",
+                self._relationship(
+                    source,
+                    "PersistentVolume",
+                    volume_name,
+                    None,
+                    RelationshipType.PV,
+                    "Bound to PersistentVolume",
                 )
             )
 
         return relationships
 
-    def _discover_pv_relationships(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
+    def _discover_pv_relationships(
+        self, resource: dict[str, Any], source: ResourceIdentifier
+    ) -> list[ResourceRelationship]:
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         spec = resource.get("spec", {})
 
         claim_ref = spec.get("claimRef")
@@ -511,143 +454,119 @@ class NativeResourceDiscoverer(BaseDiscoverer):
             pvc_name = claim_ref.get("name")
             pvc_namespace = claim_ref.get("namespace")
             if pvc_name:
-                target = ResourceIdentifier(
-                    kind="PersistentVolumeClaim",
-                    name=pvc_name,
-                    namespace=pvc_namespace,
-                )
                 relationships.append(
-                    ResourceRelationship(
-                        source=source,
-                        target=target,
-                        relationship_type=RelationshipType.PVC,
-                        details="Bound to PVC",
+                    self._relationship(
+                        source,
+                        "PersistentVolumeClaim",
+                        pvc_name,
+                        pvc_namespace,
+                        RelationshipType.PVC,
+                        "Bound to PVC",
                     )
                 )
 
         storage_class_name = spec.get("storageClassName")
         if storage_class_name:
-            target = ResourceIdentifier(
-                kind="StorageClass",
-                name=storage_class_name,
-                namespace=None,
-            )
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.STORAGE_CLASS,
-                    details="Uses StorageClass",
+                self._relationship(
+                    source,
+                    "StorageClass",
+                    storage_class_name,
+                    None,
+                    RelationshipType.STORAGE_CLASS,
+                    "Uses StorageClass",
                 )
             )
 
         return relationships
 
     async def _discover_workload_relationships(
-        self, resource: dict[str, Any]
+        self, resource: dict[str, Any], source: ResourceIdentifier
     ) -> list[ResourceRelationship]:
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         spec = resource.get("spec", {})
         template = spec.get("template", {})
         template_spec = template.get("spec", {})
 
+        owned_kind = _OWNED_KIND.get(source.kind)
+        owned_task: asyncio.Task[list[ResourceRelationship]] | None = None
+        if self.client and owned_kind:
+            # Narrow the LIST server-side with the workload's own selector and
+            # start it now so it overlaps with the local work below.
+            match_labels = spec.get("selector", {}).get("matchLabels") or {}
+            label_selector = self._parse_label_selector(match_labels) if match_labels else None
+            owned_task = asyncio.create_task(
+                self._discover_owned_children(source, owned_kind, label_selector)
+            )
+
         service_account_name = template_spec.get("serviceAccountName") or template_spec.get(
             "serviceAccount"
         )
         # Only top-level workloads (Deployment, StatefulSet, DaemonSet) should have SA edges
         # ReplicaSets inherit SA from their template but don't "use" it directly
         if service_account_name and source.kind != "ReplicaSet":
-            target = ResourceIdentifier(
-                kind="ServiceAccount",
-                name=service_account_name,
-                namespace=source.namespace,
-            )
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.SERVICE_ACCOUNT,
-                    details=f"{source.kind} uses ServiceAccount",
+                self._relationship(
+                    source,
+                    "ServiceAccount",
+                    service_account_name,
+                    source.namespace,
+                    RelationshipType.SERVICE_ACCOUNT,
+                    f"{source.kind} uses ServiceAccount",
                 )
             )
 
-        if self.client and source.kind in ["Deployment", "StatefulSet", "DaemonSet"]:
-            owned_kind = "ReplicaSet" if source.kind == "Deployment" else "Pod"
+        if owned_task is not None:
             try:
-                owned_resources, _ = await self.client.list_resources(
-                    kind=owned_kind, namespace=source.namespace
-                )
-
-                source_name = source.name
-
-                for owned in owned_resources:
-                    owner_refs = owned.get("metadata", {}).get("ownerReferences", [])
-                    for owner_ref in owner_refs:
-                        if (
-                            owner_ref.get("name") == source_name
-                            and owner_ref.get("kind") == source.kind
-                        ):
-                            owned_metadata = owned.get("metadata", {})
-                            target = ResourceIdentifier(
-                                kind=owned_kind,
-                                name=owned_metadata.get("name"),
-                                namespace=owned_metadata.get("namespace"),
-                            )
-                            relationships.append(
-                                ResourceRelationship(
-                                    source=source,
-                                    target=target,
-                                    relationship_type=RelationshipType.OWNED,
-                                    details=f"{source.kind} owns {owned_kind}",
-                                )
-                            )
-                            break
+                relationships.extend(await owned_task)
             except Exception as e:
                 logger.debug(
                     f"Error discovering owned resources for {source.kind}/{source.name}: {e}"
                 )
 
-        elif self.client and source.kind == "ReplicaSet":
-            try:
-                pods, _ = await self.client.list_resources(kind="Pod", namespace=source.namespace)
-
-                source_name = source.name
-
-                for pod in pods:
-                    owner_refs = pod.get("metadata", {}).get("ownerReferences", [])
-                    for owner_ref in owner_refs:
-                        if (
-                            owner_ref.get("name") == source_name
-                            and owner_ref.get("kind") == "ReplicaSet"
-                        ):
-                            pod_metadata = pod.get("metadata", {})
-                            target = ResourceIdentifier(
-                                kind="Pod",
-                                name=pod_metadata.get("name"),
-                                namespace=pod_metadata.get("namespace"),
-                            )
-                            relationships.append(
-                                ResourceRelationship(
-                                    source=source,
-                                    target=target,
-                                    relationship_type=RelationshipType.OWNED,
-                                    details="ReplicaSet owns Pod",
-                                )
-                            )
-                            break  # Break inner loop after finding matching owner ref
-            except Exception as e:
-                logger.debug(f"Error discovering owned Pods for ReplicaSet/{source.name}: {e}")
+        return relationships
+
+    async def _discover_owned_children(
+        self, source: ResourceIdentifier, owned_kind: str, label_selector: str | None
+    ) -> list[ResourceRelationship]:
+        """
+        Stream a workload's selector-matched children and keep the ones it owns.
+
+        The LIST is specific to this workload's selector, so it is streamed page
+        by page rather than cached; only the matching children are retained.
+        """
+        relationships: list[ResourceRelationship] = []
+        source_kind = source.kind
+        source_name = source.name
+
+        async for owned in self._iter_resources(
+            owned_kind, namespace=source.namespace, label_selector=label_selector
+        ):
+            owned_metadata = owned.get("metadata", {})
+            owned_name = owned_metadata.get("name")
+            # The ownerReferences check guards against selector overlap
+            if not owned_name or not any(
+                owner_ref.get("name") == source_name and owner_ref.get("kind") == source_kind
+                for owner_ref in owned_metadata.get("ownerReferences") or ()
+            ):
+                continue
+
+            relationships.append(
+                self._relationship(
+                    source,
+                    owned_kind,
+                    owned_name,
+                    owned_metadata.get("namespace"),
+                    RelationshipType.OWNED,
+                    f"{source_kind} owns {owned_kind}",
+                )
+            )
 
         return relationships
 
     async def _discover_job_relationships(
-        self, resource: dict[str, Any]
+        self, resource: dict[str, Any], source: ResourceIdentifier
     ) -> list[ResourceRelationship]:
         """
         Discover relationships for Job resources.
@@ -659,11 +578,6 @@ class NativeResourceDiscoverer(BaseDiscoverer):
         """
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         spec = resource.get("spec", {})
         template = spec.get("template", {})
         template_spec = template.get("spec", {})
@@ -672,52 +586,45 @@ class NativeResourceDiscoverer(BaseDiscoverer):
             "serviceAccount"
         )
         if service_account_name:
-            target = ResourceIdentifier(
-                kind="ServiceAccount",
-                name=service_account_name,
-                namespace=source.namespace,
-            )
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.SERVICE_ACCOUNT,
-                    details="Job uses ServiceAccount",
+                self._relationship(
+                    source,
+                    "ServiceAccount",
+                    service_account_name,
+                    source.namespace,
+                    RelationshipType.SERVICE_ACCOUNT,
+                    "Job uses ServiceAccount",
                 )
             )
 
         if self.client:
             try:
-                pods, _ = await self.client.list_resources(kind="Pod", namespace=source.namespace)
-
-                source_name = source.name
-
-                for pod in pods:
-                    owner_refs = pod.get("metadata", {}).get("ownerReferences", [])
-                    for owner_ref in owner_refs:
-                        if owner_ref.get("name") == source_name and owner_ref.get("kind") == "Job":
-                            pod_metadata = pod.get("metadata", {})
-                            target = ResourceIdentifier(
-                                kind="Pod",
-                                name=pod_metadata.get("name"),
-                                namespace=pod_metadata.get("namespace"),
-                            )
-                            relationships.append(
-                                ResourceRelationship(
-                                    source=source,
-                                    target=target,
-                                    relationship_type=RelationshipType.OWNED,
-                                    details="Job owns Pod",
-                                )
-                            )
-                            break
+                owner_index = await self._lists().owner_index(
+                    kind="Pod", namespace=source.namespace
+                )
+
+                for pod in owner_index.children("Job", source.name):
+                    pod_metadata = pod.get("metadata", {})
+                    pod_name = pod_metadata.get("name")
+                    if not pod_name:
+                        continue
+                    relationships.append(
+                        self._relationship(
+                            source,
+                            "Pod",
+                            pod_name,
+                            pod_metadata.get("namespace"),
+                            RelationshipType.OWNED,
+                            "Job owns Pod",
+                        )
+                    )
             except Exception as e:
                 logger.debug(f"Error discovering owned Pods for Job/{source.name}: {e}")
 
         return relationships
 
     async def _discover_cronjob_relationships(
-        self, resource: dict[str, Any]
+        self, resource: dict[str, Any], source: ResourceIdentifier
     ) -> list[ResourceRelationship]:
         """
         Discover relationships for CronJob resources.
@@ -728,11 +635,6 @@ class NativeResourceDiscoverer(BaseDiscoverer):
         """
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         spec = resource.get("spec", {})
         job_template = spec.get("jobTemplate", {})
         job_spec = job_template.get("spec", {})
@@ -743,54 +645,46 @@ class NativeResourceDiscoverer(BaseDiscoverer):
             "serviceAccount"
         )
         if service_account_name:
-            target = ResourceIdentifier(
-                kind="ServiceAccount",
-                name=service_account_name,
-                namespace=source.namespace,
-            )
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.SERVICE_ACCOUNT,
-                    details="CronJob uses ServiceAccount",
+                self._relationship(
+                    source,
+                    "ServiceAccount",
+                    service_account_name,
+                    source.namespace,
+                    RelationshipType.SERVICE_ACCOUNT,
+                    "CronJob uses ServiceAccount",
                 )
             )
 
         if self.client:
             try:
-                jobs, _ = await self.client.list_resources(kind="Job", namespace=source.namespace)
-
-                source_name = source.name
-
-                for job in jobs:
-                    owner_refs = job.get("metadata", {}).get("ownerReferences", [])
-                    for owner_ref in owner_refs:
-                        if (
-                            owner_ref.get("name") == source_name
-                            and owner_ref.get("kind") == "CronJob"
-                        ):
-                            job_metadata = job.get("metadata", {})
-                            target = ResourceIdentifier(
-                                kind="Job",
-                                name=job_metadata.get("name"),
-                                namespace=job_metadata.get("namespace"),
-                            )
-                            relationships.append(
-                                ResourceRelationship(
-                                    source=source,
-                                    target=target,
-                                    relationship_type=RelationshipType.OWNED,
-                                    details="CronJob creates Job",
-                                )
-                            )
-                            break
+                owner_index = await self._lists().owner_index(
+                    kind="Job", namespace=source.namespace
+                )
+
+                for job in owner_index.children("CronJob", source.name):
+                    job_metadata = job.get("metadata", {})
+                    job_name = job_metadata.get("name")
+                    if not job_name:
+                        continue
+                    relationships.append(
+                        self._relationship(
+                            source,
+                            "Job",
+                            job_name,
+                            job_metadata.get("namespace"),
+                            RelationshipType.OWNED,
+                            "CronJob creates Job",
+                        )
+                    )
             except Exception as e:
                 logger.debug(f"Error discovering owned Jobs for CronJob/{source.name}: {e}")
 
         return relationships
 
-    def _discover_hpa_relationships(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
+    def _discover_hpa_relationships(
+        self, resource: dict[str, Any], source: ResourceIdentifier
+    ) -> list[ResourceRelationship]:
         """
         Discover relationships for HorizontalPodAutoscaler resources.
 
@@ -798,11 +692,6 @@ class NativeResourceDiscoverer(BaseDiscoverer):
         """
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         spec = resource.get("spec", {})
         scale_target_ref = spec.get("scaleTargetRef", {})
 
@@ -810,24 +699,23 @@ class NativeResourceDiscoverer(BaseDiscoverer):
         target_name = scale_target_ref.get("name")
 
         if target_kind and target_name:
-            target = ResourceIdentifier(
-                kind=target_kind,
-                name=target_name,
-                namespace=source.namespace,
-                api_version=scale_target_ref.get("apiVersion"),
-            )
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.AUTOSCALING,
-                    details=f"HPA scales {target_kind}",
+                self._relationship(
+                    source,
+                    target_kind,
+                    target_name,
+                    source.namespace,
+                    RelationshipType.AUTOSCALING,
+                    f"HPA scales {target_kind}",
+                    api_version=scale_target_ref.get("apiVersion"),
                 )
             )
 
         return relationships
 
-    def _discover_pdb_relationships(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
+    def _discover_pdb_relationships(
+        self, resource: dict[str, Any], source: ResourceIdentifier
+    ) -> list[ResourceRelationship]:
         """
         Discover relationships for PodDisruptionBudget resources.
 
@@ -835,11 +723,6 @@ class NativeResourceDiscoverer(BaseDiscoverer):
         """
         relationships: list[ResourceRelationship] = []
 
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
         spec = resource.get("spec", {})
         selector = spec.get("selector", {})
 
@@ -848,17 +731,15 @@ class NativeResourceDiscoverer(BaseDiscoverer):
 
         match_labels = selector.get("matchLabels", {})
         if match_labels:
-            target = ResourceIdentifier(
-                kind="Pod",
-                name=f"*[{self._parse_label_selector(match_labels)}]",
-                namespace=source.namespace,
-            )
+            selector_str = self._parse_label_selector(match_labels)
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.POD_DISRUPTION_BUDGET,
-                    details=f"PDB protects pods with labels: {self._parse_label_selector(match_labels)}",
+                self._relationship(
+                    source,
+                    "Pod",
+                    f"*[{selector_str}]",
+                    source.namespace,
+                    RelationshipType.POD_DISRUPTION_BUDGET,
+                    f"PDB protects pods with labels: {selector_str}",
                 )
             )
 
@@ -5,7 +5,6 @@ from k8s_graph.discoverers.base import BaseDiscoverer
 from k8s_graph.models import (
     DiscovererCategory,
     RelationshipType,
-    ResourceIdentifier,
     ResourceRelationship,
 )
 from k8s_graph.protocols import K8sClientProtocol
@@ -23,6 +22,9 @@ class NetworkPolicyDiscoverer(BaseDiscoverer):
     - Egress destinations (via egress.to)
     """
 
+    supports_by_type = True
+    supported_kinds = frozenset({"NetworkPolicy"})
+
     def __init__(self, client: K8sClientProtocol | None = None) -> None:
         super().__init__(client)
 
@@ -47,17 +49,15 @@ class NetworkPolicyDiscoverer(BaseDiscoverer):
         match_labels = pod_selector.get("matchLabels", {})
 
         if match_labels:
-            target = ResourceIdentifier(
-                kind="Pod",
-                name=f"*[{self._parse_label_selector(match_labels)}]",
-                namespace=source.namespace,
-            )
+            selector_str = self._parse_label_selector(match_labels)
             relationships.append(
-                ResourceRelationship(
-                    source=source,
-                    target=target,
-                    relationship_type=RelationshipType.NETWORK_POLICY,
-                    details=f"Applies to pods with labels: {self._parse_label_selector(match_labels)}",
+                self._relationship(
+                    source,
+                    "Pod",
+                    f"*[{selector_str}]",
+                    source.namespace,
+                    RelationshipType.NETWORK_POLICY,
+                    f"Applies to pods with labels: {selector_str}",
                 )
             )
 
@@ -69,17 +69,15 @@ class NetworkPolicyDiscoverer(BaseDiscoverer):
                 if pod_selector:
                     match_labels = pod_selector.get("matchLabels", {})
                     if match_labels:
-                        target = ResourceIdentifier(
-                            kind="Pod",
-                            name=f"*[{self._parse_label_selector(match_labels)}]",
-                            namespace=source.namespace,
-                        )
+                        selector_str = self._parse_label_selector(match_labels)
                         relationships.append(
-                            ResourceRelationship(
-                                source=source,
-                                target=target,
-                                relationship_type=RelationshipType.NETWORK_POLICY_INGRESS,
-                                details=f"Allows ingress from pods: {self._parse_label_selector(match_labels)}",
+                            self._relationship(
+                                source,
+                                "Pod",
+                                f"*[{selector_str}]",
+                                source.namespace,
+                                RelationshipType.NETWORK_POLICY_INGRESS,
+                                f"Allows ingress from pods: {selector_str}",
                             )
                         )
 
@@ -91,17 +89,15 @@ class NetworkPolicyDiscoverer(BaseDiscoverer):
                 if pod_selector:
                     match_labels = pod_selector.get("matchLabels", {})
                     if match_labels:
-                        target = ResourceIdentifier(
-                            kind="Pod",
-                            name=f"*[{self._parse_label_selector(match_labels)}]",
-                            namespace=source.namespace,
-                        )
+                        selector_str = self._parse_label_selector(match_labels)
                         relationships.append(
-                            ResourceRelationship(
-                                source=source,
-                                target=target,
-                                relationship_type=RelationshipType.NETWORK_POLICY_EGRESS,
-                                details=f"Allows egress to pods: {self._parse_label_selector(match_labels)}",
+                            self._relationship(
+                                source,
+                                "Pod",
+                                f"*[{selector_str}]",
+                                source.namespace,
+                                RelationshipType.NETWORK_POLICY_EGRESS,
+                                f"Allows egress to pods: {selector_str}",
                             )
                         )
 
@@ -12,6 +12,22 @@ from k8s_graph.protocols import K8sClientProtocol
 
 logger = logging.getLogger(__name__)
 
+# Binding kind -> (relationship type, namespaced, roleRef details, ServiceAccount details)
+_BINDING_RULES: dict[str, tuple[RelationshipType, bool, str, str]] = {
+    "RoleBinding": (
+        RelationshipType.ROLE_BINDING,
+        True,
+        "Binds {role_kind} to subjects",
+        "Grants permissions to ServiceAccount",
+    ),
+    "ClusterRoleBinding": (
+        RelationshipType.CLUSTER_ROLE_BINDING,
+        False,
+        "Binds {role_kind} to subjects cluster-wide",
+        "Grants cluster-wide permissions to ServiceAccount",
+    ),
+}
+
 
 class RBACDiscoverer(BaseDiscoverer):
     """
@@ -24,36 +40,34 @@ class RBACDiscoverer(BaseDiscoverer):
     - ClusterRoleBinding -> ServiceAccount + ClusterRole
     """
 
+    supports_by_type = True
+    supported_kinds = frozenset(
+        {"RoleBinding", "ClusterRoleBinding", "ServiceAccount", "Role", "ClusterRole"}
+    )
+
     def __init__(self, client: K8sClientProtocol | None = None) -> None:
         super().__init__(client)
 
     def supports(self, resource: dict[str, Any]) -> bool:
-        kind = resource.get("kind", "")
-        return kind in [
-            "RoleBinding",
-            "ClusterRoleBinding",
-            "ServiceAccount",
-            "Role",
-            "ClusterRole",
-        ]
+        return resource.get("kind", "") in self.supported_kinds
 
     @property
     def categories(self) -> DiscovererCategory:
         return DiscovererCategory.RBAC
 
     async def discover(self, resource: dict[str, Any]) -> list[ResourceRelationship]:
-        relationships = []
-        kind = resource.get("kind")
-
-        if kind == "RoleBinding":
-            relationships.extend(self._discover_role_binding_relationships(resource))
-        elif kind == "ClusterRoleBinding":
-            relationships.extend(self._discover_cluster_role_binding_relationships(resource))
-
-        return relationships
-
-    def _discover_role_binding_relationships(
-        self, resource: dict[str, Any]
+        rule = _BINDING_RULES.get(resource.get("kind", ""))
+        if rule is None:
+            return []
+        return self._discover_binding_relationships(resource, *rule)
+
+    def _discover_binding_relationships(
+        self,
+        resource: dict[str, Any],
+        relationship_type: RelationshipType,
+        namespaced: bool,
+        role_details: str,
+        subject_details: str,
     ) -> list[ResourceRelationship]:
         relationships: list[ResourceRelationship] = []
 
@@ -62,6 +76,9 @@ class RBACDiscoverer(BaseDiscoverer):
         except ValueError:
             return relationships
 
+        # RoleBindings resolve roles and subjects in their own namespace
+        namespace = source.namespace if namespaced else None
+
         role_ref = resource.get("roleRef", {})
         role_kind = role_ref.get("kind")
         role_name = role_ref.get("name")
@@ -70,90 +87,35 @@ class RBACDiscoverer(BaseDiscoverer):
             target = ResourceIdentifier(
                 kind=role_kind,
                 name=role_name,
-                namespace=source.namespace,
+                namespace=namespace,
                 api_version=role_ref.get("apiGroup"),
             )
             relationships.append(
                 ResourceRelationship(
                     source=source,
                     target=target,
-                    relationship_type=RelationshipType.ROLE_BINDING,
-                    details=f"Binds {role_kind} to subjects",
+                    relationship_type=relationship_type,
+                    details=role_details.format(role_kind=role_kind),
                 )
             )
 
-        subjects = resource.get("subjects", [])
-        for subject in subjects:
-            subject_kind = subject.get("kind")
+        for subject in resource.get("subjects") or ():
             subject_name = subject.get("name")
-            subject_namespace = subject.get("namespace", source.namespace)
+            if subject.get("kind") != "ServiceAccount" or not subject_name:
+                continue
 
-            if subject_kind == "ServiceAccount" and subject_name:
-                target = ResourceIdentifier(
-                    kind="ServiceAccount",
-                    name=subject_name,
-                    namespace=subject_namespace,
-                )
-                relationships.append(
-                    ResourceRelationship(
-                        source=source,
-                        target=target,
-                        relationship_type=RelationshipType.ROLE_BINDING,
-                        details="Grants permissions to ServiceAccount",
-                    )
-                )
-
-        return relationships
-
-    def _discover_cluster_role_binding_relationships(
-        self, resource: dict[str, Any]
-    ) -> list[ResourceRelationship]:
-        relationships: list[ResourceRelationship] = []
-
-        try:
-            source = self._extract_resource_identifier(resource)
-        except ValueError:
-            return relationships
-
-        role_ref = resource.get("roleRef", {})
-        role_kind = role_ref.get("kind")
-        role_name = role_ref.get("name")
-
-        if role_kind and role_name:
             target = ResourceIdentifier(
-                kind=role_kind,
-                name=role_name,
-                namespace=None,
-                api_version=role_ref.get("apiGroup"),
+                kind="ServiceAccount",
+                name=subject_name,
+                namespace=subject.get("namespace", namespace),
             )
             relationships.append(
                 ResourceRelationship(
                     source=source,
                     target=target,
-                    relationship_type=RelationshipType.CLUSTER_ROLE_BINDING,
-                    details=f"Binds {role_kind} to subjects cluster-wide",
+                    relationship_type=relationship_type,
+                    details=subject_details,
                 )
             )
 
-        subjects = resource.get("subjects", [])
-        for subject in subjects:
-            subject_kind = subject.get("kind")
-            subject_name = subject.get("name")
-            subject_namespace = subject.get("namespace")
-
-            if subject_kind == "ServiceAccount" and subject_name:
-                target = ResourceIdentifier(
-                    kind="ServiceAccount",
-                    name=subject_name,
-                    namespace=subject_namespace,
-                )
-                relationships.append(
-                    ResourceRelationship(
-                        source=source,
-                        target=target,
-                        relationship_type=RelationshipType.CLUSTER_ROLE_BINDING,
-                        details="Grants cluster-wide permissions to ServiceAccount",
-                    )
-                )
-
         return relationships
@@ -1,3 +1,4 @@
+import bisect
 import logging
 from typing import Any, Optional
 
@@ -7,6 +8,11 @@ from k8s_graph.protocols import DiscovererProtocol
 logger = logging.getLogger(__name__)
 
 
+def _descending_priority(discoverer: DiscovererProtocol) -> int:
+    """Sort key placing higher-priority discoverers first."""
+    return -discoverer.priority
+
+
 class DiscovererRegistry:
     """
     Registry for relationship discoverers with priority-based selection.
@@ -46,6 +52,10 @@ class DiscovererRegistry:
         """Initialize an empty registry."""
         self._discoverers: list[DiscovererProtocol] = []
         self._overrides: dict[str, DiscovererProtocol] = {}
+        # (id(discoverer), kind, apiVersion) -> supports() result, for supports_by_type discoverers
+        self._supports_cache: dict[tuple[int, Any, Any], bool] = {}
+        # kind -> general discoverers that may support it (priority order), built lazily
+        self._by_kind: dict[Any, list[DiscovererProtocol]] = {}
         self._initialized = False
 
     @classmethod
@@ -90,9 +100,10 @@ class DiscovererRegistry:
                 f"Registering general discoverer: {discoverer.__class__.__name__} "
                 f"(priority: {discoverer.priority})"
             )
-            self._discoverers.append(discoverer)
-
-            self._discoverers.sort(key=lambda d: d.priority, reverse=True)
+            # Keep the list ordered by descending priority; ties stay in registration order
+            bisect.insort(self._discoverers, discoverer, key=_descending_priority)
+            self._supports_cache.clear()
+            self._by_kind.clear()
 
         CRDRegistry.get_global().register_handler(discoverer)
 
@@ -121,7 +132,20 @@ class DiscovererRegistry:
             logger.debug(f"Using override discoverer for kind {kind}")
             return [self._overrides[kind]]
 
-        matching = [d for d in self._discoverers if d.supports(resource)]
+        api_version = resource.get("apiVersion")
+        cache = self._supports_cache
+        matching = []
+        for d in self._candidates_for_kind(kind):
+            if not getattr(d, "supports_by_type", False):
+                if d.supports(resource):
+                    matching.append(d)
+                continue
+            key = (id(d), kind, api_version)
+            supported = cache.get(key)
+            if supported is None:
+                supported = cache[key] = d.supports(resource)
+            if supported:
+                matching.append(d)
 
         if matching:
             logger.debug(
@@ -133,6 +157,17 @@ class DiscovererRegistry:
 
         return matching
 
+    def _candidates_for_kind(self, kind: Any) -> list[DiscovererProtocol]:
+        """General discoverers whose supported_kinds allow this kind, in priority order."""
+        candidates = self._by_kind.get(kind)
+        if candidates is None:
+            candidates = self._by_kind[kind] = [
+                d
+                for d in self._discoverers
+                if (kinds := getattr(d, "supported_kinds", None)) is None or kind in kinds
+            ]
+        return candidates
+
     def clear(self) -> None:
         """
         Clear all registered discoverers.
@@ -141,9 +176,23 @@ class DiscovererRegistry:
         """
         self._discoverers.clear()
         self._overrides.clear()
+        self._supports_cache.clear()
+        self._by_kind.clear()
         self._initialized = False
         logger.debug("Registry cleared")
 
+    def clear_caches(self) -> None:
+        """
+        Drop results that registered discoverers cached during earlier discovery.
+
+        Calls ``clear_cache()`` on every discoverer that has one.
+        GraphBuilder calls this at the start of each build.
+        """
+        for discoverer in [*self._discoverers, *self._overrides.values()]:
+            clear_cache = getattr(discoverer, "clear_cache", None)
+            if clear_cache is not None:
+                clear_cache()
+
     def _register_builtin(self) -> None:
         """
         Register built-in discoverers.
@@ -18,6 +18,7 @@ class UnifiedDiscoverer:
 
     Features:
     - Parallel discovery execution (using asyncio.gather)
+    - Bounded fan-out across many resources (discover_many)
     - Graceful error handling (one failing discoverer doesn't break others)
     - Filtering based on DiscoveryOptions
     - Statistics collection
@@ -30,7 +31,10 @@ class UnifiedDiscoverer:
     """
 
     def __init__(
-        self, client: K8sClientProtocol, registry: DiscovererRegistry | None = None
+        self,
+        client: K8sClientProtocol,
+        registry: DiscovererRegistry | None = None,
+        max_concurrency: int = 16,
     ) -> None:
         """
         Initialize the unified discoverer.
@@ -38,9 +42,11 @@ class UnifiedDiscoverer:
         Args:
             client: K8s client for API access
             registry: Optional discoverer registry (uses global if None)
+            max_concurrency: Maximum number of resources discover_many() works on at once
         """
         self.client = client
         self.registry = registry or DiscovererRegistry.get_global()
+        self.max_concurrency = max_concurrency
         self._discovery_stats: dict[str, Any] = {
             "discoveries": 0,
             "errors": 0,
@@ -81,11 +87,19 @@ class UnifiedDiscoverer:
             logger.debug(f"No discoverers matched filters for {resource.get('kind')}")
             return []
 
-        tasks = []
-        for discoverer in filtered_discoverers:
-            tasks.append(self._safe_discover(discoverer, resource))
+        # Discoverers that can answer synchronously skip the coroutine round-trip
+        results: list[Any] = []
+        pending: dict[int, Any] = {}
+        for i, discoverer in enumerate(filtered_discoverers):
+            relationships = self._safe_discover_sync(discoverer, resource)
+            if relationships is None:
+                pending[i] = self._safe_discover(discoverer, resource)
+            results.append(relationships)
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if pending:
+            awaited = await asyncio.gather(*pending.values(), return_exceptions=True)
+            for i, result in zip(pending, awaited, strict=True):
+                results[i] = result
 
         all_relationships: list[ResourceRelationship] = []
         for i, result in enumerate(results):
@@ -103,6 +117,52 @@ class UnifiedDiscoverer:
 
         return all_relationships
 
+    async def discover_many(
+        self,
+        resources: list[dict[str, Any]],
+        options: DiscoveryOptions | None = None,
+    ) -> list[list[ResourceRelationship]]:
+        """
+        Discover relationships for several resources concurrently.
+
+        Discovery is mostly waiting on API round-trips, so resources are
+        processed as tasks gated by a semaphore of ``max_concurrency`` slots
+        rather than one after another.
+
+        Args:
+            resources: Kubernetes resource dictionaries
+            options: Optional discovery options to filter discoverers
+
+        Returns:
+            One list of relationships per input resource, in input order.
+            A resource whose discovery raised gets an empty list.
+
+        Example:
+            >>> batches = await unified.discover_many([deployment, service])
+            >>> deployment_rels, service_rels = batches
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _bounded(resource: dict[str, Any]) -> list[ResourceRelationship]:
+            async with semaphore:
+                return await self.discover_all_relationships(resource, options)
+
+        tasks = [asyncio.create_task(_bounded(resource)) for resource in resources]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        batches: list[list[ResourceRelationship]] = []
+        for resource, result in zip(resources, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.debug(
+                    f"Discovery failed for {resource.get('kind')}/"
+                    f"{resource.get('metadata', {}).get('name', 'unknown')}: {result}"
+                )
+                batches.append([])
+            else:
+                batches.append(result)
+
+        return batches
+
     def _filter_discoverers(
         self,
         discoverers: list[Any],
@@ -143,6 +203,39 @@ class UnifiedDiscoverer:
 
         return filtered
 
+    def _inject_client(self, discoverer: Any) -> None:
+        """Give a registry discoverer without a client access to the K8s API."""
+        if hasattr(discoverer, "client") and discoverer.client is None:
+            discoverer.client = self.client
+            logger.debug(f"Injected client into {discoverer.__class__.__name__}")
+
+    def _safe_discover_sync(
+        self, discoverer: Any, resource: dict[str, Any]
+    ) -> list[ResourceRelationship] | None:
+        """
+        Run a discoverer's synchronous fast path, if it has one.
+
+        Args:
+            discoverer: Discoverer instance
+            resource: Resource to discover relationships for
+
+        Returns:
+            List of relationships, empty list on error, or None when the
+            discoverer needs its async discover()
+        """
+        discover_sync = getattr(discoverer, "discover_sync", None)
+        if discover_sync is None:
+            return None
+
+        try:
+            self._inject_client(discoverer)
+            return discover_sync(resource)  # type: ignore[no-any-return]
+        except Exception as e:
+            logger.error(
+                f"Error in {discoverer.__class__.__name__}.discover_sync(): {e}", exc_info=True
+            )
+            return []
+
     async def _safe_discover(
         self, discoverer: Any, resource: dict[str, Any]
     ) -> list[ResourceRelationship]:
@@ -160,12 +253,7 @@ class UnifiedDiscoverer:
             List of relationships or empty list on error
         """
         try:
-            # Inject client if discoverer doesn't have one
-            # This allows registry discoverers to access the K8s API
-            if hasattr(discoverer, "client") and discoverer.client is None:
-                discoverer.client = self.client
-                logger.debug(f"Injected client into {discoverer.__class__.__name__}")
-
+            self._inject_client(discoverer)
             relationships = await discoverer.discover(resource)
             logger.debug(
                 f"{discoverer.__class__.__name__} found {len(relationships)} relationships "
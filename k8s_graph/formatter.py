@@ -1,26 +1,67 @@
+import io
 import json
 import logging
-from typing import Any
+import math
+from collections import Counter
+from collections.abc import Iterator
+from typing import Any, TextIO
 
 import networkx as nx
 
+from k8s_graph._dot import dot_escape, dot_quote
+from k8s_graph.query import find_by_namespace
+
+try:
+    import orjson
+
+    _has_orjson = True
+except ImportError:
+    _has_orjson = False
+
 logger = logging.getLogger(__name__)
 
 
+def _finite(value: Any) -> Any:
+    """Replace NaN and infinite floats with None, as orjson writes them as null."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, list | tuple):
+        return [_finite(item) for item in value]
+    return value
+
+
+def _dumps(output: dict[str, Any]) -> str:
+    """
+    Serialize to indented JSON, with orjson when it is installed.
+
+    Values JSON can't represent fall back to str(), datetimes included. The
+    stdlib path keeps non-ASCII text unescaped and writes NaN and infinities
+    as null, so both paths produce the same JSON document.
+    """
+    if _has_orjson:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        return orjson.dumps(output, default=str, option=options).decode()
+    return json.dumps(_finite(output), indent=2, default=str, ensure_ascii=False)
+
+
 def format_graph_output(
     graph: nx.DiGraph,
     format_type: str = "json",
     include_metadata: bool = True,
     pod_sampling_info: dict[str, Any] | None = None,
+    namespace: str | None = None,
 ) -> str:
     """
     Format graph for output in various formats.
 
     Args:
         graph: NetworkX directed graph
-        format_type: Output format - 'json', 'llm', or 'minimal'
+        format_type: Output format - 'json', 'llm', 'minimal', or 'dot'
         include_metadata: Whether to include graph metadata
         pod_sampling_info: Optional pod sampling information
+        namespace: Only format the resources in this namespace
 
     Returns:
         Formatted string output
@@ -29,17 +70,25 @@ def format_graph_output(
         - 'json': Full JSON representation with all node/edge data
         - 'llm': LLM-friendly format with natural language descriptions
         - 'minimal': Minimal JSON with just kind/name/relationships
+        - 'dot': Graphviz DOT text, as written by export_to_dot()
 
     Example:
         >>> output = format_graph_output(graph, format_type='json')
         >>> print(output)
     """
+    if namespace is not None:
+        graph = graph.subgraph(find_by_namespace(graph, namespace))
+
     if format_type == "json":
         return _format_json(graph, include_metadata, pod_sampling_info)
     elif format_type == "llm":
         return _format_llm_friendly(graph, include_metadata, pod_sampling_info)
     elif format_type == "minimal":
         return _format_minimal(graph, include_metadata)
+    elif format_type == "dot":
+        buf = io.StringIO()
+        _write_dot(graph, buf)
+        return buf.getvalue()
     else:
         raise ValueError(f"Unknown format type: {format_type}")
 
@@ -76,73 +125,101 @@ def _format_json(
 
         output["metadata"] = metadata
 
-    return json.dumps(output, indent=2, default=str)
+    return _dumps(output)
+
+
+def format_graph_output_stream(
+    graph: nx.DiGraph,
+    sink: TextIO,
+    include_metadata: bool = True,
+    pod_sampling_info: dict[str, Any] | None = None,
+) -> None:
+    """
+    Write the 'llm' format to a text sink section by section.
+
+    Produces the same text as format_graph_output(graph, format_type='llm')
+    without holding the whole document in memory.
+
+    Args:
+        graph: NetworkX directed graph
+        sink: Writable text stream (open file, io.StringIO, sys.stdout, ...)
+        include_metadata: Whether to include graph metadata
+        pod_sampling_info: Optional pod sampling information
+
+    Example:
+        >>> with open("graph.md", "w") as f:
+        ...     format_graph_output_stream(graph, f)
+    """
+    lines = _iter_llm_lines(graph, include_metadata, pod_sampling_info)
+    sink.write(next(lines))
+    for line in lines:
+        sink.write(f"\n{line}")
 
 
 def _format_llm_friendly(
     graph: nx.DiGraph, include_metadata: bool, pod_sampling_info: dict[str, Any] | None
 ) -> str:
     """Format graph in LLM-friendly natural language."""
-    lines: list[str] = []
+    return "\n".join(_iter_llm_lines(graph, include_metadata, pod_sampling_info))
+
 
+def _iter_llm_lines(
+    graph: nx.DiGraph, include_metadata: bool, pod_sampling_info: dict[str, Any] | None
+) -> Iterator[str]:
+    """Yield the lines of the LLM-friendly format, without trailing newlines."""
     if include_metadata:
-        lines.append("# Kubernetes Resource Graph\n")
-        lines.append(f"Total Resources: {graph.number_of_nodes()}")
-        lines.append(f"Total Relationships: {graph.number_of_edges()}\n")
+        yield "# Kubernetes Resource Graph\n"
+        yield f"Total Resources: {graph.number_of_nodes()}"
+        yield f"Total Relationships: {graph.number_of_edges()}\n"
 
         if pod_sampling_info:
             sampled = pod_sampling_info.get("sampled_count", 0)
             total = pod_sampling_info.get("total_count", 0)
             if sampled > 0:
-                lines.append(
+                yield (
                     f"Note: Pod sampling active - showing {sampled} representative pods "
                     f"out of {total} total\n"
                 )
 
-    kinds: dict[str, int] = {}
-    for _, attrs in graph.nodes(data=True):
-        kind = attrs.get("kind", "Unknown")
-        kinds[kind] = kinds.get(kind, 0) + 1
+    kinds = Counter(attrs.get("kind", "Unknown") for _, attrs in graph.nodes(data=True))
 
-    lines.append("## Resources by Kind")
+    yield "## Resources by Kind"
     for kind, count in sorted(kinds.items()):
-        lines.append(f"- {kind}: {count}")
-    lines.append("")
+        yield f"- {kind}: {count}"
+    yield ""
 
-    lines.append("## Resources\n")
+    yield "## Resources\n"
     for node_id, attrs in sorted(graph.nodes(data=True)):
         kind = attrs.get("kind", "Unknown")
         name = attrs.get("name", "unknown")
         namespace = attrs.get("namespace", "cluster")
 
-        lines.append(f"### {kind}: {name} (namespace: {namespace})")
+        yield f"### {kind}: {name} (namespace: {namespace})"
 
         phase = attrs.get("phase")
         if phase:
-            lines.append(f"  Status: {phase}")
+            yield f"  Status: {phase}"
 
         service_type = attrs.get("service_type")
         if service_type:
-            lines.append(f"  Type: {service_type}")
+            yield f"  Type: {service_type}"
 
         replicas = attrs.get("replicas")
         if replicas is not None:
             ready = attrs.get("ready_replicas", 0)
-            lines.append(f"  Replicas: {ready}/{replicas}")
+            yield f"  Replicas: {ready}/{replicas}"
 
         out_edges = list(graph.out_edges(node_id, data=True))
         if out_edges:
-            lines.append("  Relationships:")
+            yield "  Relationships:"
             for _, target, edge_attrs in out_edges:
                 target_attrs = graph.nodes[target]
                 target_kind = target_attrs.get("kind", "Unknown")
                 target_name = target_attrs.get("name", "unknown")
                 rel_type = edge_attrs.get("relationship_type", "unknown")
-                lines.append(f"    - {rel_type} -> {target_kind}/{target_name}")
-
-        lines.append("")
+                yield f"    - {rel_type} -> {target_kind}/{target_name}"
 
-    return "\n".join(lines)
+        yield ""
 
 
 def _format_minimal(graph: nx.DiGraph, include_metadata: bool) -> str:
@@ -174,23 +251,62 @@ def _format_minimal(graph: nx.DiGraph, include_metadata: bool) -> str:
             "edge_count": graph.number_of_edges(),
         }
 
-    return json.dumps(output, indent=2, default=str)
+    return _dumps(output)
 
 
-def export_to_dot(graph: nx.DiGraph, output_file: str) -> None:
+def export_to_dot(graph: nx.DiGraph, output_file: str, use_pydot: bool = False) -> None:
     """
     Export graph to Graphviz DOT format.
 
+    By default the DOT text is streamed straight to the file: one styled node
+    per resource (kind and name label, filled with its resource color) and
+    one edge per relationship, labelled with its type. With ``use_pydot=True``
+    the graph goes through pydot instead, which writes every node and edge
+    attribute but builds a pydot object per element first.
+
     Args:
         graph: NetworkX directed graph
         output_file: Path to output DOT file
+        use_pydot: Export all attributes via nx.drawing.nx_pydot.write_dot
 
     Example:
         >>> export_to_dot(graph, "cluster.dot")
         >>> # Then: dot -Tpng cluster.dot -o cluster.png
     """
-    try:
-        nx.drawing.nx_pydot.write_dot(graph, output_file)
-    except ImportError:
-        logger.error("pydot is required for DOT export. Install with: pip install pydot")
-        raise
+    if use_pydot:
+        try:
+            nx.drawing.nx_pydot.write_dot(graph, output_file)
+        except ImportError:
+            logger.error("pydot is required for DOT export. Install with: pip install pydot")
+            raise
+        return
+
+    with open(output_file, "w") as f:
+        _write_dot(graph, f)
+
+
+def _write_dot(graph: nx.DiGraph, sink: TextIO) -> None:
+    """
+    Write styled DOT text for the graph straight to a text sink.
+
+    Each node id is quoted once and the quoted form is reused for its edges.
+    """
+    from k8s_graph.visualization import RESOURCE_COLORS
+
+    colors_get = RESOURCE_COLORS.get
+    write = sink.write
+    quoted: dict[Any, str] = {}
+    write("digraph {\n")
+    for node_id, attrs in graph.nodes(data=True):
+        kind = attrs.get("kind", "Unknown")
+        # \n is DOT's line break, so only the parts around it are escaped
+        label = f'"{dot_escape(kind)}\\n{dot_escape(attrs.get("name", "?"))}"'
+        quoted[node_id] = quoted_id = dot_quote(node_id)
+        write(
+            f"  {quoted_id} [label={label}, shape=box, style=filled, "
+            f'fillcolor="{colors_get(kind, "#FFFFFF")}"];\n'
+        )
+    for source, target, edge_attrs in graph.edges(data=True):
+        label = dot_quote(edge_attrs.get("relationship_type", ""))
+        write(f"  {quoted[source]} -> {quoted[target]} [label={label}];\n")
+    write("}\n")
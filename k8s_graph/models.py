@@ -1,3 +1,4 @@
+import sys
 from enum import Enum, Flag, auto
 
 from pydantic import BaseModel, Field, field_validator
@@ -40,7 +41,7 @@ class ResourceIdentifier(BaseModel):
             raise ValueError("kind cannot be empty")
         if not v[0].isupper():
             raise ValueError("kind must start with an uppercase letter")
-        return v
+        return sys.intern(v)
 
     @field_validator("name")
     @classmethod
@@ -49,6 +50,12 @@ class ResourceIdentifier(BaseModel):
             raise ValueError("name cannot be empty")
         return v
 
+    @field_validator("namespace", "api_version")
+    @classmethod
+    def intern_shared_fields(cls, v: str | None) -> str | None:
+        # Few distinct values repeated across every identifier; share one copy
+        return sys.intern(v) if v is not None else v
+
     def __str__(self) -> str:
         if self.namespace:
             return f"{self.kind}/{self.name} (ns: {self.namespace})"
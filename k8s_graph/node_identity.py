@@ -1,9 +1,27 @@
+import functools
 import logging
+import sys
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
 
+def _intern(value: Any) -> Any:
+    """Intern strings (kind, namespace, ...) that repeat across many nodes."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def make_node_id(kind: str, namespace: str, name: str) -> str:
+    """
+    Build the ``kind:namespace:name`` node id, interned and cached per triple.
+
+    Repeat lookups for the same resource return the identical string object
+    without formatting it again.
+    """
+    return sys.intern(f"{kind}:{namespace}:{name}")
+
+
 class NodeIdentity:
     """
     Generates stable node IDs for Kubernetes resources.
@@ -58,11 +76,14 @@ class NodeIdentity:
         namespace = metadata.get("namespace") or "cluster"
 
         if kind == "Pod":
-            return self._get_pod_node_id(resource, namespace)
+            node_id = self._get_pod_node_id(resource, namespace)
         elif kind == "ReplicaSet":
-            return self._get_replicaset_node_id(resource, namespace)
+            node_id = self._get_replicaset_node_id(resource, namespace)
+        else:
+            return make_node_id(kind, namespace, name)
 
-        return f"{kind}:{namespace}:{name}"
+        # Node ids are reused as dict keys in every edge touching the node
+        return sys.intern(node_id)
 
     def _get_pod_node_id(self, resource: dict[str, Any], namespace: str) -> str:
         """
@@ -88,7 +109,7 @@ class NodeIdentity:
             f"Pod {namespace}/{name} missing ownerReferences or pod-template-hash, "
             f"using standard ID"
         )
-        return f"Pod:{namespace}:{name}"
+        return make_node_id("Pod", namespace, name)
 
     def _get_replicaset_node_id(self, resource: dict[str, Any], namespace: str) -> str:
         """
@@ -127,10 +148,10 @@ class NodeIdentity:
         status = resource.get("status", {})
 
         attrs = {
-            "kind": resource.get("kind", "Unknown"),
+            "kind": _intern(resource.get("kind", "Unknown")),
             "name": metadata.get("name", "unknown"),
-            "namespace": metadata.get("namespace"),
-            "api_version": resource.get("apiVersion"),
+            "namespace": _intern(metadata.get("namespace")),
+            "api_version": _intern(resource.get("apiVersion")),
             "uid": metadata.get("uid"),
             "labels": metadata.get("labels", {}),
             "annotations": metadata.get("annotations", {}),
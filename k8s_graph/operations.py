@@ -3,6 +3,8 @@ from typing import Any
 
 import networkx as nx
 
+from k8s_graph.query import find_by_namespace
+
 logger = logging.getLogger(__name__)
 
 
@@ -116,9 +118,7 @@ def extract_namespace(graph: nx.DiGraph, namespace: str) -> nx.DiGraph:
     Example:
         >>> default_graph = extract_namespace(cluster_graph, "default")
     """
-    namespace_nodes = [
-        node for node, attrs in graph.nodes(data=True) if attrs.get("namespace") == namespace
-    ]
+    namespace_nodes = find_by_namespace(graph, namespace)
 
     if not namespace_nodes:
         logger.warning(f"No resources found in namespace: {namespace}")
@@ -134,6 +134,27 @@ def extract_namespace(graph: nx.DiGraph, namespace: str) -> nx.DiGraph:
     return subgraph
 
 
+def get_namespace_view(graph: nx.DiGraph, namespace: str) -> nx.DiGraph:
+    """
+    Get a read-only view of the resources in one namespace.
+
+    Unlike extract_namespace(), nothing is copied: the view shares the
+    graph's node and edge data.
+
+    Args:
+        graph: NetworkX directed graph
+        namespace: Namespace to view
+
+    Returns:
+        Subgraph view containing only resources from the namespace
+
+    Example:
+        >>> default_view = get_namespace_view(cluster_graph, "default")
+        >>> print(default_view.number_of_nodes())
+    """
+    return graph.subgraph(find_by_namespace(graph, namespace))
+
+
 def diff_graphs(graph1: nx.DiGraph, graph2: nx.DiGraph) -> dict[str, Any]:
     """
     Compare two graphs and identify differences.
@@ -35,6 +35,14 @@ class K8sClientProtocol(Protocol):
                 label_selector: Optional[str] = None
             ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
                 return await self.upstream.list_resources(kind, namespace, label_selector)
+
+    Clients may additionally provide an ``iter_resources(kind, namespace, label_selector)``
+    async generator that pages through large LIST results (see KubernetesAdapter).
+    Discoverers read through iter_client_resources(), which prefers it.
+
+    Resources are plain decoded JSON dicts in the API server's own shape
+    (camelCase keys, label and annotation keys untouched), not client model
+    objects. Discoverers traverse them with ``dict.get`` only.
     """
 
     async def get_resource(self, resource_id: ResourceIdentifier) -> dict[str, Any] | None:
@@ -1,11 +1,43 @@
+import itertools
 import logging
 from typing import Any
 
 import networkx as nx
 
+from k8s_graph._counted_graph import GraphCounters
+from k8s_graph.query import find_by_namespace
+
+try:
+    import rustworkx
+
+    _has_rustworkx = True
+except ImportError:
+    _has_rustworkx = False
+
 logger = logging.getLogger(__name__)
 
 
+def _strongly_connected_components(graph: nx.DiGraph) -> list[set[Any]]:
+    """
+    Strongly connected components of ``graph``, computed by rustworkx when installed.
+
+    rustworkx works on integer node indices, so the string node ids are mapped
+    onto a structure-only PyDiGraph and the components are mapped back.
+    """
+    if not _has_rustworkx:
+        return list(nx.strongly_connected_components(graph))
+
+    node_ids = list(graph.nodes)
+    index_of = {node_id: index for index, node_id in enumerate(node_ids)}
+    rx_graph = rustworkx.PyDiGraph(multigraph=False)
+    rx_graph.add_nodes_from(node_ids)
+    rx_graph.add_edges_from_no_data([(index_of[u], index_of[v]) for u, v in graph.edges])
+    return [
+        {node_ids[index] for index in component}
+        for component in rustworkx.strongly_connected_components(rx_graph)
+    ]
+
+
 def validate_graph(graph: nx.DiGraph) -> dict[str, Any]:
     """
     Validate a Kubernetes resource graph for quality and consistency.
@@ -122,49 +154,77 @@ def validate_graph(graph: nx.DiGraph) -> dict[str, Any]:
     }
 
 
-def check_graph_cycles(graph: nx.DiGraph) -> dict[str, Any]:
+def check_graph_cycles(graph: nx.DiGraph, max_cycles: int = 10) -> dict[str, Any]:
     """
     Check for cycles in the graph.
 
     While some cycles are valid in Kubernetes (e.g., Service -> Pod -> Service via endpoints),
     this can help identify unexpected circular dependencies.
 
+    Cycle detection uses strongly connected components, so it stays linear in the
+    graph size (and runs in rustworkx when it is installed); simple cycles are only
+    enumerated, per component, until ``max_cycles`` have been found. The total
+    number of simple cycles can grow exponentially with the graph, so it is not
+    counted; ``truncated`` says whether any were left unlisted.
+
     Args:
         graph: NetworkX directed graph
+        max_cycles: Maximum number of cycles to list (0 = detection only)
 
     Returns:
         Dictionary with:
         - has_cycles (bool): Whether cycles were found
-        - cycle_count (int): Number of simple cycles found (up to limit)
-        - cycles (list): List of cycles (limited to first 10)
+        - listed_cycles (int): Number of simple cycles listed (at most max_cycles)
+        - truncated (bool): Whether the graph has more cycles than were listed
+        - cycles (list): List of cycles (at most max_cycles)
+        - cyclic_components (int): Number of strongly connected components containing a cycle
 
     Example:
         >>> result = check_graph_cycles(graph)
         >>> if result['has_cycles']:
-        ...     print(f"Found {result['cycle_count']} cycles")
+        ...     print(f"Found {result['listed_cycles']} cycles")
     """
     try:
-        cycles = list(nx.simple_cycles(graph))
-        has_cycles = len(cycles) > 0
-
-        limited_cycles = cycles[:10]
+        # A component holds a cycle if it has several nodes or one with a self-loop
+        components = []
+        for component in _strongly_connected_components(graph):
+            node = next(iter(component))
+            if len(component) > 1 or graph.has_edge(node, node):
+                components.append(component)
+
+        per_component = (nx.simple_cycles(graph.subgraph(component)) for component in components)
+        # One cycle past the limit tells whether the listing was cut short
+        cycles = list(
+            itertools.islice(itertools.chain.from_iterable(per_component), max_cycles + 1)
+        )
+        truncated = len(cycles) > max_cycles
+        del cycles[max_cycles:]
 
         return {
-            "has_cycles": has_cycles,
-            "cycle_count": len(cycles),
-            "cycles": limited_cycles,
+            "has_cycles": bool(components),
+            "listed_cycles": len(cycles),
+            "truncated": truncated,
+            "cycles": cycles,
+            "cyclic_components": len(components),
         }
     except Exception as e:
         logger.error(f"Error checking for cycles: {e}")
-        return {"has_cycles": False, "cycle_count": 0, "cycles": [], "error": str(e)}
+        return {
+            "has_cycles": False,
+            "listed_cycles": 0,
+            "truncated": False,
+            "cycles": [],
+            "error": str(e),
+        }
 
 
-def get_graph_statistics(graph: nx.DiGraph) -> dict[str, Any]:
+def get_graph_statistics(graph: nx.DiGraph, namespace: str | None = None) -> dict[str, Any]:
     """
     Get detailed statistics about the graph structure.
 
     Args:
         graph: NetworkX directed graph
+        namespace: Only describe the subgraph of resources in this namespace
 
     Returns:
         Dictionary with various graph statistics
@@ -173,39 +233,47 @@ def get_graph_statistics(graph: nx.DiGraph) -> dict[str, Any]:
         >>> stats = get_graph_statistics(graph)
         >>> print(f"Average degree: {stats['average_degree']:.2f}")
     """
+    if namespace is not None:
+        graph = graph.subgraph(find_by_namespace(graph, namespace))
+
+    node_count = graph.number_of_nodes()
+    edge_count = graph.number_of_edges()
     stats = {
-        "node_count": graph.number_of_nodes(),
-        "edge_count": graph.number_of_edges(),
-        "density": nx.density(graph) if graph.number_of_nodes() > 0 else 0,
+        "node_count": node_count,
+        "edge_count": edge_count,
+        "density": nx.density(graph) if node_count > 0 else 0,
     }
 
-    if graph.number_of_nodes() > 0:
-        degrees = [d for _, d in graph.degree()]
-        stats["average_degree"] = sum(degrees) / len(degrees)
-        stats["max_degree"] = max(degrees)
-        stats["min_degree"] = min(degrees)
-
-        in_degrees = [d for _, d in graph.in_degree()]
-        out_degrees = [d for _, d in graph.out_degree()]
-        stats["average_in_degree"] = sum(in_degrees) / len(in_degrees)
-        stats["average_out_degree"] = sum(out_degrees) / len(out_degrees)
-        stats["max_in_degree"] = max(in_degrees)
-        stats["max_out_degree"] = max(out_degrees)
-
-    kinds: dict[str, int] = {}
-    namespaces: dict[str, int] = {}
-
-    for _node_id, attrs in graph.nodes(data=True):
-        kind = attrs.get("kind", "Unknown")
-        namespace = attrs.get("namespace", "cluster")
-
-        kinds[kind] = kinds.get(kind, 0) + 1
-        namespaces[namespace] = namespaces.get(namespace, 0) + 1
-
-    stats["resource_kinds"] = kinds
-    stats["namespaces"] = namespaces
-    stats["kind_count"] = len(kinds)
-    stats["namespace_count"] = len(namespaces)
+    if node_count > 0:
+        # Degree sums are fixed by the edge count; only the extremes need a pass
+        stats["average_degree"] = 2 * edge_count / node_count
+        stats["average_in_degree"] = edge_count / node_count
+        stats["average_out_degree"] = edge_count / node_count
+
+        pred = graph.pred
+        max_degree = max_in = max_out = 0
+        min_degree = 2 * edge_count
+        for node, successors in graph.succ.items():
+            in_degree = len(pred[node])
+            out_degree = len(successors)
+            degree = in_degree + out_degree
+            max_degree = max(max_degree, degree)
+            min_degree = min(min_degree, degree)
+            max_in = max(max_in, in_degree)
+            max_out = max(max_out, out_degree)
+
+        stats["max_degree"] = max_degree
+        stats["min_degree"] = min_degree
+        stats["max_in_degree"] = max_in
+        stats["max_out_degree"] = max_out
+
+    # Graphs from GraphBuilder carry their tallies until they are next changed
+    counters = getattr(graph, "build_counters", None) or GraphCounters.from_graph(graph)
+
+    stats["resource_kinds"] = dict(counters.kinds)
+    stats["namespaces"] = dict(counters.namespaces)
+    stats["kind_count"] = len(counters.kinds)
+    stats["namespace_count"] = len(counters.namespaces)
 
     return stats
 
@@ -3,16 +3,29 @@ Unified visualization module with multiple backends.
 
 Supports:
 - Matplotlib (draw_cluster, draw_namespace, draw_dependencies)
-- Graphviz (draw_hierarchical, draw_radial, draw_circular)
+- Graphviz (draw_hierarchical, draw_radial, draw_circular, draw_all_views)
 - PyVis interactive HTML (via export module)
 """
 
+import functools
+import hashlib
+import io
+import json
 import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import networkx as nx
 
+from k8s_graph._dot import dot_quote
+
 logger = logging.getLogger(__name__)
 
 RESOURCE_COLORS = {
@@ -41,6 +54,132 @@ RESOURCE_COLORS = {
     "HorizontalPodAutoscaler": "#F0E68C",
 }
 
+# Matplotlib palette and node sizes used by draw_cluster()
+_MPL_COLORS = {
+    "Namespace": "#E8F4F8",
+    "Pod": "#6495ED",
+    "Deployment": "#90EE90",
+    "StatefulSet": "#90EE90",
+    "DaemonSet": "#90EE90",
+    "ReplicaSet": "#98FB98",
+    "Service": "#FFD700",
+    "ConfigMap": "#D3D3D3",
+    "Secret": "#FFB6C1",
+    "Job": "#87CEEB",
+    "CronJob": "#87CEEB",
+    "Ingress": "#FFA500",
+    "NetworkPolicy": "#F08080",
+    "ServiceAccount": "#E6E6FA",
+    "Role": "#E6E6FA",
+    "RoleBinding": "#E6E6FA",
+    "PersistentVolumeClaim": "#DEB887",
+    "HorizontalPodAutoscaler": "#F0E68C",
+}
+_MPL_DEFAULT_COLOR = "#FFFFFF"
+
+_NODE_SIZES = {
+    "Namespace": 1500,
+    "Deployment": 1200,
+    "StatefulSet": 1200,
+    "DaemonSet": 1200,
+    "Service": 1000,
+    "Pod": 800,
+    "ReplicaSet": 600,
+    "ConfigMap": 400,
+    "Secret": 400,
+}
+_DEFAULT_NODE_SIZE = 500
+
+# get_shell_layout() shell index per kind; anything else goes to shell 5
+_KIND_TO_SHELL = {
+    "Namespace": 0,
+    "Deployment": 1,
+    "StatefulSet": 1,
+    "DaemonSet": 1,
+    "ReplicaSet": 2,
+    "Job": 2,
+    "CronJob": 2,
+    "Pod": 3,
+    "ConfigMap": 4,
+    "Secret": 4,
+    "Service": 4,
+    "Ingress": 4,
+    "PersistentVolumeClaim": 4,
+}
+
+# draw_cluster() keeps node positions in fp16 (else fp32) above this many nodes
+_FP16_POSITIONS_MIN_NODES = 5000
+
+# draw_cluster() rasterizes node and edge artists above this many nodes
+_RASTERIZE_NODE_THRESHOLD = 500
+
+# layout="spring" uses the numba F-R kernel (when installed) from this many nodes
+_NUMBA_LAYOUT_MIN_NODES = 100
+
+# _get_layout() memoizes positions for graphs smaller than this
+_LAYOUT_CACHE_MAX_NODES = 10_000
+
+# Per-user cache for artifacts reused across runs
+_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "k8s_graph"
+
+# On-disk layout positions shared across runs, keyed by graph signature
+_LAYOUT_CACHE_DIR = _CACHE_DIR / "layouts"
+
+# _cached_layout() keeps this many position files, dropping the least recently used
+_LAYOUT_CACHE_MAX_FILES = 256
+
+# Layouts that place a given graph the same way every run; the others only
+# go through the on-disk cache when seeded
+_DETERMINISTIC_LAYOUTS = frozenset({"shell", "circular", "spectral", "kamada_kawai"})
+
+# Rendered create_legend() images, keyed by the legend's colors
+_LEGEND_CACHE_DIR = _CACHE_DIR / "legend"
+
+# Graphviz node positions per (DOT source, layout engine), least recent first
+_GRAPHVIZ_POSITIONS: OrderedDict[tuple[str, str], dict[str, str]] = OrderedDict()
+_GRAPHVIZ_POSITIONS_MAXSIZE = 8
+
+# draw_all_views() output name -> Graphviz engine
+_VIEW_LAYOUTS = {"hierarchical": "dot", "radial": "twopi", "circular": "circo"}
+
+# _build_agraph() styling; graph attributes can be overridden through kwargs
+_GRAPHVIZ_GRAPH_ATTR = {
+    "rankdir": "TB",
+    "splines": "ortho",
+    "overlap": "false",
+    "bgcolor": "white",
+    "fontname": "Arial",
+    "fontsize": "14",
+}
+_GRAPHVIZ_NODE_ATTR = {
+    "shape": "box",
+    "style": "rounded,filled",
+    "fontname": "Arial",
+    "fontsize": "10",
+    "margin": "0.2,0.1",
+}
+_GRAPHVIZ_EDGE_ATTR = {
+    "color": "#666666",
+    "arrowsize": "0.7",
+    "penwidth": "1.5",
+    "fontname": "Arial",
+    "fontsize": "8",
+}
+
+# _build_agraph() spacing and default dpi: large > 100 nodes, medium > 50
+_GRAPHVIZ_SIZE_TIERS: dict[str, dict[str, Any]] = {
+    "large": {"dpi": 600, "graph": {"ranksep": "2.5", "nodesep": "1.5", "sep": "2.0"}},
+    "medium": {"dpi": 450, "graph": {"ranksep": "2.0", "nodesep": "1.2", "sep": "1.5"}},
+    "small": {"dpi": 300, "graph": {"ranksep": "1.5", "nodesep": "0.8", "sep": "1.0"}},
+}
+
+# Graphviz renders switch to the multilevel sfdp engine above this many nodes
+_SFDP_MIN_NODES = 500
+
+# Graphviz bitmap resolution is capped at _LARGE_GRAPH_DPI above this many nodes
+_LARGE_GRAPH_DPI_MIN_NODES = 200
+_LARGE_GRAPH_DPI = 150
+
 
 def draw_hierarchical(
     graph: nx.DiGraph,
@@ -54,6 +193,7 @@ def draw_hierarchical(
     Draw graph using Graphviz with hierarchical (dot) layout.
 
     Best for Kubernetes resource hierarchies (Deployment -> ReplicaSet -> Pod).
+    Graphs with more than 500 nodes fall back to sfdp, as dot is too slow there.
 
     Args:
         graph: NetworkX directed graph
@@ -136,6 +276,9 @@ def _draw_with_graphviz(
     """
     Internal function to draw graph using Graphviz.
 
+    Graphs with more than _SFDP_MIN_NODES nodes are always laid out with sfdp,
+    and above _LARGE_GRAPH_DPI_MIN_NODES the dpi is capped at _LARGE_GRAPH_DPI.
+
     Args:
         graph: NetworkX directed graph
         output_file: Path to output image file
@@ -145,8 +288,78 @@ def _draw_with_graphviz(
         format: Output format
         **kwargs: Additional graphviz attributes
     """
+    _require_pygraphviz()
+
+    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+
+    agraph = _build_agraph(graph, dpi=dpi, **kwargs)
+    _render_agraph(agraph, agraph.string(), output_file, layout, title, format)
+
+
+def draw_all_views(
+    graph: nx.DiGraph,
+    output_dir: str,
+    title: str | None = None,
+    dpi: int = 300,
+    format: str = "png",
+    **kwargs: Any,
+) -> list[str]:
+    """
+    Draw the hierarchical, radial and circular Graphviz views of a graph.
+
+    The styled DOT source is built once. Where processes start by forking,
+    each view is laid out and rendered in its own worker process, since
+    Graphviz runs in-process under the GIL and threads would render one at a
+    time. Under spawn or forkserver the workers would re-import the caller's
+    ``__main__``, which breaks scripts without an ``if __name__ ==
+    "__main__"`` guard, so the views are rendered one after another instead.
+
+    Args:
+        graph: NetworkX directed graph
+        output_dir: Directory for hierarchical.<format>, radial.<format>
+            and circular.<format>
+        title: Optional title for every view
+        dpi: Resolution in dots per inch
+        format: Output format
+        **kwargs: Additional graphviz attributes
+
+    Returns:
+        Paths of the written files
+
+    Example:
+        >>> draw_all_views(graph, "output/views", title="My Cluster")
+    """
+    _require_pygraphviz()
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    source = _build_agraph(graph, dpi=dpi, **kwargs).string()
+    output_files = {
+        layout: str(Path(output_dir) / f"{view}.{format}") for view, layout in _VIEW_LAYOUTS.items()
+    }
+
+    context = multiprocessing.get_context()
+    if context.get_start_method() != "fork":
+        for layout, output_file in output_files.items():
+            _render_dot(source, output_file, layout, title, format)
+        return list(output_files.values())
+
+    max_workers = min(len(output_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(_render_dot, source, output_file, layout, title, format)
+            for layout, output_file in output_files.items()
+        ]
+        for future in futures:
+            future.result()
+
+    return list(output_files.values())
+
+
+def _require_pygraphviz() -> None:
+    """Raise ImportError, with install hints logged, if pygraphviz is missing."""
     try:
-        import pygraphviz as pgv
+        import pygraphviz  # noqa: F401
     except ImportError:
         logger.error(
             "pygraphviz not installed. Install with: pip install pygraphviz\n"
@@ -154,85 +367,106 @@ def _draw_with_graphviz(
         )
         raise
 
-    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
-    agraph = pgv.AGraph(directed=True, strict=False)
+def _render_dot(source: str, output_file: str, layout: str, title: str | None, format: str) -> None:
+    """Parse a styled DOT source and render it; worker for draw_all_views()."""
+    import pygraphviz as pgv
 
-    node_count = graph.number_of_nodes()
-    if node_count > 100:
-        default_dpi = 600
-        default_ranksep = "2.5"
-        default_nodesep = "1.5"
-        default_sep = "2.0"
-    elif node_count > 50:
-        default_dpi = 450
-        default_ranksep = "2.0"
-        default_nodesep = "1.2"
-        default_sep = "1.5"
-    else:
-        default_dpi = 300
-        default_ranksep = "1.5"
-        default_nodesep = "0.8"
-        default_sep = "1.0"
-
-    agraph.graph_attr.update(
-        {
-            "rankdir": kwargs.get("rankdir", "TB"),
-            "ranksep": kwargs.get("ranksep", default_ranksep),
-            "nodesep": kwargs.get("nodesep", default_nodesep),
-            "sep": kwargs.get("sep", default_sep),
-            "splines": kwargs.get("splines", "ortho"),
-            "overlap": kwargs.get("overlap", "false"),
-            "dpi": str(kwargs.get("dpi", dpi or default_dpi)),
-            "bgcolor": kwargs.get("bgcolor", "white"),
-            "fontname": kwargs.get("fontname", "Arial"),
-            "fontsize": kwargs.get("fontsize", "14"),
-        }
-    )
+    _render_agraph(pgv.AGraph(string=source), source, output_file, layout, title, format)
+
+
+def _render_agraph(
+    agraph: Any,
+    signature: str,
+    output_file: str,
+    layout: str,
+    title: str | None,
+    format: str,
+) -> None:
+    """
+    Lay out a styled AGraph and write it to output_file.
 
+    Args:
+        agraph: pygraphviz.AGraph from _build_agraph()
+        signature: DOT source of agraph, the position cache key
+        output_file: Path to output image file
+        layout: Graphviz layout engine
+        title: Optional title
+        format: Output format
+    """
+    # dot/twopi/circo scale badly past a few hundred nodes; sfdp coarsens the
+    # graph and lays it out level by level
+    if agraph.number_of_nodes() > _SFDP_MIN_NODES:
+        if layout != "sfdp":
+            logger.info(f"Using sfdp instead of {layout} for {agraph.number_of_nodes()} nodes")
+            layout = "sfdp"
+        agraph.graph_attr["smoothing"] = "avg_dist"
+        agraph.graph_attr["K"] = "1.0"
+
+    # The title doesn't move nodes, so it stays out of the position cache key
     if title:
         agraph.graph_attr["label"] = title
         agraph.graph_attr["labelloc"] = "t"
         agraph.graph_attr["labeljust"] = "c"
 
-    agraph.node_attr.update(
-        {
-            "shape": "box",
-            "style": "rounded,filled",
-            "fontname": "Arial",
-            "fontsize": "10",
-            "margin": "0.2,0.1",
-        }
-    )
+    _compute_positions(agraph, layout, signature)
+    agraph.draw(output_file, format=format)
 
-    agraph.edge_attr.update(
-        {
-            "color": "#666666",
-            "arrowsize": "0.7",
-            "penwidth": "1.5",
-            "fontname": "Arial",
-            "fontsize": "8",
-        }
-    )
+    logger.info(f"Saved {layout} layout visualization to {output_file}")
+
+
+def _build_agraph(graph: nx.DiGraph, dpi: int = 300, **kwargs: Any) -> Any:
+    """
+    Build the styled pygraphviz AGraph for graph, without running a layout.
+
+    Args:
+        graph: NetworkX directed graph
+        dpi: Resolution
+        **kwargs: Additional graphviz attributes
+
+    Returns:
+        pygraphviz.AGraph
+    """
+    import pygraphviz as pgv
+
+    node_count = graph.number_of_nodes()
+    size = "large" if node_count > 100 else "medium" if node_count > 50 else "small"
+    tier = _GRAPHVIZ_SIZE_TIERS[size]
+
+    dpi = kwargs.get("dpi", dpi or tier["dpi"])
+    # Bitmap encode time grows with dpi², which dominates on large graphs
+    if node_count > _LARGE_GRAPH_DPI_MIN_NODES:
+        dpi = min(dpi, _LARGE_GRAPH_DPI)
+
+    graph_attr = {**_GRAPHVIZ_GRAPH_ATTR, **tier["graph"]}
+    graph_attr.update((key, kwargs[key]) for key in kwargs.keys() & graph_attr.keys())
+    graph_attr["dpi"] = str(dpi)
+
+    # One DOT document parsed once, instead of an add_node/add_edge call
+    # (and its attribute sets) across the C boundary per element
+    buf = io.StringIO()
+    write = buf.write
+    colors_get = RESOURCE_COLORS.get
+    write("digraph G {\n")
+    write(f"  graph [{_dot_attrs(graph_attr)}];\n")
+    write(f"  node [{_dot_attrs(_GRAPHVIZ_NODE_ATTR)}];\n")
+    write(f"  edge [{_dot_attrs(_GRAPHVIZ_EDGE_ATTR)}];\n")
 
     for node_id, attrs in graph.nodes(data=True):
         kind = attrs.get("kind", "Unknown")
         name = attrs.get("name", "?")
         namespace = attrs.get("namespace")
 
-        color = RESOURCE_COLORS.get(kind, "#FFFFFF")
-
         label_parts = [f"<B>{kind}</B>", name]
         if namespace and namespace != "cluster":
             label_parts.append(f"<I>ns:{namespace}</I>")
 
+        # HTML-like label: written bare between <...>, not quoted
         label = "<" + "<BR/>".join(label_parts) + ">"
 
-        agraph.add_node(
-            node_id,
-            label=label,
-            fillcolor=color,
-            color="#333333",
+        write(
+            f"  {dot_quote(node_id)} [label={label}, "
+            f'fillcolor="{colors_get(kind, "#FFFFFF")}", color="#333333"];\n'
         )
 
     for source, target, edge_attrs in graph.edges(data=True):
@@ -243,16 +477,45 @@ def _draw_with_graphviz(
         if len(edge_label) > 20:
             edge_label = edge_label[:17] + "..."
 
-        agraph.add_edge(
-            source,
-            target,
-            label=edge_label if edge_label else "",
+        write(
+            f"  {dot_quote(source)} -> {dot_quote(target)} " f"[label={dot_quote(edge_label)}];\n"
         )
 
-    agraph.layout(prog=layout)
-    agraph.draw(output_file, format=format)
+    write("}\n")
+    return pgv.AGraph(string=buf.getvalue())
 
-    logger.info(f"Saved {layout} layout visualization to {output_file}")
+
+def _dot_attrs(attrs: dict[str, Any]) -> str:
+    """Render an attribute dict as a DOT attribute list body."""
+    return ", ".join(f"{key}={dot_quote(value)}" for key, value in attrs.items())
+
+
+def _compute_positions(agraph: Any, layout: str, signature: str) -> None:
+    """
+    Lay out agraph, reusing node positions from an earlier identical run.
+
+    Positions are cached per (signature, layout) in _GRAPHVIZ_POSITIONS. On a
+    hit the nodes are pinned to the cached coordinates and ``neato -n2`` only
+    routes the edges, skipping the layout solver.
+
+    Args:
+        agraph: pygraphviz.AGraph to lay out in place
+        layout: Graphviz layout engine
+        signature: DOT source identifying the graph's topology and styling
+    """
+    key = (signature, layout)
+    positions = _GRAPHVIZ_POSITIONS.get(key)
+    if positions is None:
+        agraph.layout(prog=layout)
+        _GRAPHVIZ_POSITIONS[key] = {str(node): node.attr["pos"] for node in agraph.nodes()}
+        if len(_GRAPHVIZ_POSITIONS) > _GRAPHVIZ_POSITIONS_MAXSIZE:
+            _GRAPHVIZ_POSITIONS.popitem(last=False)
+        return
+
+    _GRAPHVIZ_POSITIONS.move_to_end(key)
+    for node, pos in positions.items():
+        agraph.get_node(node).attr["pos"] = f"{pos}!"
+    agraph.layout(prog="neato", args="-n2")
 
 
 def draw_cluster(
@@ -268,7 +531,9 @@ def draw_cluster(
     Args:
         graph: NetworkX directed graph
         output_file: Path to output image file
-        layout: Layout algorithm - 'shell', 'circular', 'spectral', 'spring', 'kamada_kawai'
+        layout: Layout algorithm - 'shell', 'circular', 'spectral', 'spring',
+            'spring_lbfgs', 'kamada_kawai'. 'spring_lbfgs' is recommended for
+            graphs of roughly 500-5000 nodes.
         title: Optional title for the graph
         **kwargs: Additional arguments passed to layout and drawing functions
 
@@ -283,6 +548,7 @@ def draw_cluster(
             "matplotlib is required for visualization. Install with: pip install matplotlib"
         )
         raise
+    import numpy as np
 
     Path(output_file).parent.mkdir(parents=True, exist_ok=True)
 
@@ -290,12 +556,33 @@ def draw_cluster(
 
     pos = _get_layout(graph, layout, **kwargs)
 
-    node_colors = [
-        _get_node_color_mpl(attrs.get("kind", "Unknown")) for _, attrs in graph.nodes(data=True)
-    ]
-    node_sizes = [
-        _get_node_size(attrs.get("kind", "Unknown")) for _, attrs in graph.nodes(data=True)
-    ]
+    # Positions as one (n, 2) array in graph order for the bounds and edges;
+    # fp16 on very large graphs, where the lost precision is sub-pixel
+    dtype = np.float16 if graph.number_of_nodes() > _FP16_POSITIONS_MIN_NODES else np.float32
+    xy = np.asarray([pos[node] for node in graph], dtype=dtype).reshape(-1, 2)
+
+    # Canvas bounds come straight from the positions, so the figure is saved
+    # as-is instead of rendering once more to measure a tight bounding box.
+    # Set before drawing: _draw_edges sizes its arrowheads from them.
+    if len(xy):
+        (xmin, ymin), (xmax, ymax) = xy.min(axis=0).tolist(), xy.max(axis=0).tolist()
+        xpad = max((xmax - xmin) * 0.1, 0.1)
+        ypad = max((ymax - ymin) * 0.1, 0.1)
+        ax.set_xlim(xmin - xpad, xmax + xpad)
+        ax.set_ylim(ymin - ypad, ymax + ypad)
+    fig.subplots_adjust(left=0, right=1, bottom=0, top=0.95 if title else 1)
+
+    # One pass over the node data for colors, sizes and labels
+    node_colors: list[str] = []
+    node_sizes: list[int] = []
+    labels: dict[str, str] = {}
+    for node, attrs in graph.nodes(data=True):
+        kind = attrs.get("kind", "Unknown")
+        node_colors.append(_MPL_COLORS.get(kind, _MPL_DEFAULT_COLOR))
+        node_sizes.append(_NODE_SIZES.get(kind, _DEFAULT_NODE_SIZE))
+        # Inlined label formatting; one-char ellipsis keeps long names at 20 chars
+        name = str(attrs.get("name", "?"))
+        labels[node] = name if len(name) <= 20 else f"{name[:19]}…"
 
     nx.draw_networkx_nodes(
         graph,
@@ -309,33 +596,77 @@ def draw_cluster(
     nx.draw_networkx_labels(
         graph,
         pos,
-        labels={node: _format_node_label(node, attrs) for node, attrs in graph.nodes(data=True)},
+        labels=labels,
         font_size=kwargs.get("font_size", 6),
         font_weight="bold",
         ax=ax,
     )
 
-    nx.draw_networkx_edges(
-        graph,
-        pos,
-        edge_color="gray",
-        alpha=0.5,
-        arrows=True,
-        arrowsize=10,
-        ax=ax,
-    )
+    _draw_edges(ax, graph, xy, np.asarray(node_sizes, dtype=float))
+
+    # Large graphs: emit nodes and edges (zorder 1-2) as one raster layer
+    # instead of vector paths, which matters for svg/pdf output. Labels
+    # (zorder 3) and the title stay vector.
+    if graph.number_of_nodes() > _RASTERIZE_NODE_THRESHOLD:
+        ax.set_rasterization_zorder(2.5)
 
     if title:
         ax.set_title(title, fontsize=16, fontweight="bold")
 
     ax.axis("off")
-    plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches="tight")
-    plt.close()
+    _save_figure(fig, output_file, dpi=300, tight=False)
+    plt.close(fig)
 
     logger.info(f"Saved matplotlib visualization to {output_file}")
 
 
+def _draw_edges(ax: Any, graph: nx.DiGraph, xy: Any, node_sizes: Any) -> None:
+    """
+    Draw directed edges as one LineCollection plus one PolyCollection of arrowheads.
+
+    nx.draw_networkx_edges(arrows=True) creates a FancyArrowPatch per edge.
+    Here every arrowhead is a triangle computed with NumPy in points, so it
+    keeps its shape on the non-equal-aspect axes, and placed at the edge of
+    the target node's marker. The axes limits must already be final.
+
+    Args:
+        ax: Matplotlib axes
+        graph: NetworkX directed graph
+        xy: (n, 2) node positions in graph node order
+        node_sizes: (n,) scatter marker sizes (points²) in graph node order
+    """
+    import numpy as np
+    from matplotlib.collections import LineCollection, PolyCollection
+
+    if not graph.number_of_edges():
+        return
+
+    index = {node: i for i, node in enumerate(graph)}
+    ends = np.array([(index[u], index[v]) for u, v in graph.edges()], dtype=np.intp)
+    segments = xy[ends]
+    ax.add_collection(LineCollection(segments, colors="gray", alpha=0.5, zorder=1))
+
+    # Points per data unit along each axis
+    (x0, x1), (y0, y1) = ax.get_xlim(), ax.get_ylim()
+    extent = ax.get_window_extent()
+    to_points = 72 / ax.figure.dpi
+    scale = np.array([extent.width * to_points / (x1 - x0), extent.height * to_points / (y1 - y0)])
+
+    # Same head as nx's default "-|>" arrowstyle at arrowsize=10
+    head_length, head_half_width = 4.0, 2.0
+    delta = (segments[:, 1] - segments[:, 0]) * scale
+    unit = delta / np.maximum(np.hypot(delta[:, 0], delta[:, 1]), 1e-9)[:, None]
+    radius = np.sqrt(node_sizes[ends[:, 1]])[:, None] / 2
+    tip = segments[:, 1] * scale - unit * radius
+    base = tip - unit * head_length
+    normal = np.column_stack((-unit[:, 1], unit[:, 0])) * head_half_width
+    triangles = np.stack((tip, base + normal, base - normal), axis=1) / scale
+
+    ax.add_collection(
+        PolyCollection(triangles, facecolors="gray", edgecolors="none", alpha=0.5, zorder=1)
+    )
+
+
 def draw_namespace(
     graph: nx.DiGraph,
     namespace: str,
@@ -353,11 +684,10 @@ def draw_namespace(
         layout: Layout algorithm
         **kwargs: Additional arguments
     """
-    subgraph_nodes = [
+    # Read-only view: drawing never mutates it, so skip copying the attribute dicts
+    subgraph = graph.subgraph(
         node_id for node_id, attrs in graph.nodes(data=True) if attrs.get("namespace") == namespace
-    ]
-
-    subgraph = graph.subgraph(subgraph_nodes).copy()
+    )
 
     draw_cluster(subgraph, output_file, layout=layout, title=f"Namespace: {namespace}", **kwargs)
 
@@ -441,22 +771,10 @@ def get_shell_layout(graph: nx.DiGraph) -> list[list[str]]:
         - Shell 5: Other resources
     """
     shells: list[list[str]] = [[] for _ in range(6)]
+    shell_of = _KIND_TO_SHELL.get
 
     for node_id, attrs in graph.nodes(data=True):
-        kind = attrs.get("kind", "Unknown")
-
-        if kind == "Namespace":
-            shells[0].append(node_id)
-        elif kind in ("Deployment", "StatefulSet", "DaemonSet"):
-            shells[1].append(node_id)
-        elif kind in ("ReplicaSet", "Job", "CronJob"):
-            shells[2].append(node_id)
-        elif kind == "Pod":
-            shells[3].append(node_id)
-        elif kind in ("ConfigMap", "Secret", "Service", "Ingress", "PersistentVolumeClaim"):
-            shells[4].append(node_id)
-        else:
-            shells[5].append(node_id)
+        shells[shell_of(attrs.get("kind", "Unknown"), 5)].append(node_id)
 
     return [shell for shell in shells if shell]
 
@@ -465,9 +783,21 @@ def create_legend(output_file: str) -> None:
     """
     Create a legend image showing resource colors using matplotlib.
 
+    The legend only depends on RESOURCE_COLORS, so it is rendered once per
+    color set and output format, kept in _LEGEND_CACHE_DIR and copied from
+    there afterwards.
+
     Args:
         output_file: Path to output image file
     """
+    digest = hashlib.blake2b(repr(sorted(RESOURCE_COLORS.items())).encode(), digest_size=8)
+    cached_file = _LEGEND_CACHE_DIR / f"legend-{digest.hexdigest()}{Path(output_file).suffix}"
+    if cached_file.is_file():
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached_file, output_file)
+        logger.info(f"Saved legend to {output_file}")
+        return
+
     try:
         import matplotlib.patches as mpatches
         import matplotlib.pyplot as plt
@@ -495,14 +825,185 @@ def create_legend(output_file: str) -> None:
     )
 
     plt.tight_layout()
-    plt.savefig(output_file, dpi=300, bbox_inches="tight")
-    plt.close()
+    _save_figure(fig, output_file, dpi=300)
+    plt.close(fig)
+
+    try:
+        _LEGEND_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Copy then rename, so concurrent readers never see a partial file
+        with (
+            open(output_file, "rb") as src,
+            tempfile.NamedTemporaryFile(dir=_LEGEND_CACHE_DIR, delete=False) as f,
+        ):
+            shutil.copyfileobj(src, f)
+        os.replace(f.name, cached_file)
+    except OSError as e:
+        logger.debug(f"Could not write legend cache {cached_file}: {e}")
 
     logger.info(f"Saved legend to {output_file}")
 
 
+def _save_figure(
+    fig: Any, output_file: str, dpi: int = 300, pad_inches: float = 0.1, tight: bool = True
+) -> None:
+    """
+    Save a matplotlib figure, by default cropped to its tight bounding box.
+
+    For PNG output the figure is rendered once with Agg and the cropped RGBA
+    buffer is written by Pillow with fast (level 1) compression. savefig() with
+    bbox_inches="tight" renders twice and uses a much slower PNG encoder, which
+    dominates the cost on large graphs. Other formats go through savefig().
+
+    Args:
+        fig: Matplotlib figure
+        output_file: Path to output image file
+        dpi: Resolution in dots per inch
+        pad_inches: Padding around the tight bounding box
+        tight: Crop to the tight bounding box; False saves the whole canvas
+            for callers that already fit the axes to their content
+    """
+    if Path(output_file).suffix.lower() != ".png":
+        if tight:
+            fig.savefig(output_file, dpi=dpi, bbox_inches="tight", pad_inches=pad_inches)
+        else:
+            fig.savefig(output_file, dpi=dpi)
+        return
+
+    import numpy as np
+    from PIL import Image
+
+    fig.set_dpi(dpi)
+    fig.canvas.draw()
+    pixels = np.asarray(fig.canvas.buffer_rgba())
+    if tight:
+        bbox = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+        width, height = fig.canvas.get_width_height()
+        left = max(int(bbox.x0 * dpi), 0)
+        right = min(int(np.ceil(bbox.x1 * dpi)), width)
+        top = max(height - int(np.ceil(bbox.y1 * dpi)), 0)
+        bottom = min(height - int(bbox.y0 * dpi), height)
+        pixels = pixels[top:bottom, left:right]
+
+    Image.fromarray(pixels).save(output_file, format="PNG", compress_level=1, dpi=(dpi, dpi))
+
+
 def _get_layout(graph: nx.DiGraph, layout: str, **kwargs: Any) -> dict[str, tuple[float, float]]:
-    """Get node positions using specified layout algorithm."""
+    """
+    Get node positions using specified layout algorithm.
+
+    Positions depend only on node order, node kinds, edges and the layout
+    arguments, so they are memoized on that signature: re-rendering the same
+    (sub)graph with another title or figure size skips the layout entirely.
+    Results are also kept on disk across runs (see _cached_layout). Graphs
+    with _LAYOUT_CACHE_MAX_NODES or more nodes, or unhashable layout arguments
+    (e.g. an explicit shell ``nlist``), are always recomputed.
+    """
+    if graph.number_of_nodes() >= _LAYOUT_CACHE_MAX_NODES:
+        return _compute_layout(graph, layout, **kwargs)
+
+    nodes_key = tuple((node, attrs.get("kind")) for node, attrs in graph.nodes(data=True))
+    edges_key = tuple(graph.edges())
+    kwargs_key = tuple(sorted(kwargs.items()))
+    try:
+        hash(kwargs_key)
+    except TypeError:
+        return _compute_layout(graph, layout, **kwargs)
+
+    return dict(_cached_layout(nodes_key, edges_key, layout, kwargs_key))
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_layout(
+    nodes_key: tuple[tuple[str, str | None], ...],
+    edges_key: tuple[tuple[str, str], ...],
+    layout: str,
+    kwargs_key: tuple[tuple[str, Any], ...],
+) -> dict[str, tuple[float, float]]:
+    """
+    Lay out a graph signature, going through the on-disk cache.
+
+    Positions are stored in _LAYOUT_CACHE_DIR as ``<blake2b key>.npz``, in
+    sorted node order, so repeat runs on the same cluster snapshot load them
+    instead of recomputing. At most _LAYOUT_CACHE_MAX_FILES are kept. Random
+    layouts without a ``seed`` skip the disk, so each run still gets a fresh
+    one. On a miss a bare graph is rebuilt from the signature and laid out.
+    Cache I/O errors only cost the cache.
+    """
+    import numpy as np
+
+    kwargs = dict(kwargs_key)
+    if layout not in _DETERMINISTIC_LAYOUTS and kwargs.get("seed") is None:
+        return _compute_layout(_signature_graph(nodes_key, edges_key), layout, **kwargs)
+
+    ordered = sorted(nodes_key, key=lambda item: str(item[0]))
+    digest = hashlib.blake2b(digest_size=16)
+    for node, kind in ordered:
+        digest.update(f"{node}\0{kind}\n".encode())
+    for source, target in sorted(edges_key, key=str):
+        digest.update(f"{source}\0{target}\n".encode())
+    digest.update(layout.encode())
+    digest.update(json.dumps(kwargs_key, default=str).encode())
+    cache_file = _LAYOUT_CACHE_DIR / f"{digest.hexdigest()}.npz"
+
+    order = [node for node, _ in ordered]
+    try:
+        with np.load(cache_file) as data:
+            xy = data["xy"]
+        if len(xy) == len(order):
+            # Mark as recently used for _evict_layout_cache()
+            os.utime(cache_file)
+            return dict(zip(order, xy, strict=True))
+    except (OSError, KeyError, ValueError):
+        pass
+
+    result = _compute_layout(_signature_graph(nodes_key, edges_key), layout, **kwargs)
+
+    try:
+        _LAYOUT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=_LAYOUT_CACHE_DIR, suffix=".npz", delete=False) as f:
+            np.savez(f, xy=np.array([result[node] for node in order], dtype=float))
+        os.replace(f.name, cache_file)
+        _evict_layout_cache()
+    except OSError as e:
+        logger.debug(f"Could not write layout cache {cache_file}: {e}")
+    return result
+
+
+def _signature_graph(
+    nodes_key: tuple[tuple[str, str | None], ...],
+    edges_key: tuple[tuple[str, str], ...],
+) -> nx.DiGraph:
+    """Rebuild a bare graph, with kinds only, from a _cached_layout() signature."""
+    graph = nx.DiGraph()
+    for node, kind in nodes_key:
+        if kind is None:
+            graph.add_node(node)
+        else:
+            graph.add_node(node, kind=kind)
+    graph.add_edges_from(edges_key)
+    return graph
+
+
+def _evict_layout_cache() -> None:
+    """Delete the least recently used layout files beyond _LAYOUT_CACHE_MAX_FILES."""
+    entries = []
+    for path in _LAYOUT_CACHE_DIR.glob("*.npz"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except FileNotFoundError:
+            continue
+    if len(entries) <= _LAYOUT_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, path in entries[: len(entries) - _LAYOUT_CACHE_MAX_FILES]:
+        path.unlink(missing_ok=True)
+
+
+def _compute_layout(
+    graph: nx.DiGraph, layout: str, **kwargs: Any
+) -> dict[str, tuple[float, float]]:
+    """Run the requested layout algorithm on graph."""
     if layout == "shell":
         nlist = kwargs.pop("nlist", None)
         if nlist is None:
@@ -515,13 +1016,40 @@ def _get_layout(graph: nx.DiGraph, layout: str, **kwargs: Any) -> dict[str, tupl
         return result
 
     elif layout == "spectral":
+        # Sparse eigensolver; nx.spectral_layout goes dense below 500 nodes
+        if graph.number_of_nodes() > 3 and kwargs.keys() <= {"scale", "center"}:
+            try:
+                return _sparse_spectral_layout(graph, **kwargs)
+            except ImportError:
+                logger.debug("scipy is not installed, using nx.spectral_layout")
         result = nx.spectral_layout(graph, **kwargs)
         return result
 
     elif layout == "spring":
-        result = nx.spring_layout(
-            graph, k=kwargs.pop("k", 0.5), iterations=kwargs.pop("iterations", 50), **kwargs
-        )
+        k = kwargs.pop("k", 0.5)
+        iterations = kwargs.pop("iterations", 50)
+        # Imported lazily: numba's import cost shouldn't hit non-spring callers
+        from k8s_graph import _fr_numba
+
+        # Compiled F-R kernel for mid/large graphs; JIT warmup isn't worth it below
+        if (
+            _fr_numba._has_numba
+            and graph.number_of_nodes() >= _NUMBA_LAYOUT_MIN_NODES
+            and kwargs.keys() <= {"seed", "scale", "center"}
+        ):
+            pos = _fr_numba.spring_layout(graph, k=k, iterations=iterations, **kwargs)
+            return _as_positions(pos.keys(), pos.values())
+        result = nx.spring_layout(graph, k=k, iterations=iterations, **kwargs)
+        return result
+
+    elif layout == "spring_lbfgs":
+        k = kwargs.pop("k", 0.5)
+        iterations = kwargs.pop("iterations", 200)
+        try:
+            return _lbfgs_spring_layout(graph, k=k, iterations=iterations, **kwargs)
+        except ImportError:
+            logger.debug("scipy is not installed, using nx.spring_layout")
+        result = nx.spring_layout(graph, k=k, iterations=iterations, **kwargs)
         return result
 
     elif layout == "kamada_kawai":
@@ -534,50 +1062,131 @@ def _get_layout(graph: nx.DiGraph, layout: str, **kwargs: Any) -> dict[str, tupl
         return result
 
 
-def _get_node_color_mpl(kind: str) -> str:
-    """Get matplotlib color for node based on kind."""
-    color_map = {
-        "Namespace": "#E8F4F8",
-        "Pod": "#6495ED",
-        "Deployment": "#90EE90",
-        "StatefulSet": "#90EE90",
-        "DaemonSet": "#90EE90",
-        "ReplicaSet": "#98FB98",
-        "Service": "#FFD700",
-        "ConfigMap": "#D3D3D3",
-        "Secret": "#FFB6C1",
-        "Job": "#87CEEB",
-        "CronJob": "#87CEEB",
-        "Ingress": "#FFA500",
-        "NetworkPolicy": "#F08080",
-        "ServiceAccount": "#E6E6FA",
-        "Role": "#E6E6FA",
-        "RoleBinding": "#E6E6FA",
-        "PersistentVolumeClaim": "#DEB887",
-        "HorizontalPodAutoscaler": "#F0E68C",
-    }
-    return color_map.get(kind, "#FFFFFF")
-
-
-def _get_node_size(kind: str) -> int:
-    """Get node size based on kind importance."""
-    size_map = {
-        "Namespace": 1500,
-        "Deployment": 1200,
-        "StatefulSet": 1200,
-        "DaemonSet": 1200,
-        "Service": 1000,
-        "Pod": 800,
-        "ReplicaSet": 600,
-        "ConfigMap": 400,
-        "Secret": 400,
-    }
-    return size_map.get(kind, 500)
+def _as_positions(nodes: Iterable[str], xy: Iterable[Any]) -> dict[str, tuple[float, float]]:
+    """Pair nodes with plain ``(x, y)`` float tuples taken from rows of ``xy``."""
+    return {node: (float(x), float(y)) for node, (x, y) in zip(nodes, xy, strict=True)}
+
+
+def _sparse_spectral_layout(
+    graph: nx.DiGraph,
+    scale: float = 1.0,
+    center: tuple[float, float] | None = None,
+) -> dict[str, tuple[float, float]]:
+    """
+    Spectral layout from the sparse normalized Laplacian.
+
+    Uses the eigenvectors of the two smallest non-trivial eigenvalues. The
+    normalized Laplacian's spectrum lies in [0, 2], so eigsh solves for the
+    largest eigenvalues of ``2I - L`` instead of the smallest of ``L``; Lanczos
+    converges much faster at that end. The eigenvectors are scaled by
+    ``D^-1/2`` to get those of the random-walk Laplacian, whose trivial vector
+    is constant. Edge direction is ignored.
 
+    Raises:
+        ImportError: If scipy is not installed
+
+    Args:
+        graph: Graph to lay out
+        scale: Scale factor for the final positions
+        center: Center of the final layout
+
+    Returns:
+        Dictionary mapping nodes to 2D positions
+    """
+    import numpy as np
+    import scipy.sparse as sp
+    from scipy.sparse.csgraph import laplacian
+    from scipy.sparse.linalg import eigsh
+
+    nodes = list(graph)
+    n = len(nodes)
+    adj = nx.to_scipy_sparse_array(
+        graph.to_undirected(as_view=True), nodelist=nodes, weight=None, format="csr"
+    )
+    normalized, degrees = laplacian(adj.astype(float), normed=True, return_diag=True)
+    shifted = 2 * sp.identity(n, format="csr") - normalized
+    v0 = np.random.default_rng(0).random(n)
+    _, vecs = eigsh(shifted, k=3, which="LA", tol=1e-4, v0=v0)
 
-def _format_node_label(node_id: str, attrs: dict[str, Any]) -> str:
-    """Format node label for display."""
-    name = str(attrs.get("name", "?"))
-    if len(name) > 20:
-        name = name[:17] + "..."
-    return name
+    # eigsh returns ascending eigenvalues of 2I - L: the last column is trivial.
+    # return_diag gives sqrt(degree), with isolated nodes counted as degree 1.
+    pos = nx.rescale_layout(vecs[:, [1, 0]] / degrees[:, None], scale=scale)
+    if center is not None:
+        pos += np.asarray(center)
+    return _as_positions(nodes, pos)
+
+
+def _lbfgs_spring_layout(
+    graph: nx.DiGraph,
+    k: float = 0.5,
+    iterations: int = 200,
+    seed: int | None = None,
+    scale: float = 1.0,
+    center: tuple[float, float] | None = None,
+) -> dict[str, tuple[float, float]]:
+    """
+    Force-directed layout found by minimizing a spring energy with L-BFGS-B.
+
+    The energy is ``sum_edges ||x_i - x_j||^2 - k^2 * sum_{i<j} log ||x_i - x_j||``.
+    Unlike the fixed-step simulation behind nx.spring_layout it doesn't
+    oscillate, so it converges in far fewer evaluations. Repulsion is exact
+    and evaluated in row blocks to bound memory.
+
+    Args:
+        graph: Graph to lay out (edge direction is ignored)
+        k: Optimal distance between nodes
+        iterations: Maximum number of L-BFGS-B iterations
+        seed: Seed for the random starting positions
+        scale: Scale factor for the final positions
+        center: Center of the final layout
+
+    Returns:
+        Dictionary mapping nodes to 2D positions
+
+    Raises:
+        ImportError: If scipy is not installed
+    """
+    import numpy as np
+    from scipy.optimize import minimize
+
+    nodes = list(graph)
+    n = len(nodes)
+    if n == 0:
+        return {}
+    if n == 1:
+        return _as_positions(nodes, [center or (0.0, 0.0)])
+
+    adj = nx.to_scipy_sparse_array(graph.to_undirected(as_view=True), nodelist=nodes)
+    rows, cols = adj.nonzero()
+    edges = rows < cols
+    src, dst = rows[edges], cols[edges]
+    k2 = k * k
+    min_d2 = 1e-4
+    block = max(1, 4_000_000 // n)
+
+    def energy(flat: np.ndarray) -> tuple[float, np.ndarray]:
+        x = flat.reshape(n, 2)
+        grad = np.zeros_like(x)
+
+        delta = x[src] - x[dst]
+        value = float((delta * delta).sum())
+        np.add.at(grad, src, 2 * delta)
+        np.add.at(grad, dst, -2 * delta)
+
+        # Rows count each pair twice and log(d2) = 2 log(d), hence the 1/4
+        for start in range(0, n, block):
+            diff = x[start : start + block, None, :] - x[None, :, :]
+            d2 = np.maximum((diff * diff).sum(axis=-1), min_d2)
+            d2[np.arange(d2.shape[0]), np.arange(start, start + d2.shape[0])] = 1.0
+            value -= 0.25 * k2 * float(np.log(d2).sum())
+            grad[start : start + block] -= k2 * (diff / d2[..., None]).sum(axis=1)
+
+        return value, grad.ravel()
+
+    x0 = np.random.default_rng(seed).random(n * 2)
+    solution = minimize(energy, x0, jac=True, method="L-BFGS-B", options={"maxiter": iterations})
+
+    pos = nx.rescale_layout(solution.x.reshape(n, 2), scale=scale)
+    if center is not None:
+        pos += np.asarray(center)
+    return _as_positions(nodes, pos)
@@ -1,36 +1,140 @@
 """Shared test fixtures for k8s-graph tests."""
 
+import array
+import copy
+import functools
+import json
+from collections.abc import Iterable, Mapping
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import AsyncMock
 
 import pytest
+from pydantic import ValidationError
 
 from k8s_graph.discoverers.registry import DiscovererRegistry
 from k8s_graph.models import ResourceIdentifier
 
 
+@functools.lru_cache(maxsize=256)
+def _parse_selector(label_selector: str) -> tuple[tuple[str, str], ...]:
+    """Parse a ``key=value`` / ``key==value`` label selector into (key, value) pairs."""
+    pairs = []
+    for part in label_selector.split(","):
+        if "=" in part:
+            key, value = part.split("=", 1)
+            pairs.append((key.strip(), value.lstrip("=").strip()))
+    return tuple(pairs)
+
+
+def _in_scope(resource: Mapping[str, Any], namespace: str | None, min_labels: int) -> bool:
+    """Cheap pre-check before the postings probe: namespace and label count."""
+    meta = resource.get("metadata") or {}
+    if namespace and meta.get("namespace") != namespace:
+        return False
+    # Fewer labels than selector terms can never match
+    return len(meta.get("labels") or {}) >= min_labels
+
+
+# MockK8sClient._counts slots
+_GET, _LIST, _TOTAL = 0, 1, 2
+
+
 class MockK8sClient:
     """Mock K8s client with API statistics tracking for testing."""
 
     def __init__(self):
         self.resources = {}
-        self._api_call_stats = {"get_resource": 0, "list_resources": 0, "total": 0}
+        # Identifier-keyed view of self.resources, with and without apiVersion
+        self._by_rid: dict[ResourceIdentifier, dict[str, Any]] = {}
+        # Secondary indexes so list_resources only scans one kind (and namespace)
+        self._by_kind: dict[str, list[dict[str, Any]]] = {}
+        self._by_kind_ns: dict[tuple[str, str | None], list[dict[str, Any]]] = {}
+        # Inverted label index: (kind, key, value) -> {id(resource): resource}
+        self._label_index: dict[tuple[str, str, str], dict[int, dict[str, Any]]] = {}
+        self._counts = array.array("q", [0, 0, 0])
 
     def add_resource(self, resource: dict[str, Any]) -> None:
         """Add a resource to the mock client."""
         kind = resource.get("kind")
-        name = resource.get("metadata", {}).get("name")
-        namespace = resource.get("metadata", {}).get("namespace")
+        meta = resource.get("metadata") or {}
+        name = meta.get("name")
+        namespace = meta.get("namespace")
         key = (kind, namespace, name)
+        previous = self.resources.get(key)
         self.resources[key] = resource
+        self._index_rid(resource, kind, name, namespace)
+
+        for bucket in (
+            self._by_kind.setdefault(kind, []),
+            self._by_kind_ns.setdefault((kind, namespace), []),
+        ):
+            if previous is None:
+                bucket.append(resource)
+            else:
+                bucket[bucket.index(previous)] = resource
+
+        if previous is not None:
+            previous_meta = previous.get("metadata") or {}
+            for label in (previous_meta.get("labels") or {}).items():
+                self._label_index[(kind, *label)].pop(id(previous), None)
+        for label in (meta.get("labels") or {}).items():
+            self._label_index.setdefault((kind, *label), {})[id(resource)] = resource
+
+    def _index_rid(self, resource: dict[str, Any], kind: Any, name: Any, namespace: Any) -> None:
+        """Store resource under the identifiers get_resource() is likely to receive."""
+        for api_version in {None, resource.get("apiVersion")}:
+            try:
+                rid = ResourceIdentifier(
+                    kind=kind, name=name, namespace=namespace, api_version=api_version
+                )
+            except ValidationError:
+                return
+            self._by_rid[rid] = resource
+
+    def add_resources(self, resources: Iterable[dict[str, Any]]) -> None:
+        """Add many resources, updating each index once per batch."""
+        updates: dict[tuple[Any, Any, Any], dict[str, Any]] = {}
+        for resource in resources:
+            meta = resource.get("metadata") or {}
+            key = (resource.get("kind"), meta.get("namespace"), meta.get("name"))
+            updates[key] = resource
+
+        # Replacements keep their index positions; only new keys take the batch path
+        new = {}
+        for key, resource in updates.items():
+            if key in self.resources:
+                self.add_resource(resource)
+            else:
+                new[key] = resource
+        self.resources.update(new)
+        for (kind, namespace, name), resource in new.items():
+            self._index_rid(resource, kind, name, namespace)
+
+        by_kind: dict[Any, list[dict[str, Any]]] = {}
+        by_kind_ns: dict[tuple[Any, Any], list[dict[str, Any]]] = {}
+        for (kind, namespace, _), resource in new.items():
+            by_kind.setdefault(kind, []).append(resource)
+            by_kind_ns.setdefault((kind, namespace), []).append(resource)
+            meta = resource.get("metadata") or {}
+            for label in (meta.get("labels") or {}).items():
+                self._label_index.setdefault((kind, *label), {})[id(resource)] = resource
+        for kind, bucket in by_kind.items():
+            self._by_kind.setdefault(kind, []).extend(bucket)
+        for kind_ns, bucket in by_kind_ns.items():
+            self._by_kind_ns.setdefault(kind_ns, []).extend(bucket)
 
     async def get_resource(self, resource_id: ResourceIdentifier) -> dict[str, Any] | None:
         """Get a resource by ID."""
-        self._api_call_stats["get_resource"] += 1
-        self._api_call_stats["total"] += 1
+        self._counts[_GET] += 1
+        self._counts[_TOTAL] += 1
 
-        key = (resource_id.kind, resource_id.namespace, resource_id.name)
-        return self.resources.get(key)
+        resource = self._by_rid.get(resource_id)
+        if resource is None:
+            # Identifier with an apiVersion that differs from the stored one
+            key = (resource_id.kind, resource_id.namespace, resource_id.name)
+            resource = self.resources.get(key)
+        return resource
 
     async def list_resources(
         self,
@@ -39,239 +143,152 @@ class MockK8sClient:
         label_selector: str | None = None,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
         """List resources of a kind."""
-        self._api_call_stats["list_resources"] += 1
-        self._api_call_stats["total"] += 1
-
-        results = []
-        for (res_kind, res_ns, _), resource in self.resources.items():
-            if res_kind != kind:
-                continue
-            if namespace and res_ns != namespace:
-                continue
-            if label_selector:
-                labels = resource.get("metadata", {}).get("labels", {})
-                for selector_part in label_selector.split(","):
-                    if "=" in selector_part:
-                        key, value = selector_part.split("=", 1)
-                        if labels.get(key) != value:
-                            continue
-            results.append(resource)
-
-        return results, {}
-
-    def get_api_call_stats(self) -> dict[str, int]:
-        """Get API call statistics."""
-        return self._api_call_stats.copy()
+        self._counts[_LIST] += 1
+        self._counts[_TOTAL] += 1
+
+        selector = _parse_selector(label_selector) if label_selector else ()
+
+        if not selector:
+            if namespace:
+                candidates = self._by_kind_ns.get((kind, namespace), ())
+            else:
+                candidates = self._by_kind.get(kind, ())
+            return list(candidates), {}
+
+        # Walk the shortest postings list, probing the others by id
+        smallest, *rest = sorted(
+            (self._label_index.get((kind, key, value), {}) for key, value in selector), key=len
+        )
+        min_labels = len(selector)
+        matches = (
+            resource
+            for resource_id, resource in smallest.items()
+            if _in_scope(resource, namespace, min_labels)
+            and all(resource_id in postings for postings in rest)
+        )
+        return list(matches), {}
+
+    def get_api_call_stats(self) -> Mapping[str, int]:
+        """Get a snapshot of the API call statistics."""
+        counts = self._counts
+        return {
+            "get_resource": counts[_GET],
+            "list_resources": counts[_LIST],
+            "total": counts[_TOTAL],
+        }
 
     def reset_api_call_stats(self) -> None:
         """Reset API call statistics."""
-        self._api_call_stats = {"get_resource": 0, "list_resources": 0, "total": 0}
+        self._counts[:] = array.array("q", [0, 0, 0])
+
+
+# Sample resources, parsed once per session from tests/data/fixtures.json.
+# Read-only fixtures wrap them in a MappingProxyType; _sample_resources_unchanged
+# guards their nested dicts.
+_FIXTURES: dict[str, dict[str, Any]] = json.loads(
+    Path(__file__).parent.joinpath("data/fixtures.json").read_bytes()
+)
+_SAMPLE_POD: dict[str, Any] = _FIXTURES["pod"]
+_SAMPLE_DEPLOYMENT: dict[str, Any] = _FIXTURES["deployment"]
+_SAMPLE_SERVICE: dict[str, Any] = _FIXTURES["service"]
+_SAMPLE_REPLICASET: dict[str, Any] = _FIXTURES["replicaset"]
+_SAMPLE_CONFIGMAP: dict[str, Any] = _FIXTURES["configmap"]
+_SAMPLE_SECRET: dict[str, Any] = _FIXTURES["secret"]
+_SAMPLE_INGRESS: dict[str, Any] = _FIXTURES["ingress"]
+_SAMPLE_NETWORK_POLICY: dict[str, Any] = _FIXTURES["network_policy"]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _sample_resources_unchanged():
+    """Fail the session if a test mutated a shared sample resource."""
+    shared = [_SAMPLE_POD, _SAMPLE_DEPLOYMENT, _SAMPLE_SERVICE, _SAMPLE_REPLICASET]
+    shared += [_SAMPLE_CONFIGMAP, _SAMPLE_SECRET, _SAMPLE_INGRESS, _SAMPLE_NETWORK_POLICY]
+    snapshot = copy.deepcopy(shared)
+    yield
+    assert shared == snapshot, "a test mutated a session-scoped sample_* fixture"
 
 
 @pytest.fixture
 def sample_pod() -> dict[str, Any]:
-    """Sample Pod resource."""
-    return {
-        "apiVersion": "v1",
-        "kind": "Pod",
-        "metadata": {
-            "name": "nginx-deployment-abc123-xyz",
-            "namespace": "default",
-            "uid": "pod-123",
-            "labels": {
-                "app": "nginx",
-                "pod-template-hash": "abc123",
-            },
-            "ownerReferences": [
-                {
-                    "kind": "ReplicaSet",
-                    "name": "nginx-deployment-abc123",
-                    "uid": "rs-123",
-                }
-            ],
-        },
-        "spec": {
-            "containers": [
-                {
-                    "name": "nginx",
-                    "image": "nginx:1.14.2",
-                    "env": [
-                        {
-                            "name": "CONFIG_KEY",
-                            "valueFrom": {"configMapKeyRef": {"name": "app-config", "key": "key1"}},
-                        }
-                    ],
-                    "envFrom": [{"configMapRef": {"name": "app-config"}}],
-                }
-            ],
-            "volumes": [
-                {"name": "config-volume", "configMap": {"name": "app-config"}},
-                {"name": "secret-volume", "secret": {"secretName": "app-secret"}},
-            ],
-            "serviceAccountName": "default",
-        },
-        "status": {"phase": "Running", "podIP": "10.0.0.1"},
-    }
+    """Sample Pod resource (a fresh copy; some tests edit it)."""
+    return copy.deepcopy(_SAMPLE_POD)
 
 
-@pytest.fixture
-def sample_deployment() -> dict[str, Any]:
-    """Sample Deployment resource."""
-    return {
-        "apiVersion": "apps/v1",
-        "kind": "Deployment",
-        "metadata": {
-            "name": "nginx-deployment",
-            "namespace": "default",
-            "uid": "deployment-123",
-            "labels": {"app": "nginx"},
-        },
-        "spec": {
-            "replicas": 3,
-            "selector": {"matchLabels": {"app": "nginx"}},
-            "template": {
-                "metadata": {"labels": {"app": "nginx"}},
-                "spec": {
-                    "containers": [{"name": "nginx", "image": "nginx:1.14.2"}],
-                    "serviceAccountName": "default",
-                },
-            },
-        },
-        "status": {"replicas": 3, "readyReplicas": 3, "availableReplicas": 3},
-    }
+@pytest.fixture(scope="session")
+def sample_deployment() -> Mapping[str, Any]:
+    """Sample Deployment resource (shared, read-only)."""
+    return MappingProxyType(_SAMPLE_DEPLOYMENT)
 
 
-@pytest.fixture
-def sample_service() -> dict[str, Any]:
-    """Sample Service resource."""
-    return {
-        "apiVersion": "v1",
-        "kind": "Service",
-        "metadata": {
-            "name": "nginx-service",
-            "namespace": "default",
-            "uid": "service-123",
-        },
-        "spec": {
-            "type": "ClusterIP",
-            "clusterIP": "10.96.0.1",
-            "selector": {"app": "nginx"},
-            "ports": [{"port": 80, "targetPort": 80, "protocol": "TCP"}],
-        },
-    }
+@pytest.fixture(scope="session")
+def sample_service() -> Mapping[str, Any]:
+    """Sample Service resource (shared, read-only)."""
+    return MappingProxyType(_SAMPLE_SERVICE)
 
 
-@pytest.fixture
-def sample_replicaset() -> dict[str, Any]:
-    """Sample ReplicaSet resource."""
-    return {
-        "apiVersion": "apps/v1",
-        "kind": "ReplicaSet",
-        "metadata": {
-            "name": "nginx-deployment-abc123",
-            "namespace": "default",
-            "uid": "rs-123",
-            "labels": {
-                "app": "nginx",
-                "pod-template-hash": "abc123",
-            },
-            "ownerReferences": [
-                {
-                    "kind": "Deployment",
-                    "name": "nginx-deployment",
-                    "uid": "deployment-123",
-                }
-            ],
-        },
-        "spec": {
-            "replicas": 3,
-            "selector": {"matchLabels": {"app": "nginx", "pod-template-hash": "abc123"}},
-        },
-        "status": {"replicas": 3, "readyReplicas": 3},
-    }
+@pytest.fixture(scope="session")
+def sample_replicaset() -> Mapping[str, Any]:
+    """Sample ReplicaSet resource (shared, read-only)."""
+    return MappingProxyType(_SAMPLE_REPLICASET)
 
 
-@pytest.fixture
-def sample_configmap() -> dict[str, Any]:
-    """Sample ConfigMap resource."""
-    return {
-        "apiVersion": "v1",
-        "kind": "ConfigMap",
-        "metadata": {
-            "name": "app-config",
-            "namespace": "default",
-            "uid": "cm-123",
-        },
-        "data": {"key1": "value1", "key2": "value2"},
-    }
+@pytest.fixture(scope="session")
+def sample_configmap() -> Mapping[str, Any]:
+    """Sample ConfigMap resource (shared, read-only)."""
+    return MappingProxyType(_SAMPLE_CONFIGMAP)
 
 
-@pytest.fixture
-def sample_secret() -> dict[str, Any]:
-    """Sample Secret resource."""
-    return {
-        "apiVersion": "v1",
-        "kind": "Secret",
-        "metadata": {
-            "name": "app-secret",
-            "namespace": "default",
-            "uid": "secret-123",
-        },
-        "type": "Opaque",
-        "data": {"username": "YWRtaW4=", "password": "cGFzc3dvcmQ="},
-    }
+@pytest.fixture(scope="session")
+def sample_secret() -> Mapping[str, Any]:
+    """Sample Secret resource (shared, read-only)."""
+    return MappingProxyType(_SAMPLE_SECRET)
 
 
-@pytest.fixture
-def sample_ingress() -> dict[str, Any]:
-    """Sample Ingress resource."""
-    return {
-        "apiVersion": "networking.k8s.io/v1",
-        "kind": "Ingress",
-        "metadata": {
-            "name": "nginx-ingress",
-            "namespace": "default",
-            "uid": "ingress-123",
-        },
-        "spec": {
-            "rules": [
-                {
-                    "host": "example.com",
-                    "http": {
-                        "paths": [
-                            {
-                                "path": "/",
-                                "pathType": "Prefix",
-                                "backend": {
-                                    "service": {"name": "nginx-service", "port": {"number": 80}}
-                                },
-                            }
-                        ]
-                    },
-                }
-            ]
-        },
-    }
+@pytest.fixture(scope="session")
+def sample_ingress() -> Mapping[str, Any]:
+    """Sample Ingress resource (shared, read-only)."""
+    return MappingProxyType(_SAMPLE_INGRESS)
 
 
-@pytest.fixture
-def sample_network_policy() -> dict[str, Any]:
-    """Sample NetworkPolicy resource."""
-    return {
-        "apiVersion": "networking.k8s.io/v1",
-        "kind": "NetworkPolicy",
-        "metadata": {
-            "name": "nginx-network-policy",
-            "namespace": "default",
-            "uid": "netpol-123",
-        },
-        "spec": {
-            "podSelector": {"matchLabels": {"app": "nginx"}},
-            "policyTypes": ["Ingress", "Egress"],
-            "ingress": [{"from": [{"podSelector": {"matchLabels": {"app": "frontend"}}}]}],
-            "egress": [{"to": [{"podSelector": {"matchLabels": {"app": "backend"}}}]}],
-        },
-    }
+@pytest.fixture(scope="session")
+def sample_network_policy() -> Mapping[str, Any]:
+    """Sample NetworkPolicy resource (shared, read-only)."""
+    return MappingProxyType(_SAMPLE_NETWORK_POLICY)
+
+
+class _FastMockClient:
+    """Plain async K8sClientProtocol stand-in, without AsyncMock's per-call bookkeeping."""
+
+    def __init__(self, resources_by_kind: dict[str, list[Mapping[str, Any]]]):
+        # Lookup tables built once, so neither method scans or reads metadata per call
+        self._index: dict[tuple[str, Any, Any], Mapping[str, Any]] = {}
+        self._by_kind = resources_by_kind
+        self._by_kind_ns: dict[tuple[str, str | None], list[Mapping[str, Any]]] = {}
+        for kind, resources in resources_by_kind.items():
+            for r in resources:
+                meta = r.get("metadata") or {}
+                namespace = meta.get("namespace")
+                self._index[(kind, meta.get("name"), namespace)] = r
+                self._by_kind_ns.setdefault((kind, namespace), []).append(r)
+        self.call_counts = {"get_resource": 0, "list_resources": 0}
+
+    async def get_resource(self, resource_id: ResourceIdentifier) -> Mapping[str, Any] | None:
+        self.call_counts["get_resource"] += 1
+        return self._index.get((resource_id.kind, resource_id.name, resource_id.namespace))
+
+    async def list_resources(
+        self, kind: str, namespace: str | None = None, label_selector: str | None = None
+    ) -> tuple[list[Mapping[str, Any]], dict[str, Any]]:
+        self.call_counts["list_resources"] += 1
+        if namespace:
+            resources = self._by_kind_ns.get((kind, namespace), [])
+        else:
+            resources = self._by_kind.get(kind, [])
+        return list(resources), {"resource_version": "12345"}
+
+    def reset_api_call_stats(self) -> None:
+        """Zero the call counters."""
+        self.call_counts = {"get_resource": 0, "list_resources": 0}
 
 
 @pytest.fixture
@@ -282,43 +299,39 @@ def mock_k8s_client(
     sample_replicaset,
     sample_configmap,
     sample_secret,
-) -> AsyncMock:
+) -> _FastMockClient:
     """Mock K8s client implementing K8sClientProtocol."""
-    client = AsyncMock()
-
-    resources_by_kind = {
-        "Pod": [sample_pod],
-        "Deployment": [sample_deployment],
-        "Service": [sample_service],
-        "ReplicaSet": [sample_replicaset],
-        "ConfigMap": [sample_configmap],
-        "Secret": [sample_secret],
-    }
-
-    async def mock_get_resource(resource_id: ResourceIdentifier) -> dict[str, Any] | None:
-        for resource in resources_by_kind.get(resource_id.kind, []):
-            metadata = resource.get("metadata", {})
-            if (
-                metadata.get("name") == resource_id.name
-                and metadata.get("namespace") == resource_id.namespace
-            ):
-                return resource
-        return None
-
-    async def mock_list_resources(
-        kind: str, namespace: str | None = None, label_selector: str | None = None
-    ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        resources = resources_by_kind.get(kind, [])
-        if namespace:
-            resources = [
-                r for r in resources if r.get("metadata", {}).get("namespace") == namespace
-            ]
-        return resources, {"resource_version": "12345"}
-
-    client.get_resource.side_effect = mock_get_resource
-    client.list_resources.side_effect = mock_list_resources
-
-    return client
+    return _FastMockClient(
+        {
+            "Pod": [sample_pod],
+            "Deployment": [sample_deployment],
+            "Service": [sample_service],
+            "ReplicaSet": [sample_replicaset],
+            "ConfigMap": [sample_configmap],
+            "Secret": [sample_secret],
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def shared_mock_k8s_client(
+    sample_deployment,
+    sample_service,
+    sample_replicaset,
+    sample_configmap,
+    sample_secret,
+) -> _FastMockClient:
+    """Module-wide mock client, for tests that share one GraphBuilder."""
+    return _FastMockClient(
+        {
+            "Pod": [MappingProxyType(_SAMPLE_POD)],
+            "Deployment": [sample_deployment],
+            "Service": [sample_service],
+            "ReplicaSet": [sample_replicaset],
+            "ConfigMap": [sample_configmap],
+            "Secret": [sample_secret],
+        }
+    )
 
 
 @pytest.fixture
@@ -60,9 +60,7 @@ async def test_api_call_statistics():
         "spec": {"containers": [{"name": "nginx", "image": "nginx:latest"}]},
     }
 
-    client.add_resource(deployment)
-    client.add_resource(replicaset)
-    client.add_resource(pod)
+    client.add_resources([deployment, replicaset, pod])
 
     if hasattr(client, "reset_api_call_stats"):
         client.reset_api_call_stats()
@@ -1,27 +1,44 @@
 """Tests for k8s_graph.builder."""
 
+from collections import Counter
+
 import pytest
 
+from k8s_graph._counted_graph import GraphCounters
 from k8s_graph.builder import GraphBuilder
+from k8s_graph.discoverers import DiscovererRegistry, NativeResourceDiscoverer
 from k8s_graph.models import BuildOptions, ResourceIdentifier
+from k8s_graph.query import find_by_namespace
+from k8s_graph.validator import get_graph_statistics
+from tests.conftest import MockK8sClient
+
+
+@pytest.fixture(scope="module")
+def shared_builder(shared_mock_k8s_client):
+    """One GraphBuilder for the module; registry and discoverers are set up once."""
+    return GraphBuilder(shared_mock_k8s_client)
+
+
+@pytest.fixture
+def builder(shared_builder, shared_mock_k8s_client):
+    """The shared builder with per-test state cleared."""
+    shared_builder.reset_state()
+    shared_mock_k8s_client.reset_api_call_stats()
+    return shared_builder
 
 
 @pytest.mark.asyncio
-async def test_builder_initialization(mock_k8s_client):
+async def test_builder_initialization(builder, shared_mock_k8s_client):
     """Test GraphBuilder initialization."""
-    builder = GraphBuilder(mock_k8s_client)
-
-    assert builder.client == mock_k8s_client
+    assert builder.client == shared_mock_k8s_client
     assert builder.registry is not None
     assert builder.unified_discoverer is not None
     assert builder.node_identity is not None
 
 
 @pytest.mark.asyncio
-async def test_build_from_resource(mock_k8s_client, sample_deployment):
+async def test_build_from_resource(builder):
     """Test building graph from a resource."""
-    builder = GraphBuilder(mock_k8s_client)
-
     resource_id = ResourceIdentifier(
         kind="Deployment", name="nginx-deployment", namespace="default"
     )
@@ -35,10 +52,8 @@ async def test_build_from_resource(mock_k8s_client, sample_deployment):
 
 
 @pytest.mark.asyncio
-async def test_build_from_missing_resource(mock_k8s_client):
+async def test_build_from_missing_resource(builder):
     """Test building from non-existent resource."""
-    builder = GraphBuilder(mock_k8s_client)
-
     resource_id = ResourceIdentifier(kind="Pod", name="nonexistent", namespace="default")
 
     graph = await builder.build_from_resource(resource_id, depth=1, options=BuildOptions())
@@ -47,10 +62,8 @@ async def test_build_from_missing_resource(mock_k8s_client):
 
 
 @pytest.mark.asyncio
-async def test_build_namespace_graph(mock_k8s_client):
+async def test_build_namespace_graph(builder):
     """Test building complete namespace graph."""
-    builder = GraphBuilder(mock_k8s_client)
-
     graph = await builder.build_namespace_graph(
         namespace="default", depth=1, options=BuildOptions(max_nodes=100)
     )
@@ -59,10 +72,8 @@ async def test_build_namespace_graph(mock_k8s_client):
 
 
 @pytest.mark.asyncio
-async def test_max_nodes_limit(mock_k8s_client):
+async def test_max_nodes_limit(builder):
     """Test that max_nodes limit is enforced."""
-    builder = GraphBuilder(mock_k8s_client)
-
     graph = await builder.build_namespace_graph(
         namespace="default", depth=2, options=BuildOptions(max_nodes=10)
     )
@@ -72,10 +83,8 @@ async def test_max_nodes_limit(mock_k8s_client):
 
 
 @pytest.mark.asyncio
-async def test_pod_sampling(mock_k8s_client, sample_pod):
+async def test_pod_sampling(builder):
     """Test pod template sampling."""
-    builder = GraphBuilder(mock_k8s_client)
-
     resource_id = ResourceIdentifier(
         kind="Pod", name="nginx-deployment-abc123-xyz", namespace="default"
     )
@@ -88,10 +97,8 @@ async def test_pod_sampling(mock_k8s_client, sample_pod):
 
 
 @pytest.mark.asyncio
-async def test_get_discovery_stats(mock_k8s_client, sample_deployment):
+async def test_get_discovery_stats(builder):
     """Test getting discovery statistics."""
-    builder = GraphBuilder(mock_k8s_client)
-
     resource_id = ResourceIdentifier(
         kind="Deployment", name="nginx-deployment", namespace="default"
     )
@@ -102,3 +109,229 @@ async def test_get_discovery_stats(mock_k8s_client, sample_deployment):
     assert "discoveries" in stats
     assert "errors" in stats
     assert "total_relationships" in stats
+
+
+@pytest.mark.asyncio
+async def test_build_statistics_match_nodes(builder):
+    """Statistics for a built graph come from the build's counters and match its nodes."""
+    graph = await builder.build_namespace_graph(
+        namespace="default", depth=1, options=BuildOptions(max_nodes=100)
+    )
+    assert graph.build_counters is not None
+
+    stats = get_graph_statistics(graph)
+
+    expected = Counter(attrs.get("kind", "Unknown") for _, attrs in graph.nodes(data=True))
+    assert stats["resource_kinds"] == dict(expected)
+    assert sum(stats["namespaces"].values()) == graph.number_of_nodes()
+
+
+@pytest.mark.asyncio
+async def test_build_counters_dropped_on_change(builder):
+    """Any node or attribute change after the build drops the counters."""
+    graph = await builder.build_namespace_graph(
+        namespace="default", depth=1, options=BuildOptions(max_nodes=100)
+    )
+    node, attrs = next(iter(graph.nodes(data=True)))
+
+    attrs["kind"] = "Edited"
+    assert graph.build_counters is None
+    assert get_graph_statistics(graph)["resource_kinds"]["Edited"] == 1
+
+    graph.build_counters = GraphCounters.from_graph(graph)
+    graph.remove_node(node)
+    graph.add_node("ConfigMap:other:added", kind="ConfigMap", namespace="other")
+    assert graph.build_counters is None
+    assert "Edited" not in get_graph_statistics(graph)["resource_kinds"]
+
+
+@pytest.mark.asyncio
+async def test_namespace_lookup_after_edits(builder):
+    """Per-namespace lookups on a built graph follow later edits."""
+    graph = await builder.build_namespace_graph(
+        namespace="default", depth=1, options=BuildOptions(max_nodes=100)
+    )
+
+    scanned = [n for n, attrs in graph.nodes(data=True) if attrs.get("namespace") == "default"]
+    assert find_by_namespace(graph, "default") == scanned
+
+    stats = get_graph_statistics(graph, namespace="default")
+    assert stats["node_count"] == len(scanned)
+    assert stats["namespaces"] == {"default": len(scanned)}
+
+    # Swap one node for another so the node and edge counts stay the same
+    removed = scanned[0]
+    graph.remove_edges_from(list(graph.in_edges(removed)) + list(graph.out_edges(removed)))
+    graph.remove_node(removed)
+    graph.add_node("ConfigMap:other:added", kind="ConfigMap", name="added", namespace="other")
+    assert removed not in find_by_namespace(graph, "default")
+    assert find_by_namespace(graph, "other") == ["ConfigMap:other:added"]
+
+
+@pytest.mark.asyncio
+async def test_selector_targets_resolved_from_pod_label_index():
+    """Label-selector targets are matched against one cached pod list per namespace."""
+    client = MockK8sClient()
+    client.add_resources(
+        [
+            {
+                "kind": "Pod",
+                "metadata": {"name": name, "namespace": "default", "labels": labels},
+            }
+            for name, labels in [
+                ("web-1", {"app": "web", "tier": "frontend"}),
+                ("web-2", {"app": "web", "tier": "backend"}),
+                ("db-1", {"app": "db"}),
+            ]
+        ]
+    )
+    builder = GraphBuilder(client)
+
+    assert await builder._pods_matching("default", "app=web,tier=frontend") == ["web-1"]
+    assert await builder._pods_matching("default", "app=web") == ["web-1", "web-2"]
+    assert await builder._pods_matching("default", "app=cache") == []
+    assert client.get_api_call_stats()["list_resources"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pod_label_index_rebuilt_per_build():
+    """A reused builder re-lists pods for selectors instead of serving the last build's list."""
+    client = MockK8sClient()
+    client.add_resource(
+        {
+            "kind": "Pod",
+            "metadata": {"name": "web-1", "namespace": "default", "labels": {"app": "web"}},
+        }
+    )
+    builder = GraphBuilder(client)
+    assert await builder._pods_matching("default", "app=web") == ["web-1"]
+
+    client.add_resource(
+        {
+            "kind": "Pod",
+            "metadata": {"name": "web-2", "namespace": "default", "labels": {"app": "web"}},
+        }
+    )
+    await builder.build_namespace_graph(namespace="default", depth=0, options=BuildOptions())
+
+    assert await builder._pods_matching("default", "app=web") == ["web-1", "web-2"]
+
+
+@pytest.mark.asyncio
+async def test_failed_list_attempted_once_per_build(monkeypatch):
+    """A LIST that raised is served as empty for the rest of the build, then retried."""
+    client = MockK8sClient()
+    client.add_resource({"kind": "ConfigMap", "metadata": {"name": "cm", "namespace": "default"}})
+    builder = GraphBuilder(client)
+
+    list_resources = client.list_resources
+    failures = iter([RuntimeError("forbidden")])
+    attempts = []
+
+    async def flaky_list_resources(*args, **kwargs):
+        attempts.append(args)
+        for error in failures:
+            raise error
+        return await list_resources(*args, **kwargs)
+
+    monkeypatch.setattr(client, "list_resources", flaky_list_resources)
+
+    assert await builder._list_cached("ConfigMap", "default") == []
+    assert await builder._list_cached("ConfigMap", "default") == []
+    assert len(attempts) == 1
+
+    builder.reset_state()
+    names = [r["metadata"]["name"] for r in await builder._list_cached("ConfigMap", "default")]
+    assert names == ["cm"]
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_discoverer_list_cache_cleared_per_build():
+    """Discoverer LIST results are not reused by the next build."""
+    client = MockK8sClient()
+    client.add_resource({"kind": "Job", "metadata": {"name": "backup", "namespace": "default"}})
+    registry = DiscovererRegistry()
+    registry.register(NativeResourceDiscoverer(client))
+    builder = GraphBuilder(client, registry)
+    job = ResourceIdentifier(kind="Job", name="backup", namespace="default")
+
+    await builder.build_from_resource(job, depth=1, options=BuildOptions())
+    await builder.build_from_resource(job, depth=1, options=BuildOptions())
+
+    assert client.get_api_call_stats()["list_resources"] == 2
+
+
+@pytest.mark.asyncio
+async def test_child_discovery_stops_at_node_budget(monkeypatch):
+    """Children past the node budget or sampled away are never sent to discovery."""
+    client = MockK8sClient()
+    client.add_resource({"kind": "Job", "metadata": {"name": "backup", "namespace": "default"}})
+    client.add_resources(
+        {
+            "kind": "Pod",
+            "metadata": {
+                "name": f"backup-{i}",
+                "namespace": "default",
+                "labels": {"job-name": "backup", "pod-template-hash": "abc"},
+                "ownerReferences": [{"kind": "Job", "name": "backup"}],
+            },
+            "spec": {"volumes": [{"name": "config", "configMap": {"name": f"cm-{i}"}}]},
+        }
+        for i in range(40)
+    )
+    client.add_resources(
+        {"kind": "ConfigMap", "metadata": {"name": f"cm-{i}", "namespace": "default"}}
+        for i in range(40)
+    )
+    registry = DiscovererRegistry()
+    registry.register(NativeResourceDiscoverer(client))
+    builder = GraphBuilder(client, registry)
+
+    discovered = []
+    discover_many = builder.unified_discoverer.discover_many
+
+    async def recording_discover_many(resources, options=None):
+        discovered.extend(resources)
+        return await discover_many(resources, options)
+
+    monkeypatch.setattr(builder.unified_discoverer, "discover_many", recording_discover_many)
+    job = ResourceIdentifier(kind="Job", name="backup", namespace="default")
+
+    # The Job and its 40 pods fill 41 slots; the first few pods' ConfigMaps use up the rest
+    graph = await builder.build_from_resource(job, depth=2, options=BuildOptions(max_nodes=44))
+    assert graph.number_of_nodes() == 44
+    assert len(discovered) == 8
+
+    discovered.clear()
+    await builder.build_from_resource(job, depth=2, options=BuildOptions(sample_pods=True))
+    assert len(discovered) == 1
+
+
+@pytest.mark.asyncio
+async def test_namespace_resources_discovered_in_batches(monkeypatch):
+    """Listed resources have their relationships discovered a batch at a time."""
+    client = MockK8sClient()
+    client.add_resources(
+        [
+            {"kind": "ConfigMap", "metadata": {"name": f"cm-{i}", "namespace": "default"}}
+            for i in range(40)
+        ]
+    )
+    builder = GraphBuilder(client)
+
+    batch_sizes = []
+    discover_many = builder.unified_discoverer.discover_many
+
+    async def recording_discover_many(resources, options=None):
+        batch_sizes.append(len(resources))
+        return await discover_many(resources, options)
+
+    monkeypatch.setattr(builder.unified_discoverer, "discover_many", recording_discover_many)
+
+    graph = await builder.build_namespace_graph(
+        namespace="default", depth=1, options=BuildOptions(max_nodes=100)
+    )
+
+    assert graph.number_of_nodes() == 40
+    assert batch_sizes == [32, 8]
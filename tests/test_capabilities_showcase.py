@@ -198,8 +198,14 @@ async def test_capability_custom_crd_handler():
 
     registry = DiscovererRegistry()
 
-    mock_client = AsyncMock()
-    discoverer = WorkflowDiscoverer(mock_client)
+    class _Client:
+        async def list_resources(self, kind, namespace=None, label_selector=None):
+            return [], {}
+
+        async def get_resource(self, resource_id):
+            return None
+
+    discoverer = WorkflowDiscoverer(_Client())
     registry.register(discoverer)
 
     workflow = {
@@ -281,23 +287,26 @@ async def test_capability_build_options():
 
     Example: Build graph with specific constraints
     """
-    mock_client = AsyncMock()
 
-    async def mock_list(kind, namespace=None, label_selector=None):
-        if kind == "Pod":
-            return [
-                {
-                    "kind": "Pod",
-                    "metadata": {"name": f"pod-{i}", "namespace": "default"},
-                    "spec": {},
-                }
-                for i in range(5)
-            ], {}
-        return [], {}
+    class _Client:
+        """Plain async client; cheaper per call than an AsyncMock side_effect."""
 
-    mock_client.list_resources.side_effect = mock_list
+        async def list_resources(self, kind, namespace=None, label_selector=None):
+            if kind == "Pod":
+                return [
+                    {
+                        "kind": "Pod",
+                        "metadata": {"name": f"pod-{i}", "namespace": "default"},
+                        "spec": {},
+                    }
+                    for i in range(5)
+                ], {}
+            return [], {}
 
-    builder = GraphBuilder(mock_client)
+        async def get_resource(self, resource_id):
+            return None
+
+    builder = GraphBuilder(_Client())
 
     options = BuildOptions(
         max_nodes=10,
@@ -511,21 +520,17 @@ def test_capability_graph_statistics():
     """
     graph = nx.DiGraph()
 
-    for i in range(5):
-        graph.add_node(
-            f"Pod:default:pod-{i}",
-            kind="Pod",
-            name=f"pod-{i}",
-            namespace="default",
-        )
-
-    for i in range(3):
-        graph.add_node(
+    graph.add_nodes_from(
+        (f"Pod:default:pod-{i}", {"kind": "Pod", "name": f"pod-{i}", "namespace": "default"})
+        for i in range(5)
+    )
+    graph.add_nodes_from(
+        (
             f"Service:default:svc-{i}",
-            kind="Service",
-            name=f"svc-{i}",
-            namespace="default",
+            {"kind": "Service", "name": f"svc-{i}", "namespace": "default"},
         )
+        for i in range(3)
+    )
 
     graph.add_edge("Service:default:svc-0", "Pod:default:pod-0")
     graph.add_edge("Service:default:svc-0", "Pod:default:pod-1")
@@ -563,7 +568,7 @@ def test_capability_cycle_detection():
     cycle_info = check_graph_cycles(graph)
 
     assert cycle_info["has_cycles"] is True
-    assert cycle_info["cycle_count"] >= 1
+    assert cycle_info["listed_cycles"] >= 1
     assert len(cycle_info["cycles"]) > 0
 
 
@@ -589,6 +594,9 @@ def test_capability_discoverer_priority():
         async def discover(self, resource):
             return []
 
+        def discover_sync(self, resource):
+            return []
+
         @property
         def priority(self):
             return 200
@@ -600,6 +608,9 @@ def test_capability_discoverer_priority():
         async def discover(self, resource):
             return []
 
+        def discover_sync(self, resource):
+            return []
+
         @property
         def priority(self):
             return 50
@@ -1,3 +1,5 @@
+import asyncio
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import pytest
@@ -16,49 +18,434 @@ from k8s_graph.discoverers.handlers import (
     PrometheusHandler,
     SparkHandler,
     TektonHandler,
+    TemporalHandler,
     VeleroHandler,
 )
 from k8s_graph.models import RelationshipType
 
-
-class TestHelmHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
-        return HelmHandler(mock_client)
-
-    def test_supports_helm_resource(self, handler):
-        resource = {
+# Resources the discover tests pass in; handlers only read them
+_HELM_DEPLOYMENT = {
+    "kind": "Deployment",
+    "metadata": {
+        "name": "myapp-deployment",
+        "namespace": "default",
+        "labels": {"app.kubernetes.io/instance": "myapp"},
+        "annotations": {"meta.helm.sh/release-name": "myapp"},
+    },
+}
+
+_ARGOCD_APPLICATION = {
+    "kind": "Application",
+    "apiVersion": "argoproj.io/v1alpha1",
+    "metadata": {"name": "myapp", "namespace": "argocd"},
+    "spec": {"destination": {"namespace": "production"}, "project": "default"},
+}
+
+_ARGO_WORKFLOW = {
+    "kind": "Workflow",
+    "apiVersion": "argoproj.io/v1alpha1",
+    "metadata": {"name": "workflow1", "namespace": "default"},
+    "spec": {"templates": []},
+}
+
+_AIRFLOW_CLUSTER = {
+    "kind": "AirflowCluster",
+    "apiVersion": "airflow.apache.org/v1alpha1",
+    "metadata": {"name": "airflow1", "namespace": "default"},
+    "spec": {},
+}
+
+_FLUX_HELM_RELEASE = {
+    "kind": "HelmRelease",
+    "apiVersion": "helm.toolkit.fluxcd.io/v2beta1",
+    "metadata": {"name": "release1", "namespace": "default"},
+    "spec": {"chart": {"spec": {"sourceRef": {"kind": "HelmRepository", "name": "repo1"}}}},
+}
+
+_ISTIO_VIRTUAL_SERVICE = {
+    "kind": "VirtualService",
+    "apiVersion": "networking.istio.io/v1beta1",
+    "metadata": {"name": "vs1", "namespace": "default"},
+    "spec": {"http": [{"route": [{"destination": {"host": "myservice"}}]}]},
+}
+
+_KNATIVE_REVISION = {
+    "kind": "Revision",
+    "apiVersion": "serving.knative.dev/v1",
+    "metadata": {"name": "rev1", "namespace": "default"},
+    "spec": {},
+}
+
+_CERTIFICATE = {
+    "kind": "Certificate",
+    "apiVersion": "cert-manager.io/v1",
+    "metadata": {"name": "cert1", "namespace": "default"},
+    "spec": {
+        "secretName": "cert1-secret",
+        "issuerRef": {"kind": "Issuer", "name": "issuer1"},
+    },
+}
+
+_TEKTON_PIPELINERUN = {
+    "kind": "PipelineRun",
+    "apiVersion": "tekton.dev/v1beta1",
+    "metadata": {"name": "pr1", "namespace": "default"},
+    "spec": {"pipelineRef": {"name": "pipeline1"}},
+}
+
+_TEKTON_TASKRUN = {
+    "kind": "TaskRun",
+    "apiVersion": "tekton.dev/v1beta1",
+    "metadata": {"name": "tr1", "namespace": "default"},
+    "spec": {
+        "workspaces": [
+            {"name": "source", "persistentVolumeClaim": {"claimName": "shared"}},
+            {"name": "cache", "persistentVolumeClaim": {"claimName": "shared"}},
+        ]
+    },
+}
+
+_SERVICE_MONITOR = {
+    "kind": "ServiceMonitor",
+    "apiVersion": "monitoring.coreos.com/v1",
+    "metadata": {"name": "sm1", "namespace": "default"},
+    "spec": {"selector": {"matchLabels": {"app": "myapp"}}},
+}
+
+_POD_MONITOR = {
+    "kind": "PodMonitor",
+    "apiVersion": "monitoring.coreos.com/v1",
+    "metadata": {"name": "pm1", "namespace": "default"},
+    "spec": {"selector": {"matchLabels": {"app": "myapp"}}},
+}
+
+_SCALED_OBJECT = {
+    "kind": "ScaledObject",
+    "apiVersion": "keda.sh/v1alpha1",
+    "metadata": {"name": "so1", "namespace": "default"},
+    "spec": {"scaleTargetRef": {"kind": "Deployment", "name": "myapp"}, "triggers": []},
+}
+
+_VELERO_BACKUP = {
+    "kind": "Backup",
+    "apiVersion": "velero.io/v1",
+    "metadata": {"name": "backup1", "namespace": "velero"},
+    "spec": {"includedNamespaces": ["default", "production"]},
+}
+
+_SPARK_APPLICATION = {
+    "kind": "SparkApplication",
+    "apiVersion": "sparkoperator.k8s.io/v1beta2",
+    "metadata": {"name": "spark1", "namespace": "default"},
+    "spec": {"volumes": []},
+}
+
+_CROSSPLANE_COMPOSITION = {
+    "kind": "Composition",
+    "apiVersion": "apiextensions.crossplane.io/v1",
+    "metadata": {"name": "comp1", "namespace": "default"},
+    "spec": {},
+}
+
+# (handler class, resource, whether supports() accepts it)
+SUPPORTS_CASES = [
+    pytest.param(
+        HelmHandler,
+        {
             "kind": "Deployment",
             "metadata": {
                 "labels": {"app.kubernetes.io/managed-by": "Helm"},
                 "annotations": {"meta.helm.sh/release-name": "myapp"},
             },
-        }
-        assert handler.supports(resource)
-
-    def test_does_not_support_non_helm_resource(self, handler):
-        resource = {
+        },
+        True,
+        id="supports_helm_resource",
+    ),
+    pytest.param(
+        HelmHandler,
+        {
             "kind": "Deployment",
             "metadata": {"labels": {}, "annotations": {}},
-        }
-        assert not handler.supports(resource)
-
-    @pytest.mark.asyncio
-    async def test_discover_helm_relationships(self, handler, mock_client):
-        resource = {
+        },
+        False,
+        id="does_not_support_non_helm_resource",
+    ),
+    pytest.param(
+        ArgoCDHandler,
+        {
+            "kind": "Application",
+            "apiVersion": "argoproj.io/v1alpha1",
+            "metadata": {"name": "myapp"},
+        },
+        True,
+        id="supports_argocd_application",
+    ),
+    pytest.param(
+        ArgoCDHandler,
+        {"kind": "Deployment", "apiVersion": "apps/v1", "metadata": {"name": "myapp"}},
+        False,
+        id="does_not_support_non_argocd_resource",
+    ),
+    pytest.param(
+        ArgoWorkflowsHandler,
+        {
+            "kind": "Workflow",
+            "apiVersion": "argoproj.io/v1alpha1",
+            "metadata": {"name": "workflow1"},
+        },
+        True,
+        id="supports_workflow",
+    ),
+    pytest.param(
+        ArgoWorkflowsHandler,
+        {
+            "kind": "CronWorkflow",
+            "apiVersion": "argoproj.io/v1alpha1",
+            "metadata": {"name": "cron1"},
+        },
+        True,
+        id="supports_cronworkflow",
+    ),
+    pytest.param(
+        AirflowHandler,
+        {
+            "kind": "AirflowCluster",
+            "apiVersion": "airflow.apache.org/v1alpha1",
+            "metadata": {"name": "airflow1"},
+        },
+        True,
+        id="supports_airflow_resource",
+    ),
+    pytest.param(
+        FluxCDHandler,
+        {
+            "kind": "HelmRelease",
+            "apiVersion": "helm.toolkit.fluxcd.io/v2beta1",
+            "metadata": {"name": "release1"},
+        },
+        True,
+        id="supports_helmrelease",
+    ),
+    pytest.param(
+        FluxCDHandler,
+        {
+            "kind": "Kustomization",
+            "apiVersion": "kustomize.toolkit.fluxcd.io/v1beta1",
+            "metadata": {"name": "kustomize1"},
+        },
+        True,
+        id="supports_kustomization",
+    ),
+    pytest.param(
+        IstioHandler,
+        {
+            "kind": "VirtualService",
+            "apiVersion": "networking.istio.io/v1beta1",
+            "metadata": {"name": "vs1"},
+        },
+        True,
+        id="supports_virtualservice",
+    ),
+    pytest.param(
+        IstioHandler,
+        {
+            "kind": "DestinationRule",
+            "apiVersion": "networking.istio.io/v1beta1",
+            "metadata": {"name": "dr1"},
+        },
+        True,
+        id="supports_destinationrule",
+    ),
+    pytest.param(
+        KnativeHandler,
+        {
+            "kind": "Service",
+            "apiVersion": "serving.knative.dev/v1",
+            "metadata": {"name": "ksvc1"},
+        },
+        True,
+        id="supports_knative_service",
+    ),
+    pytest.param(
+        KnativeHandler,
+        {
+            "kind": "Revision",
+            "apiVersion": "serving.knative.dev/v1",
+            "metadata": {"name": "rev1"},
+        },
+        True,
+        id="supports_knative_revision",
+    ),
+    pytest.param(
+        CertManagerHandler,
+        {
+            "kind": "Certificate",
+            "apiVersion": "cert-manager.io/v1",
+            "metadata": {"name": "cert1"},
+        },
+        True,
+        id="supports_certificate",
+    ),
+    pytest.param(
+        TektonHandler,
+        {
+            "kind": "PipelineRun",
+            "apiVersion": "tekton.dev/v1beta1",
+            "metadata": {"name": "pr1"},
+        },
+        True,
+        id="supports_pipelinerun",
+    ),
+    pytest.param(
+        TektonHandler,
+        {
+            "kind": "TaskRun",
+            "apiVersion": "tekton.dev/v1beta1",
+            "metadata": {"name": "tr1"},
+        },
+        True,
+        id="supports_taskrun",
+    ),
+    pytest.param(
+        PrometheusHandler,
+        {
+            "kind": "ServiceMonitor",
+            "apiVersion": "monitoring.coreos.com/v1",
+            "metadata": {"name": "sm1"},
+        },
+        True,
+        id="supports_servicemonitor",
+    ),
+    pytest.param(
+        PrometheusHandler,
+        {
+            "kind": "PodMonitor",
+            "apiVersion": "monitoring.coreos.com/v1",
+            "metadata": {"name": "pm1"},
+        },
+        True,
+        id="supports_podmonitor",
+    ),
+    pytest.param(
+        KEDAHandler,
+        {
+            "kind": "ScaledObject",
+            "apiVersion": "keda.sh/v1alpha1",
+            "metadata": {"name": "so1"},
+        },
+        True,
+        id="supports_scaledobject",
+    ),
+    pytest.param(
+        VeleroHandler,
+        {
+            "kind": "Backup",
+            "apiVersion": "velero.io/v1",
+            "metadata": {"name": "backup1"},
+        },
+        True,
+        id="supports_backup",
+    ),
+    pytest.param(
+        VeleroHandler,
+        {
+            "kind": "Schedule",
+            "apiVersion": "velero.io/v1",
+            "metadata": {"name": "schedule1"},
+        },
+        True,
+        id="supports_schedule",
+    ),
+    pytest.param(
+        VeleroHandler,
+        {
+            "kind": "Backup",
+            "apiVersion": "backup.example.com/velero.io-compat",
+            "metadata": {"name": "backup1"},
+        },
+        False,
+        id="supports_requires_velero_group_prefix",
+    ),
+    pytest.param(
+        SparkHandler,
+        {
+            "kind": "SparkApplication",
+            "apiVersion": "sparkoperator.k8s.io/v1beta2",
+            "metadata": {"name": "spark1"},
+        },
+        True,
+        id="supports_sparkapplication",
+    ),
+    pytest.param(
+        CrossplaneHandler,
+        {
+            "kind": "Composition",
+            "apiVersion": "apiextensions.crossplane.io/v1",
+            "metadata": {"name": "comp1"},
+        },
+        True,
+        id="supports_composition",
+    ),
+    pytest.param(
+        CrossplaneHandler,
+        {
             "kind": "Deployment",
+            "apiVersion": "apps/v1",
             "metadata": {
-                "name": "myapp-deployment",
-                "namespace": "default",
-                "labels": {"app.kubernetes.io/instance": "myapp"},
-                "annotations": {"meta.helm.sh/release-name": "myapp"},
+                "name": "myapp",
+                "annotations": {"crossplane.io/claim-name": "claim1"},
             },
-        }
+        },
+        True,
+        id="supports_resource_with_crossplane_annotation",
+    ),
+]
+
+
+@pytest.mark.parametrize("handler_cls,resource,expected", SUPPORTS_CASES)
+def test_supports(handler_cls, resource, expected):
+    assert bool(handler_cls(None).supports(resource)) is expected
+
+
+def ready(value):
+    """A plain stub for a call awaited for one fixed value, cheaper than an AsyncMock."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return lambda *args, **kwargs: future
+
+
+def make_client():
+    """A client double with just the two calls handlers make, returning nothing by default."""
+    return SimpleNamespace(
+        list_resources=AsyncMock(return_value=([], {})),
+        get_resource=AsyncMock(return_value=None),
+    )
+
+
+class _HandlerTests:
+    """One client double and handler per test class, reset after each test."""
+
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def mock_client():
+        return make_client()
 
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, mock_client, handler):
+        yield
+        # Fresh stubs on the same client object the handler holds
+        vars(mock_client).update(vars(make_client()))
+        # Handlers cache LIST results per client; drop them with the stubs
+        handler.clear_cache()
+
+
+class TestHelmHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
+        return HelmHandler(mock_client)
+
+    async def test_discover_helm_relationships(self, handler, mock_client):
         mock_client.list_resources.return_value = (
             [
                 {
@@ -74,41 +461,18 @@ class TestHelmHandler:
             {},
         )
 
-        relationships = await handler.discover(resource)
+        relationships = await handler.discover(_HELM_DEPLOYMENT)
         assert len(relationships) > 0
         assert any(r.relationship_type == RelationshipType.HELM_MANAGED for r in relationships)
 
 
-class TestArgoCDHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestArgoCDHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return ArgoCDHandler(mock_client)
 
-    def test_supports_argocd_application(self, handler):
-        resource = {
-            "kind": "Application",
-            "apiVersion": "argoproj.io/v1alpha1",
-            "metadata": {"name": "myapp"},
-        }
-        assert handler.supports(resource)
-
-    def test_does_not_support_non_argocd_resource(self, handler):
-        resource = {"kind": "Deployment", "apiVersion": "apps/v1", "metadata": {"name": "myapp"}}
-        assert not handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_argocd_relationships(self, handler, mock_client):
-        application = {
-            "kind": "Application",
-            "apiVersion": "argoproj.io/v1alpha1",
-            "metadata": {"name": "myapp", "namespace": "argocd"},
-            "spec": {"destination": {"namespace": "production"}, "project": "default"},
-        }
-
         mock_client.list_resources.return_value = (
             [
                 {
@@ -123,45 +487,18 @@ class TestArgoCDHandler:
             {},
         )
 
-        relationships = await handler.discover(application)
+        relationships = await handler.discover(_ARGOCD_APPLICATION)
         assert len(relationships) > 0
         assert any(r.relationship_type == RelationshipType.ARGOCD_MANAGED for r in relationships)
 
 
-class TestArgoWorkflowsHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestArgoWorkflowsHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return ArgoWorkflowsHandler(mock_client)
 
-    def test_supports_workflow(self, handler):
-        resource = {
-            "kind": "Workflow",
-            "apiVersion": "argoproj.io/v1alpha1",
-            "metadata": {"name": "workflow1"},
-        }
-        assert handler.supports(resource)
-
-    def test_supports_cronworkflow(self, handler):
-        resource = {
-            "kind": "CronWorkflow",
-            "apiVersion": "argoproj.io/v1alpha1",
-            "metadata": {"name": "cron1"},
-        }
-        assert handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_workflow_pods(self, handler, mock_client):
-        workflow = {
-            "kind": "Workflow",
-            "apiVersion": "argoproj.io/v1alpha1",
-            "metadata": {"name": "workflow1", "namespace": "default"},
-            "spec": {"templates": []},
-        }
-
         mock_client.list_resources.return_value = (
             [
                 {
@@ -176,39 +513,20 @@ class TestArgoWorkflowsHandler:
             {},
         )
 
-        relationships = await handler.discover(workflow)
+        relationships = await handler.discover(_ARGO_WORKFLOW)
         assert len(relationships) > 0
         assert any(
             r.relationship_type == RelationshipType.ARGO_WORKFLOW_SPAWNED for r in relationships
         )
 
 
-class TestAirflowHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestAirflowHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return AirflowHandler(mock_client)
 
-    def test_supports_airflow_resource(self, handler):
-        resource = {
-            "kind": "AirflowCluster",
-            "apiVersion": "airflow.apache.org/v1alpha1",
-            "metadata": {"name": "airflow1"},
-        }
-        assert handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_airflow_relationships(self, handler, mock_client):
-        airflow = {
-            "kind": "AirflowCluster",
-            "apiVersion": "airflow.apache.org/v1alpha1",
-            "metadata": {"name": "airflow1", "namespace": "default"},
-            "spec": {},
-        }
-
         mock_client.list_resources.return_value = (
             [
                 {
@@ -223,132 +541,55 @@ class TestAirflowHandler:
             {},
         )
 
-        relationships = await handler.discover(airflow)
+        relationships = await handler.discover(_AIRFLOW_CLUSTER)
         assert len(relationships) > 0
 
 
-class TestFluxCDHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestFluxCDHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return FluxCDHandler(mock_client)
 
-    def test_supports_helmrelease(self, handler):
-        resource = {
-            "kind": "HelmRelease",
-            "apiVersion": "helm.toolkit.fluxcd.io/v2beta1",
-            "metadata": {"name": "release1"},
-        }
-        assert handler.supports(resource)
-
-    def test_supports_kustomization(self, handler):
-        resource = {
-            "kind": "Kustomization",
-            "apiVersion": "kustomize.toolkit.fluxcd.io/v1beta1",
-            "metadata": {"name": "kustomize1"},
-        }
-        assert handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_flux_relationships(self, handler, mock_client):
-        helm_release = {
-            "kind": "HelmRelease",
-            "apiVersion": "helm.toolkit.fluxcd.io/v2beta1",
-            "metadata": {"name": "release1", "namespace": "default"},
-            "spec": {"chart": {"spec": {"sourceRef": {"kind": "HelmRepository", "name": "repo1"}}}},
-        }
-
         mock_client.list_resources.return_value = ([], {})
-        mock_client.get_resource.return_value = {
-            "kind": "HelmRepository",
-            "metadata": {"name": "repo1", "namespace": "default"},
-        }
+        mock_client.get_resource = ready(
+            {
+                "kind": "HelmRepository",
+                "metadata": {"name": "repo1", "namespace": "default"},
+            }
+        )
 
-        relationships = await handler.discover(helm_release)
+        relationships = await handler.discover(_FLUX_HELM_RELEASE)
         assert len(relationships) >= 0
 
 
-class TestIstioHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestIstioHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return IstioHandler(mock_client)
 
-    def test_supports_virtualservice(self, handler):
-        resource = {
-            "kind": "VirtualService",
-            "apiVersion": "networking.istio.io/v1beta1",
-            "metadata": {"name": "vs1"},
-        }
-        assert handler.supports(resource)
-
-    def test_supports_destinationrule(self, handler):
-        resource = {
-            "kind": "DestinationRule",
-            "apiVersion": "networking.istio.io/v1beta1",
-            "metadata": {"name": "dr1"},
-        }
-        assert handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_virtualservice_routes(self, handler, mock_client):
-        vs = {
-            "kind": "VirtualService",
-            "apiVersion": "networking.istio.io/v1beta1",
-            "metadata": {"name": "vs1", "namespace": "default"},
-            "spec": {"http": [{"route": [{"destination": {"host": "myservice"}}]}]},
-        }
-
-        mock_client.get_resource.return_value = {
-            "kind": "Service",
-            "metadata": {"name": "myservice", "namespace": "default"},
-        }
+        mock_client.get_resource = ready(
+            {
+                "kind": "Service",
+                "metadata": {"name": "myservice", "namespace": "default"},
+            }
+        )
 
-        relationships = await handler.discover(vs)
+        relationships = await handler.discover(_ISTIO_VIRTUAL_SERVICE)
         assert len(relationships) > 0
         assert any(r.relationship_type == RelationshipType.ISTIO_ROUTE for r in relationships)
 
 
-class TestKnativeHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestKnativeHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return KnativeHandler(mock_client)
 
-    def test_supports_knative_service(self, handler):
-        resource = {
-            "kind": "Service",
-            "apiVersion": "serving.knative.dev/v1",
-            "metadata": {"name": "ksvc1"},
-        }
-        assert handler.supports(resource)
-
-    def test_supports_knative_revision(self, handler):
-        resource = {
-            "kind": "Revision",
-            "apiVersion": "serving.knative.dev/v1",
-            "metadata": {"name": "rev1"},
-        }
-        assert handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_revision_deployment(self, handler, mock_client):
-        revision = {
-            "kind": "Revision",
-            "apiVersion": "serving.knative.dev/v1",
-            "metadata": {"name": "rev1", "namespace": "default"},
-            "spec": {},
-        }
-
         mock_client.list_resources.return_value = (
             [
                 {
@@ -363,88 +604,43 @@ class TestKnativeHandler:
             {},
         )
 
-        relationships = await handler.discover(revision)
+        relationships = await handler.discover(_KNATIVE_REVISION)
         assert len(relationships) > 0
         assert any(r.relationship_type == RelationshipType.KNATIVE_SERVES for r in relationships)
 
 
-class TestCertManagerHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestCertManagerHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return CertManagerHandler(mock_client)
 
-    def test_supports_certificate(self, handler):
-        resource = {
-            "kind": "Certificate",
-            "apiVersion": "cert-manager.io/v1",
-            "metadata": {"name": "cert1"},
-        }
-        assert handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_certificate_secret(self, handler, mock_client):
-        certificate = {
-            "kind": "Certificate",
-            "apiVersion": "cert-manager.io/v1",
-            "metadata": {"name": "cert1", "namespace": "default"},
-            "spec": {
-                "secretName": "cert1-secret",
-                "issuerRef": {"kind": "Issuer", "name": "issuer1"},
-            },
-        }
-
-        mock_client.get_resource.return_value = {
-            "kind": "Secret",
-            "metadata": {"name": "cert1-secret", "namespace": "default"},
-        }
+        mock_client.get_resource = ready(
+            {
+                "kind": "Secret",
+                "metadata": {"name": "cert1-secret", "namespace": "default"},
+            }
+        )
 
-        relationships = await handler.discover(certificate)
+        relationships = await handler.discover(_CERTIFICATE)
         assert len(relationships) > 0
         assert any(r.relationship_type == RelationshipType.CERT_ISSUED for r in relationships)
 
 
-class TestTektonHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestTektonHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return TektonHandler(mock_client)
 
-    def test_supports_pipelinerun(self, handler):
-        resource = {
-            "kind": "PipelineRun",
-            "apiVersion": "tekton.dev/v1beta1",
-            "metadata": {"name": "pr1"},
-        }
-        assert handler.supports(resource)
-
-    def test_supports_taskrun(self, handler):
-        resource = {
-            "kind": "TaskRun",
-            "apiVersion": "tekton.dev/v1beta1",
-            "metadata": {"name": "tr1"},
-        }
-        assert handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_pipelinerun_taskruns(self, handler, mock_client):
-        pipelinerun = {
-            "kind": "PipelineRun",
-            "apiVersion": "tekton.dev/v1beta1",
-            "metadata": {"name": "pr1", "namespace": "default"},
-            "spec": {"pipelineRef": {"name": "pipeline1"}},
-        }
-
-        mock_client.get_resource.return_value = {
-            "kind": "Pipeline",
-            "metadata": {"name": "pipeline1", "namespace": "default"},
-        }
+        mock_client.get_resource = ready(
+            {
+                "kind": "Pipeline",
+                "metadata": {"name": "pipeline1", "namespace": "default"},
+            }
+        )
         mock_client.list_resources.return_value = (
             [
                 {
@@ -459,45 +655,27 @@ class TestTektonHandler:
             {},
         )
 
-        relationships = await handler.discover(pipelinerun)
+        relationships = await handler.discover(_TEKTON_PIPELINERUN)
         assert len(relationships) > 0
         assert any(r.relationship_type == RelationshipType.TEKTON_RUN for r in relationships)
 
+    async def test_discover_taskrun_deduplicates_targets(self, handler, mock_client):
+        pod = {"kind": "Pod", "metadata": {"name": "tr1-pod", "namespace": "default"}}
+        mock_client.list_resources.return_value = ([pod, pod], {})
 
-class TestPrometheusHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
-
-    @pytest.fixture
-    def handler(self, mock_client):
-        return PrometheusHandler(mock_client)
+        relationships = await handler.discover(_TEKTON_TASKRUN)
+        targets = [(r.target.kind, r.target.name) for r in relationships]
+        assert targets.count(("Pod", "tr1-pod")) == 1
+        assert targets.count(("PersistentVolumeClaim", "shared")) == 1
 
-    def test_supports_servicemonitor(self, handler):
-        resource = {
-            "kind": "ServiceMonitor",
-            "apiVersion": "monitoring.coreos.com/v1",
-            "metadata": {"name": "sm1"},
-        }
-        assert handler.supports(resource)
 
-    def test_supports_podmonitor(self, handler):
-        resource = {
-            "kind": "PodMonitor",
-            "apiVersion": "monitoring.coreos.com/v1",
-            "metadata": {"name": "pm1"},
-        }
-        assert handler.supports(resource)
+class TestPrometheusHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
+        return PrometheusHandler(mock_client)
 
-    @pytest.mark.asyncio
     async def test_discover_servicemonitor_services(self, handler, mock_client):
-        servicemonitor = {
-            "kind": "ServiceMonitor",
-            "apiVersion": "monitoring.coreos.com/v1",
-            "metadata": {"name": "sm1", "namespace": "default"},
-            "spec": {"selector": {"matchLabels": {"app": "myapp"}}},
-        }
-
         mock_client.list_resources.return_value = (
             [
                 {
@@ -512,193 +690,153 @@ class TestPrometheusHandler:
             {},
         )
 
-        relationships = await handler.discover(servicemonitor)
+        relationships = await handler.discover(_SERVICE_MONITOR)
         assert len(relationships) > 0
         assert any(
             r.relationship_type == RelationshipType.PROMETHEUS_MONITOR for r in relationships
         )
 
+    async def test_discover_podmonitor_pods(self, handler, mock_client):
+        mock_client.list_resources.return_value = (
+            [{"kind": "Pod", "metadata": {"name": "myapp-pod", "namespace": "default"}}],
+            {},
+        )
 
-class TestKEDAHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
+        relationships = await handler.discover(_POD_MONITOR)
+        assert [(r.target.kind, r.target.name) for r in relationships] == [("Pod", "myapp-pod")]
+        mock_client.list_resources.assert_awaited_once_with(
+            kind="Pod", namespace="default", label_selector="app=myapp"
+        )
 
-    @pytest.fixture
-    def handler(self, mock_client):
-        return KEDAHandler(mock_client)
+    async def test_discover_streams_from_paginated_client(self):
+        class PagedClient:
+            def __init__(self):
+                self.calls = []
 
-    def test_supports_scaledobject(self, handler):
-        resource = {
-            "kind": "ScaledObject",
-            "apiVersion": "keda.sh/v1alpha1",
-            "metadata": {"name": "so1"},
-        }
-        assert handler.supports(resource)
+            async def list_resources(self, kind, namespace=None, label_selector=None):
+                raise AssertionError("list_resources should not be used")
 
-    @pytest.mark.asyncio
-    async def test_discover_scaledobject_target(self, handler, mock_client):
-        scaledobject = {
-            "kind": "ScaledObject",
-            "apiVersion": "keda.sh/v1alpha1",
-            "metadata": {"name": "so1", "namespace": "default"},
-            "spec": {"scaleTargetRef": {"kind": "Deployment", "name": "myapp"}, "triggers": []},
-        }
+            async def iter_resources(self, kind, namespace=None, label_selector=None):
+                self.calls.append((kind, namespace, label_selector))
+                for name in ("svc-a", "svc-b"):
+                    yield {"kind": "Service", "metadata": {"name": name, "namespace": namespace}}
 
-        mock_client.get_resource.return_value = {
-            "kind": "Deployment",
-            "metadata": {"name": "myapp", "namespace": "default"},
-        }
+        client = PagedClient()
+        handler = PrometheusHandler(client)
+        relationships = await handler.discover(_SERVICE_MONITOR)
+        assert [r.target.name for r in relationships] == ["svc-a", "svc-b"]
+        assert client.calls == [("Service", "default", "app=myapp")]
 
-        relationships = await handler.discover(scaledobject)
-        assert len(relationships) > 0
-        assert any(r.relationship_type == RelationshipType.KEDA_SCALE for r in relationships)
 
+class TestKEDAHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
+        return KEDAHandler(mock_client)
 
-class TestVeleroHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
+    async def test_discover_scaledobject_target(self, handler, mock_client):
+        mock_client.get_resource = ready(
+            {
+                "kind": "Deployment",
+                "metadata": {"name": "myapp", "namespace": "default"},
+            }
+        )
 
-    @pytest.fixture
-    def handler(self, mock_client):
-        return VeleroHandler(mock_client)
+        relationships = await handler.discover(_SCALED_OBJECT)
+        assert len(relationships) > 0
+        assert any(r.relationship_type == RelationshipType.KEDA_SCALE for r in relationships)
 
-    def test_supports_backup(self, handler):
-        resource = {
-            "kind": "Backup",
-            "apiVersion": "velero.io/v1",
-            "metadata": {"name": "backup1"},
-        }
-        assert handler.supports(resource)
 
-    def test_supports_schedule(self, handler):
-        resource = {
-            "kind": "Schedule",
-            "apiVersion": "velero.io/v1",
-            "metadata": {"name": "schedule1"},
-        }
-        assert handler.supports(resource)
+class TestVeleroHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
+        return VeleroHandler(mock_client)
 
-    @pytest.mark.asyncio
     async def test_discover_backup_namespaces(self, handler, mock_client):
-        backup = {
-            "kind": "Backup",
-            "apiVersion": "velero.io/v1",
-            "metadata": {"name": "backup1", "namespace": "velero"},
-            "spec": {"includedNamespaces": ["default", "production"]},
-        }
-
-        relationships = await handler.discover(backup)
+        relationships = await handler.discover(_VELERO_BACKUP)
         assert len(relationships) >= 2
         assert any(r.relationship_type == RelationshipType.VELERO_BACKUP for r in relationships)
 
+    async def test_discover_restores_share_backup_lookup(self, handler, mock_client):
+        mock_client.get_resource.return_value = {
+            "kind": "Backup",
+            "metadata": {"name": "nightly", "namespace": "velero"},
+        }
+        restores = [
+            {
+                "kind": "Restore",
+                "apiVersion": "velero.io/v1",
+                "metadata": {"name": f"restore-{i}", "namespace": "velero"},
+                "spec": {"backupName": "nightly"},
+            }
+            for i in range(3)
+        ]
 
-class TestSparkHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
+        results = await asyncio.gather(*(handler.discover(r) for r in restores))
 
-    @pytest.fixture
-    def handler(self, mock_client):
-        return SparkHandler(mock_client)
+        assert all(rels[0].target.name == "nightly" for rels in results)
+        mock_client.get_resource.assert_awaited_once()
 
-    def test_supports_sparkapplication(self, handler):
-        resource = {
-            "kind": "SparkApplication",
-            "apiVersion": "sparkoperator.k8s.io/v1beta2",
-            "metadata": {"name": "spark1"},
-        }
-        assert handler.supports(resource)
 
-    @pytest.mark.asyncio
+class TestSparkHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
+        return SparkHandler(mock_client)
+
     async def test_discover_spark_pods(self, handler, mock_client):
-        sparkapplication = {
-            "kind": "SparkApplication",
-            "apiVersion": "sparkoperator.k8s.io/v1beta2",
-            "metadata": {"name": "spark1", "namespace": "default"},
-            "spec": {"volumes": []},
+        def pod(role, name):
+            labels = {"spark-role": role, "sparkoperator.k8s.io/app-name": "spark1"}
+            metadata = {"name": name, "namespace": "default", "labels": labels}
+            return {"kind": "Pod", "metadata": metadata}
+
+        pods_by_role = {
+            "driver": [pod("driver", "spark1-driver")],
+            "executor": [pod("executor", "spark1-executor-1")],
         }
 
-        mock_client.list_resources.side_effect = [
-            (
-                [
-                    {
-                        "kind": "Pod",
-                        "metadata": {
-                            "name": "spark1-driver",
-                            "namespace": "default",
-                            "labels": {
-                                "spark-role": "driver",
-                                "sparkoperator.k8s.io/app-name": "spark1",
-                            },
-                        },
-                    }
-                ],
-                {},
-            ),
-            (
-                [
-                    {
-                        "kind": "Pod",
-                        "metadata": {
-                            "name": "spark1-executor-1",
-                            "namespace": "default",
-                            "labels": {
-                                "spark-role": "executor",
-                                "sparkoperator.k8s.io/app-name": "spark1",
-                            },
-                        },
-                    }
-                ],
-                {},
-            ),
-        ]
+        # Answer by selector, so the test doesn't depend on which list call runs first
+        async def list_resources(kind, namespace=None, label_selector=None):
+            role = "driver" if "spark-role=driver" in label_selector else "executor"
+            return pods_by_role[role], {}
 
-        relationships = await handler.discover(sparkapplication)
-        assert len(relationships) >= 2
-        assert any(r.relationship_type == RelationshipType.SPARK_DRIVER for r in relationships)
-        assert any(r.relationship_type == RelationshipType.SPARK_EXECUTOR for r in relationships)
+        mock_client.list_resources.side_effect = list_resources
 
+        relationships = await handler.discover(_SPARK_APPLICATION)
+        assert mock_client.list_resources.await_count == 2
+        assert [(r.relationship_type, r.target.name) for r in relationships] == [
+            (RelationshipType.SPARK_DRIVER, "spark1-driver"),
+            (RelationshipType.SPARK_EXECUTOR, "spark1-executor-1"),
+        ]
 
-class TestCrossplaneHandler:
-    @pytest.fixture
-    def mock_client(self):
-        return AsyncMock()
 
-    @pytest.fixture
-    def handler(self, mock_client):
+class TestCrossplaneHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler(mock_client):
         return CrossplaneHandler(mock_client)
 
-    def test_supports_composition(self, handler):
-        resource = {
-            "kind": "Composition",
-            "apiVersion": "apiextensions.crossplane.io/v1",
-            "metadata": {"name": "comp1"},
-        }
-        assert handler.supports(resource)
-
-    def test_supports_resource_with_crossplane_annotation(self, handler):
-        resource = {
-            "kind": "Deployment",
-            "apiVersion": "apps/v1",
-            "metadata": {
-                "name": "myapp",
-                "annotations": {"crossplane.io/claim-name": "claim1"},
-            },
-        }
-        assert handler.supports(resource)
-
-    @pytest.mark.asyncio
     async def test_discover_crossplane_managed_resources(self, handler, mock_client):
-        composition = {
-            "kind": "Composition",
-            "apiVersion": "apiextensions.crossplane.io/v1",
-            "metadata": {"name": "comp1", "namespace": "default"},
-            "spec": {},
-        }
-
         mock_client.list_resources.return_value = ([], {})
 
-        relationships = await handler.discover(composition)
+        relationships = await handler.discover(_CROSSPLANE_COMPOSITION)
         assert isinstance(relationships, list)
+
+
+class TestTemporalHandler(_HandlerTests):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def handler():
+        return TemporalHandler()
+
+    def test_parse_temporal_host_with_namespace_and_port(self, handler):
+        assert handler._parse_temporal_host(
+            "temporal-frontend.temporal-main.svc:7233", "default"
+        ) == ("temporal-frontend", "temporal-main")
+
+    def test_parse_temporal_host_without_namespace(self, handler):
+        assert handler._parse_temporal_host("temporal-frontend:7233", "default") == (
+            "temporal-frontend",
+            "default",
+        )
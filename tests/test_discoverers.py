@@ -1,11 +1,19 @@
 """Tests for discoverers."""
 
+import asyncio
+import inspect
+import sys
+from unittest.mock import AsyncMock
+
 import pytest
 
-from k8s_graph.discoverers.native import NativeResourceDiscoverer
+from k8s_graph.discoverers.base import BaseDiscoverer
+from k8s_graph.discoverers.native import _ASYNC_KINDS, NativeResourceDiscoverer
 from k8s_graph.discoverers.network import NetworkPolicyDiscoverer
 from k8s_graph.discoverers.rbac import RBACDiscoverer
-from k8s_graph.models import RelationshipType
+from k8s_graph.discoverers.registry import DiscovererRegistry
+from k8s_graph.discoverers.unified import UnifiedDiscoverer
+from k8s_graph.models import RelationshipType, ResourceIdentifier, ResourceRelationship
 
 
 @pytest.mark.asyncio
@@ -18,6 +26,60 @@ async def test_native_discoverer_supports():
     assert discoverer.supports({"kind": "CustomResource"}) is True
 
 
+def test_native_dispatch_async_kinds_match_coroutines():
+    """Every coroutine handler in the kind dispatch table is awaited by discover()."""
+    discoverer = NativeResourceDiscoverer()
+
+    coroutine_kinds = {
+        kind
+        for kind, handler in discoverer._discover_by_kind.items()
+        if inspect.iscoroutinefunction(handler)
+    }
+
+    assert coroutine_kinds == _ASYNC_KINDS
+
+
+def test_relationship_factory_matches_validated_models():
+    """_relationship() builds the same (equal, hashable) models as the validated path."""
+    source = ResourceIdentifier(kind="Pod", name="web", namespace="default")
+
+    fast = NativeResourceDiscoverer()._relationship(
+        source, "ConfigMap", "app-config", "default", RelationshipType.VOLUME, "Mounts ConfigMap"
+    )
+    validated = ResourceRelationship(
+        source=source,
+        target=ResourceIdentifier(kind="ConfigMap", name="app-config", namespace="default"),
+        relationship_type=RelationshipType.VOLUME,
+        details="Mounts ConfigMap",
+    )
+
+    assert fast == validated
+    assert hash(fast.target) == hash(validated.target)
+
+
+def test_relationship_factory_validates_and_interns_targets():
+    """Targets built by _relationship() are checked and interned like validated ones."""
+    source = ResourceIdentifier(kind="HorizontalPodAutoscaler", name="web", namespace="default")
+    discoverer = NativeResourceDiscoverer()
+
+    rel = discoverer._relationship(
+        source,
+        "".join(["Deploy", "ment"]),
+        "web",
+        "".join(["def", "ault"]),
+        RelationshipType.AUTOSCALING,
+    )
+    assert rel.target.kind is sys.intern("Deployment")
+    assert rel.target.namespace is sys.intern("default")
+
+    with pytest.raises(ValueError):
+        discoverer._relationship(
+            source, "deployment", "web", "default", RelationshipType.AUTOSCALING
+        )
+    with pytest.raises(ValueError):
+        discoverer._relationship(source, "Deployment", "", "default", RelationshipType.AUTOSCALING)
+
+
 @pytest.mark.asyncio
 async def test_native_discover_owner_references(sample_pod):
     """Test discovering owner references (parent → child direction)."""
@@ -32,6 +94,25 @@ async def test_native_discover_owner_references(sample_pod):
     assert owner_rels[0].target.kind == "Pod"  # Child is target
 
 
+@pytest.mark.asyncio
+async def test_native_discover_multiple_owner_references(sample_pod):
+    """Every complete ownerReference yields an edge; incomplete ones are skipped."""
+    sample_pod["metadata"]["ownerReferences"] = [
+        {"kind": "ReplicaSet", "name": "rs-a"},
+        {"kind": "Node", "name": ""},
+        {"kind": "Job", "name": "job-b"},
+    ]
+    discoverer = NativeResourceDiscoverer()
+    relationships = await discoverer.discover(sample_pod)
+
+    owners = [
+        (r.source.kind, r.source.name)
+        for r in relationships
+        if r.relationship_type == RelationshipType.OWNED
+    ]
+    assert owners == [("ReplicaSet", "rs-a"), ("Job", "job-b")]
+
+
 @pytest.mark.asyncio
 async def test_native_discover_service_selector(sample_service):
     """Test discovering service label selector."""
@@ -75,6 +156,170 @@ async def test_native_discover_pod_env(sample_pod):
     assert len(env_rels) >= 1
 
 
+@pytest.mark.asyncio
+async def test_native_discover_pod_dedupes_shared_references(sample_pod):
+    """Containers sharing a ConfigMap via envFrom yield a single ENV_FROM edge."""
+    env_from = [{"configMapRef": {"name": "shared-config"}}]
+    sample_pod["spec"]["containers"] = [
+        {"name": "app", "envFrom": env_from},
+        {"name": "sidecar", "envFrom": env_from},
+    ]
+    discoverer = NativeResourceDiscoverer()
+
+    relationships = await discoverer.discover(sample_pod)
+
+    env_from_rels = [r for r in relationships if r.relationship_type == RelationshipType.ENV_FROM]
+    assert [r.target.name for r in env_from_rels] == ["shared-config"]
+    assert "'app'" in env_from_rels[0].details
+
+
+@pytest.mark.asyncio
+async def test_native_discover_pod_tolerates_null_fields(sample_pod):
+    """Explicit nulls in the pod spec are treated like absent fields."""
+    sample_pod["spec"]["initContainers"] = None
+    sample_pod["spec"]["containers"][0]["env"] = [{"name": "PLAIN", "valueFrom": None}]
+    discoverer = NativeResourceDiscoverer()
+
+    relationships = await discoverer.discover(sample_pod)
+
+    assert not [r for r in relationships if r.relationship_type == RelationshipType.ENV_VAR]
+
+
+@pytest.mark.asyncio
+async def test_native_discover_workload_uses_selector(sample_deployment):
+    """Test that owned ReplicaSets are listed with the Deployment's selector."""
+    client = AsyncMock()
+    client.list_resources.return_value = (
+        [
+            {
+                "kind": "ReplicaSet",
+                "metadata": {
+                    "name": "nginx-deployment-abc123",
+                    "namespace": "default",
+                    "ownerReferences": [{"kind": "Deployment", "name": "nginx-deployment"}],
+                },
+            },
+            {
+                "kind": "ReplicaSet",
+                "metadata": {
+                    "name": "other-def456",
+                    "namespace": "default",
+                    "ownerReferences": [{"kind": "Deployment", "name": "other"}],
+                },
+            },
+        ],
+        {},
+    )
+
+    discoverer = NativeResourceDiscoverer(client)
+    relationships = await discoverer.discover(sample_deployment)
+
+    client.list_resources.assert_awaited_once_with(
+        kind="ReplicaSet", namespace="default", label_selector="app=nginx"
+    )
+    owned = [r.target.name for r in relationships if r.relationship_type == RelationshipType.OWNED]
+    assert owned == ["nginx-deployment-abc123"]
+
+
+@pytest.mark.asyncio
+async def test_native_discover_workload_streams_from_paginated_client(sample_deployment):
+    """Owned children are streamed through iter_resources() when the client has it."""
+
+    class PagedClient:
+        def __init__(self):
+            self.calls = []
+
+        async def list_resources(self, kind, namespace=None, label_selector=None):
+            raise AssertionError("list_resources should not be used")
+
+        async def iter_resources(self, kind, namespace=None, label_selector=None):
+            self.calls.append((kind, namespace, label_selector))
+            for name, owner in (("nginx-deployment-abc123", "nginx-deployment"), ("x", "other")):
+                yield {
+                    "kind": kind,
+                    "metadata": {
+                        "name": name,
+                        "namespace": namespace,
+                        "ownerReferences": [{"kind": "Deployment", "name": owner}],
+                    },
+                }
+
+    client = PagedClient()
+    discoverer = NativeResourceDiscoverer(client)
+    relationships = await discoverer.discover(sample_deployment)
+
+    owned = [r.target.name for r in relationships if r.relationship_type == RelationshipType.OWNED]
+    assert owned == ["nginx-deployment-abc123"]
+    assert client.calls == [("ReplicaSet", "default", "app=nginx")]
+
+
+@pytest.mark.asyncio
+async def test_unified_discover_many_bounds_concurrency(sample_pod, sample_service):
+    """discover_many keeps input order and never exceeds max_concurrency."""
+
+    class SlowDiscoverer(BaseDiscoverer):
+        def __init__(self):
+            super().__init__()
+            self.active = 0
+            self.peak = 0
+
+        def supports(self, resource):
+            return True
+
+        async def discover(self, resource):
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            await asyncio.sleep(0.001)
+            self.active -= 1
+            return []
+
+    slow = SlowDiscoverer()
+    registry = DiscovererRegistry()
+    registry.register(slow)
+    registry.register(NativeResourceDiscoverer())
+    unified = UnifiedDiscoverer(AsyncMock(), registry, max_concurrency=2)
+
+    batches = await unified.discover_many([sample_pod, sample_service] * 3)
+
+    assert len(batches) == 6
+    assert any(r.relationship_type == RelationshipType.OWNED for r in batches[0])
+    assert any(r.relationship_type == RelationshipType.LABEL_SELECTOR for r in batches[1])
+    assert slow.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_unified_prefers_discover_sync(sample_pod, sample_deployment):
+    """A discover_sync() answer is used without awaiting discover()."""
+
+    class SyncDiscoverer(BaseDiscoverer):
+        def __init__(self):
+            super().__init__()
+            self.awaited = 0
+
+        def supports(self, resource):
+            return True
+
+        async def discover(self, resource):
+            self.awaited += 1
+            return []
+
+        def discover_sync(self, resource):
+            return []
+
+    sync = SyncDiscoverer()
+    registry = DiscovererRegistry()
+    registry.register(sync)
+    registry.register(NativeResourceDiscoverer())
+    unified = UnifiedDiscoverer(AsyncMock(), registry)
+
+    relationships = await unified.discover_all_relationships(sample_pod)
+
+    assert any(r.relationship_type == RelationshipType.OWNED for r in relationships)
+    assert sync.awaited == 0
+    assert unified.get_discovery_stats()["discoveries"] == 2
+    assert NativeResourceDiscoverer().discover_sync(sample_deployment) is None
+
+
 @pytest.mark.asyncio
 async def test_native_discover_ingress(sample_ingress):
     """Test discovering ingress backends."""
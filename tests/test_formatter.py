@@ -1,10 +1,13 @@
 """Tests for k8s_graph.formatter."""
 
+import io
 import json
+from datetime import datetime
 
 import networkx as nx
 
-from k8s_graph.formatter import format_graph_output
+from k8s_graph import formatter
+from k8s_graph.formatter import export_to_dot, format_graph_output, format_graph_output_stream
 
 
 def test_format_json():
@@ -31,6 +34,31 @@ def test_format_json():
     assert data["metadata"]["edge_count"] == 1
 
 
+def test_format_json_serializer_fallback(monkeypatch):
+    """orjson and the stdlib fallback produce the same document."""
+    created = datetime(2024, 1, 2, 3, 4, 5)
+    graph = nx.DiGraph()
+    graph.add_node(
+        "Pod:default:café",
+        kind="Pod",
+        name="café",
+        created=created,
+        scores=[float("nan"), 1.5],
+        limits={"cpu": float("inf")},
+    )
+
+    output = format_graph_output(graph, format_type="json")
+    monkeypatch.setattr(formatter, "_has_orjson", False)
+    fallback = format_graph_output(graph, format_type="json")
+
+    assert output == fallback
+    assert "café" in fallback
+    node = json.loads(fallback)["nodes"][0]
+    assert node["created"] == str(created)
+    assert node["scores"] == [None, 1.5]
+    assert node["limits"] == {"cpu": None}
+
+
 def test_format_json_without_metadata():
     """Test JSON format without metadata."""
     graph = nx.DiGraph()
@@ -89,6 +117,19 @@ def test_format_llm_friendly():
     assert "label_selector" in output
 
 
+def test_format_llm_stream_matches_string():
+    """Streaming the LLM format writes the same text format_graph_output returns."""
+    graph = nx.DiGraph()
+    graph.add_node("Pod:default:nginx", kind="Pod", name="nginx", namespace="default")
+    graph.add_node("Service:default:web", kind="Service", name="web", namespace="default")
+    graph.add_edge("Service:default:web", "Pod:default:nginx", relationship_type="label_selector")
+
+    sink = io.StringIO()
+    format_graph_output_stream(graph, sink)
+
+    assert sink.getvalue() == format_graph_output(graph, format_type="llm")
+
+
 def test_format_llm_with_pod_sampling():
     """Test LLM format with pod sampling info."""
     graph = nx.DiGraph()
@@ -134,3 +175,48 @@ def test_format_unknown_type():
 
     with pytest.raises(ValueError, match="Unknown format type"):
         format_graph_output(graph, format_type="unknown")
+
+
+def test_export_to_dot_streams_styled_nodes_and_edges(tmp_path):
+    """Test streamed DOT export."""
+    graph = nx.DiGraph()
+    graph.add_node("Pod:default:nginx", kind="Pod", name="nginx", namespace="default")
+    graph.add_node("Service:default:web", kind="Service", name="web", namespace="default")
+    graph.add_edge("Service:default:web", "Pod:default:nginx", relationship_type="label_selector")
+
+    output_file = tmp_path / "cluster.dot"
+    export_to_dot(graph, str(output_file))
+
+    lines = output_file.read_text().splitlines()
+    assert lines[0] == "digraph {"
+    assert lines[-1] == "}"
+    assert (
+        '  "Pod:default:nginx" [label="Pod\\nnginx", shape=box, style=filled, '
+        'fillcolor="#90EE90"];' in lines
+    )
+    assert '  "Service:default:web" -> "Pod:default:nginx" [label="label_selector"];' in lines
+
+
+def test_format_dot_matches_export(tmp_path):
+    """format_type='dot' returns the text export_to_dot() writes."""
+    graph = nx.DiGraph()
+    graph.add_node("Pod:default:nginx", kind="Pod", name="nginx", namespace="default")
+    graph.add_node('ConfigMap:default:say "hi"', kind="ConfigMap", name='say "hi"')
+    graph.add_edge("Pod:default:nginx", 'ConfigMap:default:say "hi"', relationship_type="volume")
+
+    output_file = tmp_path / "cluster.dot"
+    export_to_dot(graph, str(output_file))
+    output = format_graph_output(graph, format_type="dot")
+
+    assert output == output_file.read_text()
+    assert '  "Pod:default:nginx" -> "ConfigMap:default:say \\"hi\\"" [label="volume"];' in output
+
+
+def test_export_to_dot_escapes_backslashes():
+    """Backslashes in ids and names are escaped; the label's line break is kept."""
+    graph = nx.DiGraph()
+    graph.add_node("Secret:default:a\\", kind="Secret", name="a\\")
+
+    output = format_graph_output(graph, format_type="dot")
+
+    assert '  "Secret:default:a\\\\" [label="Secret\\na\\\\", ' in output
@@ -0,0 +1,120 @@
+"""Tests for the discoverer LIST cache."""
+
+import asyncio
+
+import pytest
+
+from k8s_graph.discoverers._list_cache import ListCache, OwnerIndex
+from k8s_graph.models import ResourceIdentifier
+from tests.conftest import MockK8sClient
+
+
+def _pod(name: str) -> dict:
+    return {"kind": "Pod", "metadata": {"name": name, "namespace": "default"}}
+
+
+@pytest.mark.asyncio
+async def test_list_cache_reuses_result():
+    """Repeated queries for the same key hit the client once."""
+    client = MockK8sClient()
+    client.add_resource(_pod("a"))
+    cache = ListCache(client)
+
+    first = await cache.list("Pod", namespace="default")
+    second = await cache.list("Pod", namespace="default")
+
+    assert [p["metadata"]["name"] for p in first] == ["a"]
+    assert second is first
+    assert client.get_api_call_stats()["list_resources"] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_cache_coalesces_concurrent_requests():
+    """Concurrent callers share a single in-flight LIST."""
+    client = MockK8sClient()
+    client.add_resource(_pod("a"))
+    cache = ListCache(client)
+
+    results = await asyncio.gather(*(cache.list("Pod", namespace="default") for _ in range(5)))
+
+    assert all(r is results[0] for r in results)
+    assert client.get_api_call_stats()["list_resources"] == 1
+
+
+@pytest.mark.asyncio
+async def test_list_cache_expires_after_ttl():
+    """Entries older than the TTL are fetched again."""
+    client = MockK8sClient()
+    cache = ListCache(client, ttl=0)
+
+    await cache.list("Pod", namespace="default")
+    await asyncio.sleep(0.001)
+    await cache.list("Pod", namespace="default")
+
+    assert client.get_api_call_stats()["list_resources"] == 2
+
+
+def test_owner_index_groups_children_by_owner():
+    """Children are indexed under every distinct owner they reference."""
+    job_pod = _pod("job-pod")
+    job_pod["metadata"]["ownerReferences"] = [
+        {"kind": "Job", "name": "backup"},
+        {"kind": "Job", "name": "backup"},
+    ]
+    rs_pod = _pod("rs-pod")
+    rs_pod["metadata"]["ownerReferences"] = [{"kind": "ReplicaSet", "name": "web-abc"}]
+
+    index = OwnerIndex([job_pod, rs_pod, _pod("orphan")])
+
+    assert index.children("Job", "backup") == [job_pod]
+    assert index.children("ReplicaSet", "web-abc") == [rs_pod]
+    assert index.children("Job", "missing") == []
+
+
+@pytest.mark.asyncio
+async def test_owner_index_reused_until_list_refetched():
+    """owner_index() builds one index per cached LIST result."""
+    client = MockK8sClient()
+    cache = ListCache(client)
+
+    first = await cache.owner_index("Pod", namespace="default")
+    second = await cache.owner_index("Pod", namespace="default")
+    cache.clear()
+    third = await cache.owner_index("Pod", namespace="default")
+
+    assert second is first
+    assert third is not first
+
+
+@pytest.mark.asyncio
+async def test_list_cache_evicts_expired_entries_on_insert():
+    """Storing a result drops expired ones, including their owner indexes."""
+    client = MockK8sClient()
+    cache = ListCache(client, ttl=0)
+
+    await cache.owner_index("Pod", namespace="default")
+    await cache.get(ResourceIdentifier(kind="Pod", name="a", namespace="default"))
+    await asyncio.sleep(0.001)
+    await cache.list("Service", namespace="default")
+
+    assert list(cache._entries) == [("Service", "default", None)]
+    assert cache._owner_indexes == {}
+    assert cache._resources == {}
+
+
+@pytest.mark.asyncio
+async def test_list_cache_get_coalesces_and_caches_missing():
+    """Concurrent GETs share one call, and "not found" is remembered too."""
+    client = MockK8sClient()
+    client.add_resource(_pod("a"))
+    cache = ListCache(client)
+    pod_a = ResourceIdentifier(kind="Pod", name="a", namespace="default")
+    pod_b = ResourceIdentifier(kind="Pod", name="b", namespace="default")
+
+    found = await asyncio.gather(*(cache.get(pod_a) for _ in range(5)))
+    missing = [await cache.get(pod_b), await cache.get(pod_b)]
+
+    assert all(r is found[0] for r in found)
+    assert found[0]["metadata"]["name"] == "a"
+    assert missing == [None, None]
+    assert client.get_api_call_stats()["get_resource"] == 2
@@ -40,6 +40,15 @@ def test_resource_identifier_immutable():
         rid.kind = "Service"
 
 
+def test_resource_identifier_hashable():
+    """Test that equal ResourceIdentifiers collapse in sets and dict keys."""
+    a = ResourceIdentifier(kind="Pod", name="nginx", namespace="default")
+    b = ResourceIdentifier(kind="Pod", name="nginx", namespace="default")
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+    assert {a: 1}[b] == 1
+
+
 def test_resource_identifier_str():
     """Test ResourceIdentifier string representation."""
     rid = ResourceIdentifier(kind="Pod", name="nginx", namespace="default")
@@ -1,6 +1,8 @@
 """Tests for k8s_graph.node_identity."""
 
-from k8s_graph.node_identity import NodeIdentity
+import sys
+
+from k8s_graph.node_identity import NodeIdentity, make_node_id
 
 
 def test_node_identity_standard_resource(sample_deployment):
@@ -57,3 +59,23 @@ def test_get_pod_template_id_non_pod(sample_deployment):
     identity = NodeIdentity()
     template_id = identity.get_pod_template_id(sample_deployment)
     assert template_id is None
+
+
+def test_node_identity_interns_shared_strings(sample_deployment):
+    """Node ids and repeated attributes share one string object per value."""
+    identity = NodeIdentity()
+    node_id = identity.get_node_id(sample_deployment)
+    attrs = identity.extract_node_attributes(sample_deployment)
+
+    assert node_id is sys.intern("Deployment:default:nginx-deployment")
+    assert attrs["kind"] is sys.intern("Deployment")
+    assert attrs["namespace"] is sys.intern("default")
+
+
+def test_make_node_id_reuses_string():
+    """Repeated ids for the same resource are the same string object."""
+    node_id = make_node_id("Service", "default", "web")
+
+    assert node_id == "Service:default:web"
+    assert make_node_id("Service", "default", "web") is node_id
+    assert node_id is sys.intern("Service:default:web")
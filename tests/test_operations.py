@@ -8,6 +8,7 @@ from k8s_graph.operations import (
     filter_by_kind,
     filter_by_relationship,
     get_largest_component,
+    get_namespace_view,
     merge_graphs,
     remove_isolated_nodes,
     split_by_namespace,
@@ -105,6 +106,17 @@ def test_extract_nonexistent_namespace(graph1):
     assert subgraph.number_of_nodes() == 0
 
 
+def test_get_namespace_view(graph1):
+    """Test viewing a namespace without copying it."""
+    graph1.add_node("Pod:other:api", kind="Pod", name="api", namespace="other")
+
+    view = get_namespace_view(graph1, "default")
+
+    assert set(view.nodes()) == {"Pod:default:nginx-1", "Service:default:web"}
+    assert view.has_edge("Service:default:web", "Pod:default:nginx-1")
+    assert view.nodes["Pod:default:nginx-1"] is graph1.nodes["Pod:default:nginx-1"]
+
+
 def test_diff_graphs(graph1, graph2):
     """Test graph diff."""
     diff = diff_graphs(graph1, graph2)
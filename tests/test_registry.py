@@ -102,3 +102,46 @@ def test_registry_clear(test_registry):
     discoverers = test_registry.get_discoverers_for_resource(resource)
 
     assert len(discoverers) == 0
+
+
+def test_registry_memoizes_supports_by_type(test_registry):
+    """supports() runs once per (kind, apiVersion) for supports_by_type discoverers."""
+
+    class CountingDiscoverer(MockDiscoverer):
+        supports_by_type = True
+
+        def __init__(self):
+            super().__init__(kind="Pod")
+            self.calls = 0
+
+        def supports(self, resource):
+            self.calls += 1
+            return super().supports(resource)
+
+    discoverer = CountingDiscoverer()
+    test_registry.register(discoverer)
+
+    for name in ("a", "b", "c"):
+        assert test_registry.get_discoverers_for_resource({"kind": "Pod", "name": name})
+    assert not test_registry.get_discoverers_for_resource({"kind": "Service"})
+
+    assert discoverer.calls == 2
+
+
+def test_registry_indexes_supported_kinds(test_registry):
+    """Discoverers declaring supported_kinds are never asked about other kinds."""
+
+    class PodOnlyDiscoverer(MockDiscoverer):
+        supported_kinds = frozenset({"Pod"})
+
+        def supports(self, resource):
+            assert resource.get("kind") == "Pod"
+            return True
+
+    pod_only = PodOnlyDiscoverer(test_priority=100)
+    generic = MockDiscoverer(test_priority=10)
+    test_registry.register(generic)
+    test_registry.register(pod_only)
+
+    assert test_registry.get_discoverers_for_resource({"kind": "Pod"}) == [pod_only, generic]
+    assert test_registry.get_discoverers_for_resource({"kind": "Service"}) == [generic]
@@ -2,6 +2,7 @@
 
 import networkx as nx
 
+from k8s_graph import validator
 from k8s_graph.validator import check_graph_cycles, get_graph_statistics, validate_graph
 
 
@@ -87,7 +88,7 @@ def test_check_graph_cycles():
     result = check_graph_cycles(graph)
 
     assert result["has_cycles"] is True
-    assert result["cycle_count"] > 0
+    assert result["listed_cycles"] > 0
 
 
 def test_get_graph_statistics():
@@ -105,3 +106,73 @@ def test_get_graph_statistics():
     assert stats["namespace_count"] == 1
     assert "Pod" in stats["resource_kinds"]
     assert "Service" in stats["resource_kinds"]
+
+
+def test_get_graph_statistics_reflects_edits():
+    """Statistics follow in-place attribute edits and same-size node swaps."""
+    graph = nx.DiGraph()
+    graph.add_node("Pod:default:nginx", kind="Pod", name="nginx", namespace="default")
+
+    first = get_graph_statistics(graph)
+    first["resource_kinds"]["Pod"] = 99
+    assert get_graph_statistics(graph)["resource_kinds"] == {"Pod": 1}
+
+    graph.nodes["Pod:default:nginx"]["kind"] = "Job"
+    assert get_graph_statistics(graph)["resource_kinds"] == {"Job": 1}
+
+    graph.remove_node("Pod:default:nginx")
+    graph.add_node("Service:prod:web", kind="Service", name="web", namespace="prod")
+    stats = get_graph_statistics(graph)
+    assert stats["resource_kinds"] == {"Service": 1}
+    assert stats["namespaces"] == {"prod": 1}
+
+
+def test_check_graph_cycles_bounded():
+    """Cycle listing stops at max_cycles; detection still reports every cyclic component."""
+    graph = nx.complete_graph(6, create_using=nx.DiGraph)
+    graph.add_edge("X", "X")
+
+    result = check_graph_cycles(graph, max_cycles=5)
+    assert result["has_cycles"] is True
+    assert result["listed_cycles"] == len(result["cycles"]) == 5
+    assert result["truncated"] is True
+    assert result["cyclic_components"] == 2
+
+    result = check_graph_cycles(graph, max_cycles=0)
+    assert result["has_cycles"] is True
+    assert result["truncated"] is True
+    assert result["cycles"] == []
+
+    result = check_graph_cycles(nx.cycle_graph(3, create_using=nx.DiGraph), max_cycles=1)
+    assert result["listed_cycles"] == 1
+    assert result["truncated"] is False
+
+
+def test_check_graph_cycles_networkx_fallback(monkeypatch):
+    """The networkx fallback finds the same cyclic components as rustworkx."""
+    graph = nx.DiGraph()
+    graph.add_edges_from([("a", "b"), ("b", "a"), ("b", "c"), ("d", "d")])
+
+    result = check_graph_cycles(graph)
+    monkeypatch.setattr(validator, "_has_rustworkx", False)
+    fallback = check_graph_cycles(graph)
+
+    assert result["cyclic_components"] == fallback["cyclic_components"] == 2
+    assert sorted(map(sorted, result["cycles"])) == sorted(map(sorted, fallback["cycles"]))
+
+
+def test_graph_statistics_degrees_match_networkx():
+    """Degree statistics agree with networkx's degree views, self-loops included."""
+    graph = nx.gnp_random_graph(30, 0.1, seed=7, directed=True)
+    graph.add_edge(0, 0)
+    graph.add_node("isolated")
+
+    stats = get_graph_statistics(graph)
+    degrees = [d for _, d in graph.degree()]
+
+    assert stats["average_degree"] == sum(degrees) / len(degrees)
+    assert stats["max_degree"] == max(degrees)
+    assert stats["min_degree"] == min(degrees) == 0
+    assert stats["max_in_degree"] == max(d for _, d in graph.in_degree())
+    assert stats["max_out_degree"] == max(d for _, d in graph.out_degree())
+    assert stats["average_in_degree"] == stats["average_out_degree"]
@@ -1,7 +1,23 @@
+import multiprocessing
+from pathlib import Path
+
 import networkx as nx
+import numpy as np
 import pytest
 
-from k8s_graph.visualization import get_shell_layout
+from k8s_graph import _fr_numba
+from k8s_graph.visualization import _get_layout, get_shell_layout
+
+
+@pytest.fixture(autouse=True)
+def layout_cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk layout caching inside the test's tmp dir."""
+    from k8s_graph import visualization
+
+    cache_dir = tmp_path / "layouts"
+    monkeypatch.setattr(visualization, "_LAYOUT_CACHE_DIR", cache_dir)
+    monkeypatch.setattr(visualization, "_LEGEND_CACHE_DIR", tmp_path / "legend")
+    return cache_dir
 
 
 @pytest.fixture
@@ -63,3 +79,182 @@ def test_get_shell_layout_hierarchy(sample_graph):
 
     if deployment_shell is not None and pod_shell is not None:
         assert deployment_shell < pod_shell
+
+
+def test_fr_spring_layout_pulls_neighbors_together():
+    """The F-R kernel is seeded, scaled to [-1, 1] and keeps edges short."""
+    graph = nx.DiGraph()
+    for ring in range(3):
+        nx.add_cycle(graph, [f"Pod:ns{ring}:p{i}" for i in range(8)])
+
+    pos = _fr_numba.spring_layout(graph, k=0.5, seed=7)
+    coords = np.array(list(pos.values()))
+
+    assert pos.keys() == set(graph)
+    assert np.abs(coords).max() == pytest.approx(1.0)
+    assert all(
+        np.allclose(pos[n], p) for n, p in _fr_numba.spring_layout(graph, k=0.5, seed=7).items()
+    )
+
+    edge_length = np.mean([np.linalg.norm(np.subtract(pos[u], pos[v])) for u, v in graph.edges()])
+    pair_length = np.mean(np.linalg.norm(coords[:, None] - coords[None, :], axis=-1))
+    assert edge_length < pair_length / 2
+
+
+def test_barnes_hut_layout_matches_exact_when_every_cell_is_opened():
+    """With theta=0 no cell is approximated, so BH reduces to the exact kernel."""
+    graph = nx.gnp_random_graph(60, 0.05, seed=3)
+    indptr, indices = _fr_numba._to_csr(graph, {node: i for i, node in enumerate(graph)})
+    start = np.random.default_rng(3).random((60, 2))
+
+    exact = start.copy()
+    _fr_numba.fr_layout(indptr, indices, exact, 20, 0.2, 0.1)
+    approx = start.copy()
+    _fr_numba.bh_layout(indptr, indices, approx, 20, 0.2, 0.1, 0.0, 3)
+
+    assert np.allclose(exact, approx, atol=1e-6)
+
+
+def test_spring_lbfgs_layout_pulls_neighbors_together():
+    """The L-BFGS layout is seeded, scaled to [-1, 1] and keeps edges short."""
+    pytest.importorskip("scipy")
+    graph = nx.DiGraph()
+    for ring in range(3):
+        nx.add_cycle(graph, [f"Pod:ns{ring}:p{i}" for i in range(8)])
+
+    pos = _get_layout(graph, "spring_lbfgs", k=0.5, seed=7)
+    coords = np.array(list(pos.values()))
+
+    assert pos.keys() == set(graph)
+    assert np.abs(coords).max() == pytest.approx(1.0)
+
+    edge_length = np.mean([np.linalg.norm(np.subtract(pos[u], pos[v])) for u, v in graph.edges()])
+    pair_length = np.mean(np.linalg.norm(coords[:, None] - coords[None, :], axis=-1))
+    assert edge_length < pair_length / 2
+
+
+def test_get_layout_reuses_positions_for_same_topology(sample_graph):
+    """A second layout of the same nodes, kinds, edges and arguments is a cache hit."""
+    from k8s_graph import visualization
+
+    sample_graph.add_edge("Deployment:default:nginx", "ReplicaSet:default:nginx-abc")
+    visualization._cached_layout.cache_clear()
+
+    first = _get_layout(sample_graph, "shell")
+    second = _get_layout(sample_graph.copy(), "shell")
+    assert visualization._cached_layout.cache_info().hits == 1
+    assert first.keys() == second.keys()
+    assert all(np.allclose(first[n], second[n]) for n in first)
+
+    _get_layout(sample_graph, "circular")
+    assert visualization._cached_layout.cache_info().misses == 2
+
+
+def test_dot_attrs_quotes_values():
+    """DOT attribute lists quote every value and escape embedded quotes and backslashes."""
+    from k8s_graph.visualization import _dot_attrs
+
+    assert _dot_attrs({"rankdir": "TB", "label": 'say "hi"'}) == (
+        'rankdir="TB", label="say \\"hi\\""'
+    )
+    assert _dot_attrs({"label": 'C:\\dir\\"'}) == 'label="C:\\\\dir\\\\\\""'
+
+
+def test_get_layout_loads_positions_from_disk(sample_graph, layout_cache_dir):
+    """Positions written by one run are loaded by the next, even in another node order."""
+    from k8s_graph import visualization
+
+    visualization._cached_layout.cache_clear()
+    first = _get_layout(sample_graph, "circular")
+    assert len(list(layout_cache_dir.glob("*.npz"))) == 1
+
+    visualization._cached_layout.cache_clear()
+    reordered = nx.DiGraph()
+    reordered.add_nodes_from(reversed(list(sample_graph.nodes(data=True))))
+    second = _get_layout(reordered, "circular")
+
+    assert second.keys() == first.keys()
+    assert all(np.allclose(first[n], second[n]) for n in first)
+
+
+def test_spectral_layout_uses_sparse_fiedler_vector():
+    """On a path the Fiedler vector orders the nodes along the x axis."""
+    pytest.importorskip("scipy")
+    graph = nx.path_graph([f"Pod:default:p{i}" for i in range(12)], create_using=nx.DiGraph)
+
+    pos = _get_layout(graph, "spectral")
+    xs = [pos[node][0] for node in graph]
+
+    assert pos.keys() == set(graph)
+    assert np.abs(np.array(list(pos.values()))).max() == pytest.approx(1.0)
+    assert xs == sorted(xs) or xs == sorted(xs, reverse=True)
+
+
+def test_spectral_layout_falls_back_without_scipy(monkeypatch):
+    """Without scipy the spectral layout comes from nx.spectral_layout."""
+    import sys
+
+    from k8s_graph.visualization import _compute_layout
+
+    monkeypatch.setitem(sys.modules, "scipy", None)
+    graph = nx.cycle_graph([f"Pod:default:p{i}" for i in range(6)], create_using=nx.DiGraph)
+
+    pos = _compute_layout(graph, "spectral")
+
+    assert pos.keys() == set(graph)
+
+
+def test_spring_lbfgs_layout_falls_back_without_scipy(monkeypatch):
+    """Without scipy the L-BFGS layout falls back to nx.spring_layout."""
+    import sys
+
+    from k8s_graph.visualization import _compute_layout
+
+    monkeypatch.setitem(sys.modules, "scipy", None)
+    graph = nx.cycle_graph([f"Pod:default:p{i}" for i in range(6)], create_using=nx.DiGraph)
+
+    pos = _compute_layout(graph, "spring_lbfgs", seed=7)
+
+    assert pos.keys() == set(graph)
+
+
+def test_get_layout_keeps_unseeded_random_layouts_off_disk(sample_graph, layout_cache_dir):
+    """Unseeded spring layouts are not pinned on disk; seeded ones are."""
+    from k8s_graph import visualization
+
+    visualization._cached_layout.cache_clear()
+    _get_layout(sample_graph, "spring")
+    assert not list(layout_cache_dir.glob("*.npz"))
+
+    _get_layout(sample_graph, "spring", seed=42)
+    assert len(list(layout_cache_dir.glob("*.npz"))) == 1
+
+
+def test_layout_disk_cache_is_bounded(layout_cache_dir, monkeypatch):
+    """Writing past _LAYOUT_CACHE_MAX_FILES drops the least recently used files."""
+    from k8s_graph import visualization
+
+    monkeypatch.setattr(visualization, "_LAYOUT_CACHE_MAX_FILES", 2)
+    visualization._cached_layout.cache_clear()
+    for n in range(3, 7):
+        _get_layout(nx.path_graph(n, create_using=nx.DiGraph), "circular")
+
+    assert len(list(layout_cache_dir.glob("*.npz"))) == 2
+
+
+@pytest.mark.parametrize("start_method", ["fork", "spawn"])
+def test_draw_all_views_writes_every_view(sample_graph, tmp_path, monkeypatch, start_method):
+    """Every view is rendered, in worker processes under fork and inline otherwise."""
+    pytest.importorskip("pygraphviz")
+    if start_method not in multiprocessing.get_all_start_methods():
+        pytest.skip(f"{start_method} start method unavailable")
+    from k8s_graph import visualization
+
+    context = multiprocessing.get_context(start_method)
+    monkeypatch.setattr(visualization.multiprocessing, "get_context", lambda: context)
+    sample_graph.add_edge("Deployment:default:nginx", "ReplicaSet:default:nginx-abc")
+
+    files = visualization.draw_all_views(sample_graph, str(tmp_path / "views"), format="svg")
+
+    assert sorted(Path(f).name for f in files) == ["circular.svg", "hierarchical.svg", "radial.svg"]
+    assert all(Path(f).stat().st_size > 0 for f in files)